@@ -4,4 +4,12 @@ from django.apps import AppConfig
 class BusinessesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'businesses'
-    verbose_name = 'Negocios'
\ No newline at end of file
+    verbose_name = 'Negocios'
+
+    def ready(self):
+        """
+        Import signals when the app is ready
+
+        This ensures signal handlers are registered at Django startup.
+        """
+        import businesses.signals  # noqa: F401
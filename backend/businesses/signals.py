@@ -0,0 +1,31 @@
+"""
+Django signals for business cache invalidation
+
+Bumps the shared cache versions of the business type taxonomy and of the
+business index (see event_taxonomy.cache) so ML workers rebuild their
+in-memory copies.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from event_taxonomy import cache as taxonomy_cache
+from .models import Business, BusinessType, BusinessTypeKeyword
+
+
+@receiver([post_save, post_delete], sender=BusinessType)
+@receiver([post_save, post_delete], sender=BusinessTypeKeyword)
+def invalidate_business_types(sender, instance, **kwargs):
+    """Invalidate the business type scorer (BusinessTypeScorer.get_shared)"""
+    transaction.on_commit(
+        lambda: taxonomy_cache.bump_version(taxonomy_cache.BUSINESS_TYPES)
+    )
+
+
+@receiver([post_save, post_delete], sender=Business)
+def invalidate_business_index(sender, instance, **kwargs):
+    """Invalidate the candidate business index (BusinessIndex.get_shared)"""
+    transaction.on_commit(
+        lambda: taxonomy_cache.bump_version(taxonomy_cache.BUSINESSES)
+    )
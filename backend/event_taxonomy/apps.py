@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class EventTaxonomyConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'event_taxonomy'
+
+    def ready(self):
+        """
+        Import signals when the app is ready
+
+        This ensures signal handlers are registered at Django startup.
+        """
+        import event_taxonomy.signals  # noqa: F401
@@ -0,0 +1,148 @@
+"""
+Shared taxonomy cache
+
+ML workers keep in-memory (compiled) copies of taxonomy data. Each dataset
+has a version counter in the shared cache (Redis, see CACHES) that signal
+handlers bump whenever the underlying rows change, so a worker only
+reloads when the version it holds is stale instead of polling the
+database on a timer.
+"""
+
+import time
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Dataset names
+EXTRACTION_PATTERNS = 'extraction_patterns'
+BROADCASTABILITY = 'broadcastability'  # SportType, CompetitionLevel, HypeIndicator, config
+BUSINESS_TYPES = 'business_types'  # businesses.BusinessType + BusinessTypeKeyword
+BUSINESSES = 'businesses'  # businesses.Business
+
+VERSION_KEY = 'event_taxonomy:{name}:version'
+SNAPSHOT_KEY = 'event_taxonomy:{name}:snapshot:{version}'
+SNAPSHOT_TIMEOUT = 60 * 60 * 24  # Old versions expire on their own
+
+
+def _initial_version() -> int:
+    """
+    Time-based starting version, so a flushed cache never hands out a
+    version number a worker already holds
+    """
+    return int(time.time() * 1000)
+
+
+def get_version(name: str) -> int:
+    """Current version of a dataset (initialized on first use)"""
+    key = VERSION_KEY.format(name=name)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(name: str) -> None:
+    """
+    Mark a dataset as changed (workers reload it on their next access)
+
+    Never raises: a cache outage must not break admin saves.
+    """
+    key = VERSION_KEY.format(name=name)
+    try:
+        try:
+            version = cache.incr(key)
+        except ValueError:
+            # Key missing (first bump or flushed cache)
+            version = _initial_version()
+            cache.set(key, version, timeout=None)
+        logger.info(f"Taxonomy cache '{name}' bumped to version {version}")
+    except Exception as e:
+        logger.error(f"Failed to bump taxonomy cache version for '{name}': {e}")
+
+
+def build_extraction_pattern_snapshot() -> List[Dict[str, Any]]:
+    """
+    Active extraction patterns as plain (picklable) dicts
+
+    Returns:
+        List of dicts with target, event_type and event_subtype codes,
+        pattern and weight
+    """
+    from .models import ExtractionPattern
+
+    return [
+        {
+            'target': pattern.target,
+            'event_type': pattern.event_type.code if pattern.event_type else None,
+            'event_subtype': pattern.event_subtype.code if pattern.event_subtype else None,
+            'pattern': pattern.pattern,
+            'weight': pattern.weight,
+        }
+        for pattern in ExtractionPattern.objects.filter(is_active=True)
+            .select_related('event_type', 'event_subtype')
+    ]
+
+
+def get_extraction_pattern_snapshot(version: int) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Extraction pattern snapshot for a version
+
+    The first worker to ask for a new version builds it from the database
+    and stores it; the others read it from the cache.
+
+    Returns:
+        (version, patterns) - see build_extraction_pattern_snapshot
+    """
+    key = SNAPSHOT_KEY.format(name=EXTRACTION_PATTERNS, version=version)
+    patterns = cache.get(key)
+    if patterns is None:
+        patterns = build_extraction_pattern_snapshot()
+        cache.set(key, patterns, timeout=SNAPSHOT_TIMEOUT)
+        logger.info(f"Built extraction pattern snapshot v{version} ({len(patterns)} patterns)")
+    return version, patterns
+
+
+class SharedInstanceMixin(ABC):
+    """
+    Process-wide instance kept in sync with a dataset version
+
+    Subclasses set CACHE_DATASET and implement reload(). get_shared()
+    builds the instance once per process and calls reload() whenever the
+    dataset version changes. If the cache is unreachable, the loaded
+    instance is kept.
+    """
+
+    CACHE_DATASET: str = None
+
+    # Process-wide instance (see get_shared)
+    _shared = None
+    _shared_version = None
+
+    @classmethod
+    def get_shared(cls):
+        """Shared instance, reloaded if its dataset changed (one cache read)"""
+        try:
+            version = get_version(cls.CACHE_DATASET)
+        except Exception as e:
+            logger.warning(
+                f"Cache version of '{cls.CACHE_DATASET}' unavailable ({e}), "
+                f"keeping loaded {cls.__name__}"
+            )
+            version = cls._shared_version
+
+        if cls._shared is None:
+            cls._shared = cls()
+        elif version != cls._shared_version:
+            cls._shared.reload()
+        cls._shared_version = version
+
+        return cls._shared
+
+    @abstractmethod
+    def reload(self):
+        """Reload the instance data from the database"""
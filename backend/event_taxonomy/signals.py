@@ -0,0 +1,48 @@
+"""
+Django signals for taxonomy cache invalidation
+
+Bumps the shared cache versions (see event_taxonomy.cache) when taxonomy
+rows change, so ML workers reload their copies on the next article.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from . import cache as taxonomy_cache
+from .models import (
+    EventType,
+    EventSubtype,
+    ExtractionPattern,
+    SportType,
+    CompetitionLevel,
+    HypeIndicator,
+    BroadcastabilityConfig
+)
+
+
+@receiver([post_save, post_delete], sender=ExtractionPattern)
+@receiver([post_save, post_delete], sender=EventType)
+@receiver([post_save, post_delete], sender=EventSubtype)
+def invalidate_extraction_patterns(sender, instance, **kwargs):
+    """
+    Invalidate the extraction pattern snapshot
+
+    EventType/EventSubtype changes count too: the snapshot stores their
+    codes. The bump waits for the transaction to commit so workers never
+    rebuild the snapshot from uncommitted data.
+    """
+    transaction.on_commit(
+        lambda: taxonomy_cache.bump_version(taxonomy_cache.EXTRACTION_PATTERNS)
+    )
+
+
+@receiver([post_save, post_delete], sender=SportType)
+@receiver([post_save, post_delete], sender=CompetitionLevel)
+@receiver([post_save, post_delete], sender=HypeIndicator)
+@receiver([post_save, post_delete], sender=BroadcastabilityConfig)
+def invalidate_broadcastability(sender, instance, **kwargs):
+    """Invalidate the broadcastability taxonomy (BroadcastabilityCalculator.get_shared)"""
+    transaction.on_commit(
+        lambda: taxonomy_cache.bump_version(taxonomy_cache.BROADCASTABILITY)
+    )
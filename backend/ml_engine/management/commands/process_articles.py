@@ -6,8 +6,10 @@ Usage:
     python manage.py process_articles --reprocess         # Reprocess all articles
     python manage.py process_articles --city Medellín     # Process only Medellín articles
     python manage.py process_articles --limit 10          # Process max 10 articles
+    python manage.py process_articles --batch-size 200    # spaCy nlp.pipe batch size
 """
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from news.models import NewsArticle
@@ -44,6 +46,18 @@ class Command(BaseCommand):
             action='store_true',
             help='Show detailed processing information',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.ML_NLP_BATCH_SIZE,
+            help=f'Articles parsed per spaCy nlp.pipe batch (default: {settings.ML_NLP_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--n-process',
+            type=int,
+            default=settings.ML_NLP_N_PROCESS,
+            help=f'spaCy worker processes for nlp.pipe (default: {settings.ML_NLP_N_PROCESS})',
+        )
 
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Starting ML article processing...'))
@@ -83,55 +97,25 @@ class Command(BaseCommand):
             'errors': 0
         }
 
-        # Process each article
+        # Process articles in batches (spaCy runs once per batch via nlp.pipe)
         start_time = timezone.now()
+        batch_size = options['batch_size']
+        total = articles.count()
+        batch = []
+        idx = 0
 
-        for idx, article in enumerate(articles, 1):
-            try:
-                if options['verbose']:
-                    self.stdout.write(f"\n[{idx}/{articles.count()}] Processing: {article.title[:60]}...")
-
-                result = orchestrator.process_article(article, save=True)
+        try:
+            for article in articles.iterator(chunk_size=batch_size):
+                batch.append(article)
+                if len(batch) >= batch_size:
+                    idx = self._process_batch(orchestrator, batch, idx, total, stats, options)
+                    batch = []
 
-                if result['success']:
-                    stats['processed'] += 1
+            if batch:
+                idx = self._process_batch(orchestrator, batch, idx, total, stats, options)
 
-                    if result['processed']:
-                        stats['suitable'] += 1
-                        stats['recommendations_created'] += result['recommendations_created']
-
-                        if options['verbose']:
-                            self.stdout.write(
-                                self.style.SUCCESS(
-                                    f"  ✓ Suitability: {result['suitability_score']:.2f}, "
-                                    f"Matches: {result['matching_businesses']}, "
-                                    f"Recommendations: {result['recommendations_created']}"
-                                )
-                            )
-                    else:
-                        stats['not_suitable'] += 1
-                        if options['verbose']:
-                            self.stdout.write(
-                                self.style.WARNING(f"  ⊘ {result.get('reason', 'Not suitable')}")
-                            )
-                else:
-                    stats['errors'] += 1
-                    self.stdout.write(
-                        self.style.ERROR(f"  ✗ Error: {result.get('error', 'Unknown error')}")
-                    )
-
-                # Progress indicator (every 20 articles)
-                if idx % 20 == 0 and not options['verbose']:
-                    self.stdout.write(f"Processed {idx}/{articles.count()}...")
-
-            except KeyboardInterrupt:
-                self.stdout.write(self.style.WARNING('\n\nProcessing interrupted by user'))
-                break
-            except Exception as e:
-                stats['errors'] += 1
-                self.stdout.write(
-                    self.style.ERROR(f"  ✗ Unexpected error: {str(e)}")
-                )
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('\n\nProcessing interrupted by user'))
 
         # Calculate processing time
         duration = (timezone.now() - start_time).total_seconds()
@@ -164,3 +148,57 @@ class Command(BaseCommand):
             self.stdout.write("  1. View recommendations in Django Admin")
             self.stdout.write("  2. Check Dashboard at http://localhost:3000")
             self.stdout.write("  3. Test API: /api/recommendations/")
+
+    def _process_batch(self, orchestrator, batch, idx, total, stats, options):
+        """Process one batch of articles and update stats; returns last index"""
+        try:
+            results = orchestrator.process_articles(
+                batch,
+                save=True,
+                batch_size=options['batch_size'],
+                n_process=options['n_process']
+            )
+        except Exception as e:
+            stats['errors'] += len(batch)
+            self.stdout.write(
+                self.style.ERROR(f"  ✗ Unexpected error: {str(e)}")
+            )
+            return idx + len(batch)
+
+        for article, result in zip(batch, results):
+            idx += 1
+            if options['verbose']:
+                self.stdout.write(f"\n[{idx}/{total}] Processing: {article.title[:60]}...")
+
+            if result['success']:
+                stats['processed'] += 1
+
+                if result['processed']:
+                    stats['suitable'] += 1
+                    stats['recommendations_created'] += result['recommendations_created']
+
+                    if options['verbose']:
+                        self.stdout.write(
+                            self.style.SUCCESS(
+                                f"  ✓ Suitability: {result['suitability_score']:.2f}, "
+                                f"Matches: {result['matching_businesses']}, "
+                                f"Recommendations: {result['recommendations_created']}"
+                            )
+                        )
+                else:
+                    stats['not_suitable'] += 1
+                    if options['verbose']:
+                        self.stdout.write(
+                            self.style.WARNING(f"  ⊘ {result.get('reason', 'Not suitable')}")
+                        )
+            else:
+                stats['errors'] += 1
+                self.stdout.write(
+                    self.style.ERROR(f"  ✗ Error: {result.get('error', 'Unknown error')}")
+                )
+
+            # Progress indicator (every 20 articles)
+            if idx % 20 == 0 and not options['verbose']:
+                self.stdout.write(f"Processed {idx}/{total}...")
+
+        return idx
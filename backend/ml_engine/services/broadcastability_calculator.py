@@ -22,10 +22,12 @@ import re
 import logging
 from typing import Dict, Optional, Tuple
 
+from event_taxonomy.cache import BROADCASTABILITY, SharedInstanceMixin
+
 logger = logging.getLogger(__name__)
 
 
-class BroadcastabilityCalculator:
+class BroadcastabilityCalculator(SharedInstanceMixin):
     """
     Calculates broadcastability scores for sports events
 
@@ -34,8 +36,14 @@ class BroadcastabilityCalculator:
     - Competition levels with broadcast multipliers
     - Hype indicator patterns
     - Configurable weights and thresholds
+
+    Use get_shared() on hot paths: one calculator is kept per process and
+    only reloaded when taxonomy edits bump its cache version.
     """
 
+    # Shared instance hot-reloads (refresh_config) on taxonomy edits
+    CACHE_DATASET = BROADCASTABILITY
+
     def __init__(self):
         """Initialize calculator with database configuration"""
         # Import here to avoid circular imports
@@ -351,3 +359,7 @@ class BroadcastabilityCalculator:
         )
 
         logger.info("BroadcastabilityCalculator configuration refreshed")
+
+    def reload(self):
+        """Hot reload for get_shared()"""
+        self.refresh_config()
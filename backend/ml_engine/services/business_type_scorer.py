@@ -0,0 +1,157 @@
+"""
+Business Type Scorer
+
+Vectorized type-level relevance scoring (step 4 of MLOrchestrator).
+
+All active BusinessTypeKeyword rows are loaded into one keyword automaton
+and every active BusinessType into a type x component weight matrix. Per
+article, the text is scanned once and the four relevance components of
+all types are computed in one matrix operation:
+
+    components = [suitability, min(keyword hits, 1), scale bonus, 0] * weights
+    relevance  = min(1.0, components.sum(axis=1))
+
+Scores are the same as BusinessMatcher.calculate_relevance_for_type.
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from event_taxonomy.cache import BUSINESS_TYPES, SharedInstanceMixin
+from .pattern_registry import LiteralScanner
+
+logger = logging.getLogger(__name__)
+
+
+class BusinessTypeScorer(SharedInstanceMixin):
+    """
+    Scores an article against every active business type at once
+
+    Use get_shared() on hot paths: one scorer is kept per process and only
+    rebuilt when BusinessType/BusinessTypeKeyword edits bump its cache
+    version.
+    """
+
+    # Component order of the weight matrix columns
+    COMPONENTS = ['suitability', 'keyword', 'event_scale', 'neighborhood']
+
+    SCALE_MAP = {
+        'massive': 1.0,
+        'large': 0.75,
+        'medium': 0.25,
+        'small': 0.0
+    }
+
+    # Shared instance is rebuilt on business type edits
+    CACHE_DATASET = BUSINESS_TYPES
+
+    def __init__(self):
+        """Initialize scorer with database configuration"""
+        self.reload()
+
+    def reload(self):
+        """Reload business types and keywords from database (two queries)"""
+        from businesses.models import BusinessType, BusinessTypeKeyword
+
+        self.business_types = list(BusinessType.objects.filter(is_active=True))
+        type_index = {biz_type.id: idx for idx, biz_type in enumerate(self.business_types)}
+
+        # Type x component weight matrix and per-type thresholds
+        self.weights = np.array([
+            [
+                biz_type.suitability_weight,
+                biz_type.keyword_weight,
+                biz_type.event_scale_weight,
+                biz_type.neighborhood_weight,
+            ]
+            for biz_type in self.business_types
+        ], dtype=float).reshape(len(self.business_types), len(self.COMPONENTS))
+        self.min_suitability = np.array(
+            [biz_type.min_suitability_threshold for biz_type in self.business_types],
+            dtype=float
+        )
+
+        # Keyword x type weight matrix; keywords are matched lowercased
+        # (same substring test as calculate_relevance_for_type)
+        type_keywords = BusinessTypeKeyword.objects.filter(
+            is_active=True,
+            business_type__is_active=True
+        )
+        self.type_keywords: List[List[Tuple[str, str]]] = [[] for _ in self.business_types]
+        keyword_index: Dict[str, int] = {}
+        entries = []
+        for kw_obj in type_keywords:
+            type_idx = type_index[kw_obj.business_type_id]
+            keyword = kw_obj.keyword.lower()
+            keyword_idx = keyword_index.setdefault(keyword, len(keyword_index))
+            entries.append((keyword_idx, type_idx, kw_obj.weight))
+            self.type_keywords[type_idx].append((kw_obj.keyword, keyword))
+
+        self.keywords = list(keyword_index)
+        self.keyword_matrix = np.zeros((len(self.keywords), len(self.business_types)))
+        for keyword_idx, type_idx, weight in entries:
+            self.keyword_matrix[keyword_idx, type_idx] += weight
+
+        self.scanner = LiteralScanner(self.keywords)
+
+        logger.info(
+            f"BusinessTypeScorer loaded: {len(self.business_types)} business types, "
+            f"{len(self.keywords)} keywords"
+        )
+
+    def score(self, article) -> List[Tuple[Any, Dict[str, Any]]]:
+        """
+        Relevance of an article for every active business type
+
+        Types whose min_suitability_threshold the article does not reach
+        are left out.
+
+        Args:
+            article: NewsArticle with extracted features
+
+        Returns:
+            List of (BusinessType, result) in type order, where result has
+            the same keys as BusinessMatcher.calculate_relevance_for_type
+        """
+        if not self.business_types:
+            return []
+
+        suitability = article.business_suitability_score
+        eligible = suitability >= self.min_suitability
+        if not eligible.any():
+            return []
+
+        # One scan over the text for all keywords of all types
+        article_text = f"{article.title} {article.content}".lower()
+        found = self.scanner.find(article_text)
+        hits = np.array([keyword in found for keyword in self.keywords], dtype=float)
+
+        # Raw component values, one row per type, weighted in one pass
+        raw = np.zeros_like(self.weights)
+        raw[:, 0] = suitability
+        raw[:, 1] = np.minimum(hits @ self.keyword_matrix, 1.0)
+        raw[:, 2] = self.SCALE_MAP.get(article.event_scale, 0.0)
+        raw[:, 3] = 0.0  # Neighborhood: not applicable at type level
+        components = raw * self.weights
+        relevance = np.minimum(components.sum(axis=1), 1.0)
+
+        results = []
+        for type_idx in np.flatnonzero(eligible):
+            suitability_score, keyword_score, event_scale_score, neighborhood_score = (
+                float(value) for value in components[type_idx]
+            )
+            results.append((self.business_types[type_idx], {
+                'relevance_score': float(relevance[type_idx]),
+                'suitability_component': suitability_score,
+                'keyword_component': keyword_score,
+                'event_scale_component': event_scale_score,
+                'neighborhood_component': neighborhood_score,
+                'matching_keywords': [
+                    keyword for keyword, lowered in self.type_keywords[type_idx]
+                    if lowered in found
+                ],
+            }))
+
+        return results
@@ -14,8 +14,10 @@ from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 from django.utils import timezone
 import dateparser
+from spacy.tokens import Doc
 
 from .nlp_processor import NLPProcessor
+from .pattern_registry import PatternRegistry, PatternScanner
 
 logger = logging.getLogger(__name__)
 
@@ -121,59 +123,214 @@ class FeatureExtractor:
         r'(\d+[,.]?\d*)\s+(?:personas|asistentes|espectadores)',
     ]
 
+    # Time patterns (Spanish)
+    TIME_PATTERNS = [
+        r'(\d{1,2}):(\d{2})\s*(?:horas?|hrs?|h)?',  # 20:00, 8:30 h
+        r'(\d{1,2})\s*(?:pm|p\.m\.|de\s+la\s+tarde|de\s+la\s+noche)',  # 8 pm, 8 de la tarde
+        r'(\d{1,2})\s*(?:am|a\.m\.|de\s+la\s+mañana)',  # 9 am, 9 de la mañana
+        r'a\s+las\s+(\d{1,2}):?(\d{2})?',  # a las 20:00, a las 8
+    ]
+
+    # Date ranges - only the start date is extracted
+    DATE_RANGE_PATTERNS = [
+        # Cross-month: "del 28 de octubre al 2 de noviembre"
+        r'del\s+(\d{1,2})\s+de\s+(\w+)\s+al\s+\d{1,2}\s+de\s+\w+(?:\s+de\s+(\d{4}))?',
+        # Same month: "del 20 al 22 de marzo"
+        r'del\s+(\d{1,2})\s+al\s+\d{1,2}\s+de\s+(\w+)(?:\s+de\s+(\d{4}))?',
+        r'entre\s+el\s+(\d{1,2})\s+y\s+\d{1,2}\s+de\s+(\w+)(?:\s+de\s+(\d{4}))?',
+    ]
+
+    # Standard date patterns
+    DATE_PATTERNS = [
+        # Weekday + date: "sábado 15 de marzo", "viernes 20 de abril de 2025"
+        r'(?:lunes|martes|mi[eé]rcoles|jueves|viernes|s[aá]bado|domingo)\s+(\d{1,2}\s+de\s+\w+(?:\s+de\s+\d{4})?)',
+
+        # Standard: "el próximo 15 de marzo", "el 15 de marzo de 2025"
+        r'el\s+pr[oó]ximo\s+(\d{1,2}\s+de\s+\w+(?:\s+de\s+\d{4})?)',
+        r'el\s+(\d{1,2}\s+de\s+\w+(?:\s+de\s+\d{4})?)',
+
+        # Numeric: "15/03/2025", "15-03-2025", "2025-03-15"
+        r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',
+        r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',
+
+        # Month first: "marzo 15", "abril 15 de 2025"
+        r'(\w+)\s+(\d{1,2})(?:\s+de\s+(\d{4}))?',
+
+        # Relative: "mañana", "pasado mañana", "este fin de semana"
+        r'(ma[ñn]ana)',
+        r'(pasado\s+ma[ñn]ana)',
+        r'(este\s+(?:fin\s+de\s+semana|s[aá]bado|domingo|lunes|martes|mi[eé]rcoles|jueves|viernes))',
+        r'(pr[oó]ximo\s+(?:fin\s+de\s+semana|s[aá]bado|domingo|lunes|martes|mi[eé]rcoles|jueves|viernes))',
+
+        # Starting from: "a partir del 15 de marzo"
+        r'a\s+partir\s+del?\s+(\d{1,2}\s+de\s+\w+(?:\s+de\s+\d{4})?)',
+    ]
+
+    # Duration patterns: (pattern, multiplier) or (pattern, None, fixed_hours)
+    DURATION_PATTERNS = [
+        (r'(\d+)\s*horas?', 1.0),  # "3 horas"
+        (r'(\d+)\s*d[ií]as?', 24.0),  # "2 días"
+        (r'todo\s+el\s+d[ií]a', None, 12.0),  # "todo el día" = 12 hours
+        (r'toda\s+la\s+noche', None, 8.0),  # "toda la noche" = 8 hours
+        (r'fin\s+de\s+semana', None, 48.0),  # "fin de semana" = 48 hours
+        (r'una\s+semana', None, 168.0),  # "una semana" = 168 hours
+        (r'(\d+)\s*semanas?', 168.0),  # "2 semanas"
+        (r'(\d+)\s*minutos?', 1.0/60.0),  # "30 minutos"
+    ]
+
+    # Colombian involvement patterns
+    COLOMBIAN_INVOLVEMENT_PATTERNS = [
+        r'selección\s+colombia',
+        r'colombia\s+(vs|contra)\s+',
+        r'colombiano[sa]?\s+(participa|compite|juega|dirige|actúa|presenta)',
+        r'(artista|director|atleta|actor|actriz)\s+colombiano',
+        r'equipo\s+colombiano',
+        r'representante\s+de\s+colombia',
+        r'colombia\s+en\s+(la\s+)?(copa|mundial|olimpiadas|festival|ceremonia)',
+        r'(jugador|jugadora)\s+colombiano',
+        r'seleccionado\s+colombiano',
+    ]
+
+    # Country mentions: "en México", "en Argentina", etc.
+    COUNTRY_PATTERNS = {
+        r'\ben\s+m[eé]xico\b': 'México',
+        r'\ben\s+argentina\b': 'Argentina',
+        r'\ben\s+brasil\b': 'Brasil',
+        r'\ben\s+(los\s+)?estados\s+unidos\b': 'Estados Unidos',
+        r'\ben\s+espa[ñn]a\b': 'España',
+        r'\ben\s+chile\b': 'Chile',
+        r'\ben\s+per[uú]\b': 'Perú',
+        r'\ben\s+ecuador\b': 'Ecuador',
+        r'\ben\s+qatar\b': 'Qatar',
+        r'\ben\s+rusia\b': 'Rusia',
+        r'\ben\s+francia\b': 'Francia',
+        r'\ben\s+inglaterra\b': 'Inglaterra',
+    }
+
+    VENUE_PATTERN = r'en\s+el\s+((?:Estadio|Teatro|Centro|Auditorio|Coliseo|Arena|Parque)\s+[A-ZÁ-Ú][a-zá-ú\s]+)'
+
+    # Precompiled tables (compiled once at import, shared via PatternRegistry)
+    EVENT_TYPE_TABLES = {
+        event_type: PatternRegistry.register(f'feature_extractor.event_type.{event_type}', patterns)
+        for event_type, patterns in EVENT_TYPE_PATTERNS.items()
+    }
+    ATTENDANCE_TABLE = PatternRegistry.register(
+        'feature_extractor.attendance', ATTENDANCE_PATTERNS, re.IGNORECASE
+    )
+    TIME_TABLE = PatternRegistry.register('feature_extractor.time', TIME_PATTERNS)
+    DATE_RANGE_TABLE = PatternRegistry.register(
+        'feature_extractor.date_range', DATE_RANGE_PATTERNS, re.IGNORECASE
+    )
+    DATE_TABLE = PatternRegistry.register('feature_extractor.date', DATE_PATTERNS, re.IGNORECASE)
+    DURATION_TABLE = PatternRegistry.register(
+        'feature_extractor.duration', [info[0] for info in DURATION_PATTERNS]
+    )
+    COLOMBIAN_INVOLVEMENT_TABLE = PatternRegistry.register(
+        'feature_extractor.colombian_involvement', COLOMBIAN_INVOLVEMENT_PATTERNS
+    )
+    COUNTRY_TABLE = PatternRegistry.register('feature_extractor.country', list(COUNTRY_PATTERNS))
+    VENUE_TABLE = PatternRegistry.register('feature_extractor.venue', [VENUE_PATTERN], re.IGNORECASE)
+
+    # NLPProcessor methods used on the shared article Doc; decides which
+    # spaCy components get loaded (see NLPProcessor.PROFILES)
+    NLP_EXTRACTORS = [
+        'extract_locations',     # extract_city
+        'extract_organizations', # extract_venue
+        'extract_dates',         # extract_event_date
+        'extract_entities',
+        'get_keywords',
+    ]
+
     def __init__(self):
-        self.nlp = NLPProcessor()
-        # Pattern caching to avoid DB queries on every extraction
+        self.nlp = NLPProcessor(profile=NLPProcessor.profile_for(self.NLP_EXTRACTORS))
+        # Extraction patterns from the shared versioned snapshot
+        # (reloaded only when an admin edit bumps the version)
         self._pattern_cache = None
+        self._pattern_scanner = None
+        self._pattern_version = None
         self._cache_timestamp = None
-        self.CACHE_DURATION = 300  # 5 minutes
+        self.CACHE_DURATION = 300  # 5 minutes, only used if the shared cache is down
 
     def _load_patterns_cached(self):
-        """Load extraction patterns from database with 5-minute cache"""
-        from django.utils import timezone
-
-        now = timezone.now()
-
-        # Check if cache is valid
-        if (self._pattern_cache is None or
-            self._cache_timestamp is None or
-            (now - self._cache_timestamp).seconds > self.CACHE_DURATION):
-
-            # Reload from database
-            from event_taxonomy.models import ExtractionPattern
+        """
+        Load extraction patterns from the shared versioned snapshot
 
-            self._pattern_cache = list(
-                ExtractionPattern.objects.filter(is_active=True)
-                .select_related('event_type', 'event_subtype')
-            )
-            self._cache_timestamp = now
-            logger.info(f"Loaded {len(self._pattern_cache)} extraction patterns from database")
+        Costs one cache read per call; patterns are reloaded (and the
+        scanner recompiled) only when the snapshot version changes. If the
+        cache is unreachable, patterns are read from the database with a
+        5-minute local TTL.
+        """
+        from event_taxonomy import cache as taxonomy_cache
+
+        try:
+            version = taxonomy_cache.get_version(taxonomy_cache.EXTRACTION_PATTERNS)
+            if self._pattern_cache is None or version != self._pattern_version:
+                self._set_patterns(*taxonomy_cache.get_extraction_pattern_snapshot(version))
+        except Exception as e:
+            now = timezone.now()
+            if (self._pattern_cache is None or
+                    self._cache_timestamp is None or
+                    (now - self._cache_timestamp).total_seconds() > self.CACHE_DURATION):
+                logger.warning(f"Pattern cache unavailable ({e}), loading patterns from database")
+                self._set_patterns(None, taxonomy_cache.build_extraction_pattern_snapshot())
 
         return self._pattern_cache
 
-    def extract_all(self, article_text: str, article_title: str = "") -> Dict[str, Any]:
+    def _set_patterns(self, version: Optional[int], patterns: List[Dict[str, Any]]):
+        """Install a pattern snapshot and compile its scanner"""
+        self._pattern_cache = patterns
+        self._pattern_scanner = PatternScanner(
+            (pattern['pattern'], pattern) for pattern in patterns
+        )
+        self._pattern_version = version
+        self._cache_timestamp = timezone.now()
+        logger.info(f"Loaded {len(patterns)} extraction patterns (version {version})")
+
+    @staticmethod
+    def build_text(article_text: str, article_title: str = "") -> str:
+        """Combine title and content into the text all extractors analyze"""
+        return f"{article_title} {article_text}"
+
+    def extract_all(
+        self,
+        article_text: str,
+        article_title: str = "",
+        doc: Optional[Doc] = None
+    ) -> Dict[str, Any]:
         """
         Extract all features from article
 
+        The title + content is parsed with spaCy exactly once and the
+        resulting Doc is shared by every NLP-based extractor.
+
         Args:
             article_text: Full article content
             article_title: Article title
+            doc: Doc of build_text(article_text, article_title) already
+                 parsed upstream (e.g. by extract_batch); parsed here if omitted
 
         Returns:
-            Dictionary with all extracted features
+            Dictionary with all extracted features, including
+            'nlp_parse_count' (spaCy pipeline runs made by this call; an
+            upstream parse of doc is counted by whoever ran it)
         """
-        full_text = f"{article_title} {article_text}"
+        full_text = self.build_text(article_text, article_title)
+
+        # Single spaCy parse shared across all extractors
+        parses_before = self.nlp.parse_count
+        if doc is None:
+            doc = self.nlp.process_text(full_text, extractors=self.NLP_EXTRACTORS)
 
         # Extract basic features
         event_type, event_subtype = self.extract_event_type(full_text)
-        city = self.extract_city(full_text)
+        city = self.extract_city(full_text, doc=doc)
 
         # Extract geographic and involvement features
         event_country = self.extract_event_country(full_text, city)
         colombian_involvement = self.detect_colombian_involvement(full_text)
 
         # Extract temporal features
-        event_start = self.extract_event_date(full_text)
+        event_start = self.extract_event_date(full_text, doc=doc)
         duration_hours = self.extract_duration(full_text)
 
         # Calculate end datetime if we have both start and duration
@@ -182,15 +339,19 @@ class FeatureExtractor:
             event_end = event_start + timedelta(hours=duration_hours)
 
         # Extract NLP features (keywords and entities)
-        keywords = self.nlp.get_keywords(full_text, top_n=15)
-        entities = self.nlp.extract_entities(full_text)
+        keywords = self.nlp.get_keywords(doc, top_n=15)
+        entities = self.nlp.extract_entities(doc)
+        venue = self.extract_venue(full_text, doc=doc)
+
+        parse_count = self.nlp.parse_count - parses_before
+        logger.debug(f"spaCy parses for article: {parse_count}")
 
         return {
             'event_type': event_type,
             'event_subtype': event_subtype,
             'city': city,
             'neighborhood': self.extract_neighborhood(full_text),
-            'venue': self.extract_venue(full_text),
+            'venue': venue,
             'event_date': event_start,
             'event_end_datetime': event_end,
             'event_duration_hours': duration_hours,
@@ -200,8 +361,44 @@ class FeatureExtractor:
             'colombian_involvement': colombian_involvement,
             'keywords': keywords,
             'entities': entities,
+            'nlp_parse_count': parse_count,
         }
 
+    def extract_batch(
+        self,
+        articles: List[Tuple[str, str]],
+        batch_size: int = 50,
+        n_process: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract features for many articles with a single batched spaCy run
+
+        Args:
+            articles: List of (article_text, article_title) tuples
+            batch_size: Number of texts buffered per spaCy batch
+            n_process: Worker processes for spaCy (see NLPProcessor.process_texts)
+
+        Returns:
+            List of feature dictionaries aligned with articles
+            (same shape as extract_all)
+        """
+        texts = [self.build_text(text, title) for text, title in articles]
+        docs = self.nlp.process_texts(
+            texts,
+            batch_size=batch_size,
+            n_process=n_process,
+            extractors=self.NLP_EXTRACTORS
+        )
+
+        results = []
+        for (text, title), doc in zip(articles, docs):
+            features = self.extract_all(text, title, doc=doc)
+            if doc is not None:
+                features['nlp_parse_count'] += 1  # This article's share of the nlp.pipe run
+            results.append(features)
+
+        return results
+
     def extract_event_type(self, text: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Classify event type AND subtype using database patterns with hardcoded fallback
@@ -215,27 +412,26 @@ class FeatureExtractor:
         """
         text_lower = text.lower()
 
-        # Load patterns from database (cached)
-        patterns = self._load_patterns_cached()
+        # Load patterns from database (cached) and find all type and
+        # subtype hits in a single scan: [(pattern, match count), ...]
+        self._load_patterns_cached()
+        hits = self._pattern_scanner.scan(text_lower)
 
         # Score event types from database
         type_scores = {}
-        for pattern_obj in patterns:
-            if pattern_obj.target == 'type':
-                matches = len(re.findall(pattern_obj.pattern, text_lower))
-                if matches > 0:
-                    event_type_code = pattern_obj.event_type.code
-                    score = matches * pattern_obj.weight
-                    type_scores[event_type_code] = type_scores.get(event_type_code, 0) + score
+        for pattern, matches in hits:
+            if pattern['target'] == 'type' and pattern['event_type']:
+                event_type_code = pattern['event_type']
+                score = matches * pattern['weight']
+                type_scores[event_type_code] = type_scores.get(event_type_code, 0) + score
 
         # FALLBACK: Use hardcoded EVENT_TYPE_PATTERNS if no database matches
         if not type_scores:
-            for event_type, patterns_list in self.EVENT_TYPE_PATTERNS.items():
-                for pattern in patterns_list:
-                    matches = len(re.findall(pattern, text_lower))
-                    if matches > 0:
-                        # Default weight of 1.0 for hardcoded patterns
-                        type_scores[event_type] = type_scores.get(event_type, 0) + matches
+            for event_type, table in self.EVENT_TYPE_TABLES.items():
+                # Default weight of 1.0 for hardcoded patterns
+                matches = table.count_all(text_lower)
+                if matches > 0:
+                    type_scores[event_type] = matches
 
         # Get best type
         best_type = max(type_scores, key=type_scores.get) if type_scores else None
@@ -246,24 +442,22 @@ class FeatureExtractor:
 
         # Score subtypes for the best type (only from database - hardcoded patterns don't have subtypes)
         subtype_scores = {}
-        for pattern_obj in patterns:
-            if (pattern_obj.target == 'subtype' and
-                pattern_obj.event_type and
-                pattern_obj.event_type.code == best_type):
-                matches = len(re.findall(pattern_obj.pattern, text_lower))
-                if matches > 0:
-                    subtype_code = pattern_obj.event_subtype.code
-                    score = matches * pattern_obj.weight
-                    subtype_scores[subtype_code] = subtype_scores.get(subtype_code, 0) + score
+        for pattern, matches in hits:
+            if (pattern['target'] == 'subtype' and
+                pattern['event_type'] == best_type and
+                pattern['event_subtype']):
+                subtype_code = pattern['event_subtype']
+                score = matches * pattern['weight']
+                subtype_scores[subtype_code] = subtype_scores.get(subtype_code, 0) + score
 
         # Get best subtype (may be None - that's okay)
         best_subtype = max(subtype_scores, key=subtype_scores.get) if subtype_scores else None
 
         return (best_type, best_subtype)
 
-    def extract_city(self, text: str) -> Optional[str]:
-        """Extract primary city from text"""
-        locations = self.nlp.extract_locations(text)
+    def extract_city(self, text: str, doc: Optional[Doc] = None) -> Optional[str]:
+        """Extract primary city from text (reuses doc when already parsed)"""
+        locations = self.nlp.extract_locations(doc if doc is not None else text)
 
         # Check for Colombian cities in extracted locations
         for loc in locations:
@@ -285,12 +479,13 @@ class FeatureExtractor:
                 return neighborhood
         return None
 
-    def extract_venue(self, text: str) -> Optional[str]:
+    def extract_venue(self, text: str, doc: Optional[Doc] = None) -> Optional[str]:
         """
         Extract venue name using organizations and noun chunks
+        (reuses doc when already parsed)
         """
         # Get organizations (stadiums, theaters are usually ORG entities)
-        orgs = self.nlp.extract_organizations(text)
+        orgs = self.nlp.extract_organizations(doc if doc is not None else text)
 
         # Filter for venue-like names
         venue_keywords = ['estadio', 'teatro', 'centro', 'auditorio', 'coliseo', 'arena', 'parque']
@@ -299,8 +494,7 @@ class FeatureExtractor:
                 return org
 
         # Fallback: look for patterns like "en el Estadio X"
-        venue_pattern = r'en\s+el\s+((?:Estadio|Teatro|Centro|Auditorio|Coliseo|Arena|Parque)\s+[A-ZÁ-Ú][a-zá-ú\s]+)'
-        match = re.search(venue_pattern, text, re.IGNORECASE)
+        match = self.VENUE_TABLE.search(text)
         if match:
             return match.group(1).strip()
 
@@ -313,18 +507,10 @@ class FeatureExtractor:
         Returns:
             Time string in HH:MM format or None
         """
-        # Time patterns (Spanish)
-        time_patterns = [
-            r'(\d{1,2}):(\d{2})\s*(?:horas?|hrs?|h)?',  # 20:00, 8:30 h
-            r'(\d{1,2})\s*(?:pm|p\.m\.|de\s+la\s+tarde|de\s+la\s+noche)',  # 8 pm, 8 de la tarde
-            r'(\d{1,2})\s*(?:am|a\.m\.|de\s+la\s+mañana)',  # 9 am, 9 de la mañana
-            r'a\s+las\s+(\d{1,2}):?(\d{2})?',  # a las 20:00, a las 8
-        ]
-
         text_lower = text.lower()
 
-        for pattern in time_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in self.TIME_TABLE:
+            match = pattern.search(text_lower)
             if match:
                 hour = int(match.group(1))
                 minute = int(match.group(2)) if len(match.groups()) > 1 and match.group(2) else 0
@@ -341,20 +527,24 @@ class FeatureExtractor:
 
         return None
 
-    def extract_event_date(self, text: str) -> Optional[datetime]:
+    def extract_event_date(self, text: str, doc: Optional[Doc] = None) -> Optional[datetime]:
         """
         Extract event date using multiple strategies:
         1. spaCy DATE entities (highest priority)
         2. Comprehensive Spanish regex patterns
         3. dateparser library (fallback)
 
+        Args:
+            text: Article title + content
+            doc: Pre-parsed spaCy Doc of text (parsed on demand if omitted)
+
         Returns:
             datetime object with extracted date (and time if found)
         """
         now = timezone.now()
 
         # Strategy 1: Use spaCy DATE entities first
-        date_entities = self.nlp.extract_dates(text)
+        date_entities = self.nlp.extract_dates(doc if doc is not None else text)
         if date_entities:
             for date_str in date_entities:
                 parsed = dateparser.parse(date_str, languages=['es'], settings={
@@ -379,16 +569,8 @@ class FeatureExtractor:
         text_lower = text.lower()
 
         # Special handling for date ranges - extract start date only
-        range_patterns = [
-            # Cross-month: "del 28 de octubre al 2 de noviembre"
-            r'del\s+(\d{1,2})\s+de\s+(\w+)\s+al\s+\d{1,2}\s+de\s+\w+(?:\s+de\s+(\d{4}))?',
-            # Same month: "del 20 al 22 de marzo"
-            r'del\s+(\d{1,2})\s+al\s+\d{1,2}\s+de\s+(\w+)(?:\s+de\s+(\d{4}))?',
-            r'entre\s+el\s+(\d{1,2})\s+y\s+\d{1,2}\s+de\s+(\w+)(?:\s+de\s+(\d{4}))?',
-        ]
-
-        for pattern in range_patterns:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
+        for pattern in self.DATE_RANGE_TABLE:
+            match = pattern.search(text_lower)
             if match:
                 # Reconstruct date string from captured groups: "20 de marzo de 2025"
                 day = match.group(1)
@@ -416,33 +598,8 @@ class FeatureExtractor:
                         return parsed
 
         # Standard date patterns
-        date_patterns = [
-            # Weekday + date: "sábado 15 de marzo", "viernes 20 de abril de 2025"
-            r'(?:lunes|martes|mi[eé]rcoles|jueves|viernes|s[aá]bado|domingo)\s+(\d{1,2}\s+de\s+\w+(?:\s+de\s+\d{4})?)',
-
-            # Standard: "el próximo 15 de marzo", "el 15 de marzo de 2025"
-            r'el\s+pr[oó]ximo\s+(\d{1,2}\s+de\s+\w+(?:\s+de\s+\d{4})?)',
-            r'el\s+(\d{1,2}\s+de\s+\w+(?:\s+de\s+\d{4})?)',
-
-            # Numeric: "15/03/2025", "15-03-2025", "2025-03-15"
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',
-            r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',
-
-            # Month first: "marzo 15", "abril 15 de 2025"
-            r'(\w+)\s+(\d{1,2})(?:\s+de\s+(\d{4}))?',
-
-            # Relative: "mañana", "pasado mañana", "este fin de semana"
-            r'(ma[ñn]ana)',
-            r'(pasado\s+ma[ñn]ana)',
-            r'(este\s+(?:fin\s+de\s+semana|s[aá]bado|domingo|lunes|martes|mi[eé]rcoles|jueves|viernes))',
-            r'(pr[oó]ximo\s+(?:fin\s+de\s+semana|s[aá]bado|domingo|lunes|martes|mi[eé]rcoles|jueves|viernes))',
-
-            # Starting from: "a partir del 15 de marzo"
-            r'a\s+partir\s+del?\s+(\d{1,2}\s+de\s+\w+(?:\s+de\s+\d{4})?)',
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
+        for pattern in self.DATE_TABLE:
+            match = pattern.search(text_lower)
             if match:
                 date_str = match.group(0)
 
@@ -474,8 +631,8 @@ class FeatureExtractor:
 
     def extract_attendance(self, text: str) -> Optional[int]:
         """Extract expected attendance number"""
-        for pattern in self.ATTENDANCE_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.ATTENDANCE_TABLE:
+            match = pattern.search(text)
             if match:
                 number_str = match.group(1).replace('.', '').replace(',', '')
                 try:
@@ -501,27 +658,15 @@ class FeatureExtractor:
         """
         text_lower = text.lower()
 
-        # Duration patterns
-        duration_patterns = [
-            (r'(\d+)\s*horas?', 1.0),  # "3 horas"
-            (r'(\d+)\s*d[ií]as?', 24.0),  # "2 días"
-            (r'todo\s+el\s+d[ií]a', None, 12.0),  # "todo el día" = 12 hours
-            (r'toda\s+la\s+noche', None, 8.0),  # "toda la noche" = 8 hours
-            (r'fin\s+de\s+semana', None, 48.0),  # "fin de semana" = 48 hours
-            (r'una\s+semana', None, 168.0),  # "una semana" = 168 hours
-            (r'(\d+)\s*semanas?', 168.0),  # "2 semanas"
-            (r'(\d+)\s*minutos?', 1.0/60.0),  # "30 minutos"
-        ]
-
-        for pattern_info in duration_patterns:
+        for pattern, pattern_info in zip(self.DURATION_TABLE, self.DURATION_PATTERNS):
             if len(pattern_info) == 2:
-                pattern, multiplier = pattern_info
-                match = re.search(pattern, text_lower)
+                _, multiplier = pattern_info
+                match = pattern.search(text_lower)
                 if match and match.group(1):
                     return float(match.group(1)) * multiplier
             else:
-                pattern, _, fixed_value = pattern_info
-                if re.search(pattern, text_lower):
+                _, _, fixed_value = pattern_info
+                if pattern.search(text_lower):
                     return fixed_value
 
         return None
@@ -564,20 +709,8 @@ class FeatureExtractor:
         Returns:
             Boolean indicating Colombian involvement
         """
-        patterns = [
-            r'selección\s+colombia',
-            r'colombia\s+(vs|contra)\s+',
-            r'colombiano[sa]?\s+(participa|compite|juega|dirige|actúa|presenta)',
-            r'(artista|director|atleta|actor|actriz)\s+colombiano',
-            r'equipo\s+colombiano',
-            r'representante\s+de\s+colombia',
-            r'colombia\s+en\s+(la\s+)?(copa|mundial|olimpiadas|festival|ceremonia)',
-            r'(jugador|jugadora)\s+colombiano',
-            r'seleccionado\s+colombiano',
-        ]
-
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in patterns)
+        return self.COLOMBIAN_INVOLVEMENT_TABLE.matches(text_lower)
 
     def extract_event_country(self, text: str, primary_city: str) -> str:
         """
@@ -608,24 +741,9 @@ class FeatureExtractor:
         text_lower = text.lower()
 
         # Pattern: "en México", "en Argentina", etc.
-        country_patterns = {
-            r'\ben\s+m[eé]xico\b': 'México',
-            r'\ben\s+argentina\b': 'Argentina',
-            r'\ben\s+brasil\b': 'Brasil',
-            r'\ben\s+(los\s+)?estados\s+unidos\b': 'Estados Unidos',
-            r'\ben\s+espa[ñn]a\b': 'España',
-            r'\ben\s+chile\b': 'Chile',
-            r'\ben\s+per[uú]\b': 'Perú',
-            r'\ben\s+ecuador\b': 'Ecuador',
-            r'\ben\s+qatar\b': 'Qatar',
-            r'\ben\s+rusia\b': 'Rusia',
-            r'\ben\s+francia\b': 'Francia',
-            r'\ben\s+inglaterra\b': 'Inglaterra',
-        }
-
-        for pattern, country in country_patterns.items():
-            if re.search(pattern, text_lower):
-                return country
+        idx, _ = self.COUNTRY_TABLE.first_match(text_lower)
+        if idx is not None:
+            return list(self.COUNTRY_PATTERNS.values())[idx]
 
         # Pattern: "festival de Morelia", "copa de Rusia", etc.
         if 'morelia' in text_lower or 'guadalajara' in text_lower:
@@ -6,21 +6,25 @@ and recommendation generator into one cohesive pipeline.
 """
 
 import logging
-import re
 from typing import Dict, Any, List, Optional, Tuple
 from math import radians, cos, sin, asin, sqrt
-from datetime import datetime, timedelta
+
+import numpy as np
+from django.conf import settings
 from django.utils import timezone
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
+from django.db.models import Q
 
 from news.models import NewsArticle
 from businesses.models import Business
 from recommendations.models import Recommendation
-from .nlp_processor import NLPProcessor
+from event_taxonomy.cache import BUSINESSES, SharedInstanceMixin
 from .feature_extractor import FeatureExtractor
+from .pattern_registry import PatternRegistry
 from .llm_extractor import LLMExtractor
 from .broadcastability_calculator import BroadcastabilityCalculator
+from .business_type_scorer import BusinessTypeScorer
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +78,47 @@ class PreFilter:
         r'datos\s+de\s+navegaci[oó]n',
     ]
 
+    # Precompiled tables (compiled once at import, shared via PatternRegistry)
+    HOSPITALITY_TABLE = PatternRegistry.register('prefilter.hospitality', HOSPITALITY_KEYWORDS)
+    NEGATIVE_TABLE = PatternRegistry.register('prefilter.negative', NEGATIVE_KEYWORDS)
+    PAYWALL_TABLE = PatternRegistry.register('prefilter.paywall', PAYWALL_PATTERNS)
+
+    # Event types rejected by prescreen() unless the lead mentions hospitality
+    PRESCREEN_REJECTED_EVENT_TYPES = {'crime', 'conflict'}
+
+    # Characters of the first paragraph looked at by prescreen()
+    LEAD_MAX_CHARS = 1000
+
+    @classmethod
+    def lead_text(cls, article: NewsArticle) -> str:
+        """Lowercased title and first paragraph of an article"""
+        content = article.content.strip()
+        first_paragraph = content.split('\n', 1)[0] if content else ''
+        return f"{article.title} {first_paragraph[:cls.LEAD_MAX_CHARS]}".lower()
+
+    def prescreen(self, article: NewsArticle, lead_event_type: Optional[str] = None) -> Optional[str]:
+        """
+        Cheap first phase: reject clearly irrelevant articles with compiled
+        regexes only, before any NLP runs
+
+        Args:
+            article: NewsArticle object (features not extracted yet)
+            lead_event_type: Event type detected on lead_text (regex only)
+
+        Returns:
+            Rejection reason ('paywall' or the event type), None if the
+            article needs the full pipeline
+        """
+        # Same check as calculate_suitability, which scores paywalls 0.0
+        if self.PAYWALL_TABLE.matches(f"{article.title} {article.content}".lower()):
+            return 'paywall'
+
+        if lead_event_type in self.PRESCREEN_REJECTED_EVENT_TYPES:
+            if not self.HOSPITALITY_TABLE.matches(self.lead_text(article)):
+                return lead_event_type
+
+        return None
+
     def calculate_suitability(self, article: NewsArticle, event_type: Optional[str] = None, business: Optional[Business] = None) -> float:
         """
         Calculate 0.0-1.0 score for business suitability
@@ -95,7 +140,7 @@ class PreFilter:
         text = f"{article.title} {article.content}".lower()
 
         # Content quality checks - detect paywalls and bad content
-        paywall_detected = any(re.search(pattern, text) for pattern in self.PAYWALL_PATTERNS)
+        paywall_detected = self.PAYWALL_TABLE.matches(text)
         no_keywords = not article.extracted_keywords or len(article.extracted_keywords) == 0
         short_content = len(article.content) < 200
 
@@ -157,13 +202,11 @@ class PreFilter:
                 score += 0.2  # Extra boost for pubs/bars with TVs
 
         # Boost for hospitality keywords
-        hospitality_matches = sum(1 for kw in self.HOSPITALITY_KEYWORDS
-                                   if re.search(kw, text))
+        hospitality_matches = self.HOSPITALITY_TABLE.count(text)
         score += min(0.3, hospitality_matches * 0.1)
 
         # Penalize negative keywords (stronger penalty to filter out bad news)
-        negative_matches = sum(1 for kw in self.NEGATIVE_KEYWORDS
-                                if re.search(kw, text))
+        negative_matches = self.NEGATIVE_TABLE.count(text)
         score -= negative_matches * 0.5
 
         # Apply content quality penalty
@@ -200,12 +243,49 @@ class GeographicMatcher:
 
         return km
 
+    @staticmethod
+    def haversine_distances(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Vectorized haversine_distance from one point to many
+
+        Args:
+            lat, lon: Point coordinates
+            lats, lons: Arrays of coordinates (NaN gives NaN)
+
+        Returns:
+            Array of distances in kilometers
+        """
+        lat, lon = radians(lat), radians(lon)
+        lats, lons = np.radians(lats), np.radians(lons)
+
+        a = np.sin((lats - lat) / 2)**2 + cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2)**2
+        return 6371 * 2 * np.arcsin(np.sqrt(a))
+
+    def within_radius(self, article: NewsArticle, business: Business) -> Optional[bool]:
+        """
+        Whether the event lies within business.geographic_radius_km
+
+        Returns:
+            None if the article or the business has no coordinates
+        """
+        if article.latitude is None or article.longitude is None:
+            return None
+        if business.latitude is None or business.longitude is None:
+            return None
+
+        distance = self.haversine_distance(
+            article.latitude, article.longitude, business.latitude, business.longitude
+        )
+        return distance <= business.geographic_radius_km
+
     def is_relevant(self, article: NewsArticle, business: Business) -> bool:
         """
         Determine if article is geographically relevant to business
 
         New logic:
-        1. Local events (same city in Colombia) → ALWAYS relevant
+        0. Geolocated events within the business radius → ALWAYS relevant
+        1. Local events (same city in Colombia) → relevant, unless the event
+           is geolocated outside the radius and not business.include_citywide_events
         2. National events (Colombia, different city) → relevant if business.include_national_events
         3. International events WITHOUT Colombian involvement → NOT relevant
         4. International events WITH Colombian involvement → relevant ONLY for gathering places
@@ -215,20 +295,54 @@ class GeographicMatcher:
             article: NewsArticle with extracted geographic features
             business: Business object
 
+        Returns:
+            True if relevant, False otherwise
+        """
+        within_radius = self.within_radius(article, business)
+        if within_radius:
+            return True
+
+        return self.matches_location(
+            article,
+            self._normalize_city(business.get_city_display()),
+            business.has_tv_screens,
+            business.include_national_events,
+            include_citywide_events=within_radius is None or business.include_citywide_events
+        )
+
+    def matches_location(
+        self,
+        article: NewsArticle,
+        business_city: str,
+        has_tv_screens: bool,
+        include_national_events: bool,
+        include_citywide_events: bool = True
+    ) -> bool:
+        """
+        is_relevant (without the radius check) for the business attributes
+        it depends on, so callers can decide once for every business
+        sharing them (see BusinessIndex)
+
+        Args:
+            article: NewsArticle with extracted geographic features
+            business_city: Normalized business city (see _normalize_city)
+            has_tv_screens: Business has TV screens
+            include_national_events: Business wants national events
+            include_citywide_events: Same-city events count as local
+
         Returns:
             True if relevant, False otherwise
         """
         # Case 1: Local event (same city in Colombia)
         if article.event_country == 'Colombia' and article.primary_city:
             article_city = self._normalize_city(article.primary_city)
-            business_city = self._normalize_city(business.get_city_display())
 
-            if article_city == business_city:
-                # Same city = always relevant
+            if article_city == business_city and include_citywide_events:
+                # Same city = relevant
                 return True
 
             # Case 2: National event (different Colombian city)
-            if business.include_national_events:
+            if include_national_events:
                 if article.event_scale in ['massive', 'large']:
                     return True
 
@@ -239,7 +353,7 @@ class GeographicMatcher:
 
             # Case 4: International event WITH Colombian involvement
             # Only relevant for "gathering places" (pubs with TVs)
-            if business.has_tv_screens:
+            if has_tv_screens:
                 # Check if event type is "watchable"
                 if article.event_type_detected in ['sports_match', 'tournament', 'awards', 'festival']:
                     return True
@@ -250,7 +364,7 @@ class GeographicMatcher:
         # Case 5: Unknown location - be conservative
         if not article.primary_city and not article.event_country:
             # Only show if it's a massive national event
-            if article.event_scale == 'massive' and business.include_national_events:
+            if article.event_scale == 'massive' and include_national_events:
                 return True
             return False
 
@@ -261,6 +375,94 @@ class GeographicMatcher:
         return city.lower().replace('á', 'a').replace('é', 'e').replace('í', 'i').replace('ó', 'o').replace('ú', 'u')
 
 
+class BusinessIndex(SharedInstanceMixin):
+    """
+    In-memory index of active businesses for geographic candidate lookup
+
+    Per business type, businesses are bucketed by the attributes
+    GeographicMatcher.matches_location looks at: (normalized city,
+    has_tv_screens, include_national_events, include_citywide_events).
+    The location decision is taken once per bucket, and the radius check
+    is one vectorized haversine over the coordinates of the type, so an
+    article costs a few checks per business type instead of a query plus
+    a check for every business.
+
+    Use get_shared(): one index is kept per process and rebuilt when a
+    Business save/delete bumps its cache version.
+    """
+
+    CACHE_DATASET = BUSINESSES
+
+    def __init__(self):
+        self.geo_matcher = GeographicMatcher()
+        self.reload()
+
+    def reload(self):
+        """Reload active businesses from database (one query)"""
+        self.businesses: Dict[int, List[Business]] = {}
+        for business in Business.objects.filter(is_active=True).select_related('business_type'):
+            self.businesses.setdefault(business.business_type_id, []).append(business)
+
+        # Per type: bucket key -> positions, and coordinate/radius arrays
+        # (NaN for businesses without coordinates)
+        self.buckets: Dict[int, Dict[Tuple[str, bool, bool, bool], np.ndarray]] = {}
+        self.coordinates: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        for type_id, businesses in self.businesses.items():
+            buckets: Dict[Tuple[str, bool, bool, bool], List[int]] = {}
+            for position, business in enumerate(businesses):
+                geolocated = business.latitude is not None and business.longitude is not None
+                key = (
+                    self.geo_matcher._normalize_city(business.get_city_display()),
+                    business.has_tv_screens,
+                    business.include_national_events,
+                    # Without coordinates the radius can't exclude same-city events
+                    business.include_citywide_events or not geolocated
+                )
+                buckets.setdefault(key, []).append(position)
+            self.buckets[type_id] = {key: np.array(positions) for key, positions in buckets.items()}
+
+            self.coordinates[type_id] = tuple(
+                np.array([
+                    np.nan if value is None else value
+                    for value in (getattr(business, field) for business in businesses)
+                ], dtype=float)
+                for field in ('latitude', 'longitude', 'geographic_radius_km')
+            )
+
+        logger.info(f"BusinessIndex loaded: {sum(map(len, self.businesses.values()))} active businesses")
+
+    def candidates(self, article: NewsArticle, business_type) -> List[Business]:
+        """
+        Active businesses of a type that are geographically relevant to article
+
+        Same result as filtering Business.objects.filter(business_type=...,
+        is_active=True) with GeographicMatcher.is_relevant.
+        """
+        businesses = self.businesses.get(business_type.id)
+        if not businesses:
+            return []
+
+        relevant = np.zeros(len(businesses), dtype=bool)
+        geolocated = article.latitude is not None and article.longitude is not None
+
+        if geolocated:
+            latitudes, longitudes, radii = self.coordinates[business_type.id]
+            distances = self.geo_matcher.haversine_distances(
+                article.latitude, article.longitude, latitudes, longitudes
+            )
+            relevant |= distances <= radii  # NaN (no coordinates) never matches
+
+        for (city, has_tv_screens, include_national_events, include_citywide_events), positions in \
+                self.buckets[business_type.id].items():
+            if self.geo_matcher.matches_location(
+                article, city, has_tv_screens, include_national_events,
+                include_citywide_events=include_citywide_events or not geolocated
+            ):
+                relevant[positions] = True
+
+        return [businesses[position] for position in np.flatnonzero(relevant)]
+
+
 class BusinessMatcher:
     """Match articles to businesses based on keywords and relevance"""
 
@@ -751,10 +953,36 @@ class RecommendationGenerator:
         }
     }
 
+    def __init__(self):
+        self._article_content_type = None
+
+    @property
+    def article_content_type(self) -> ContentType:
+        """ContentType of NewsArticle, resolved once per generator"""
+        if self._article_content_type is None:
+            self._article_content_type = ContentType.objects.get_for_model(NewsArticle)
+        return self._article_content_type
+
+    def applies_to(self, article: NewsArticle, business: Business) -> bool:
+        """
+        Check if the article's event type has templates for the business type
+
+        Only businesses passing this check get their existing
+        recommendations for the article replaced.
+        """
+        event_type = article.event_type_detected
+        if not event_type or event_type not in self.TEMPLATES:
+            return False
+
+        # Check if this event type is applicable to this business type
+        return business.business_type.code in self.TEMPLATES[event_type].get('business_types', [])
+
     def generate(self, article: NewsArticle, business: Business, relevance_score: float) -> List[Recommendation]:
         """
         Generate recommendations for business based on article
 
+        Runs no queries; write the result through a RecommendationSink.
+
         Args:
             article: NewsArticle object with extracted features
             business: Business object
@@ -763,30 +991,16 @@ class RecommendationGenerator:
         Returns:
             List of Recommendation objects (not yet saved)
         """
-        event_type = article.event_type_detected
-        if not event_type or event_type not in self.TEMPLATES:
-            return []
-
-        # Check if this event type is applicable to this business type
-        event_config = self.TEMPLATES[event_type]
-        if business.business_type not in event_config.get('business_types', []):
+        if not self.applies_to(article, business):
             return []
 
-        templates = event_config['templates']
+        event_type = article.event_type_detected
+        templates = self.TEMPLATES[event_type]['templates']
         recommendations = []
-        article_content_type = ContentType.objects.get_for_model(NewsArticle)
-
-        # Check for existing recommendations to avoid duplicates
-        # If recommendations already exist for this article-business pair, delete them
-        # (we're regenerating with potentially updated logic)
-        existing_recs = Recommendation.objects.filter(
-            business=business,
-            content_type=article_content_type,
-            object_id=article.id
-        )
-        if existing_recs.exists():
-            logger.info(f"Deleting {existing_recs.count()} existing recommendations for article {article.id}, business {business.id}")
-            existing_recs.delete()
+        article_content_type = self.article_content_type
+
+        # Existing recommendations for this article are replaced when the
+        # new ones are written (see RecommendationSink.flush)
 
         # Calculate days until event
         days_until_event = None
@@ -885,19 +1099,209 @@ class RecommendationGenerator:
         return recommendations
 
 
+class RecommendationSink:
+    """
+    Collects the recommendations generated for one article and writes them
+    in bulk
+
+    Regenerating an article replaces the recommendations of every business
+    added to the sink: stale rows of all of them are removed with one
+    DELETE and the new ones are inserted with one bulk_create, instead of
+    an exists/count/delete and a save per business.
+    """
+
+    def __init__(self, article: NewsArticle, content_type: ContentType):
+        self.article = article
+        self.content_type = content_type
+        self.business_ids = set()
+        self.recommendations: List[Recommendation] = []
+
+    def add(self, business: Business, recommendations: List[Recommendation]):
+        """
+        Queue the (possibly empty) recommendations of a business
+
+        Args:
+            business: Business the recommendations were generated for
+            recommendations: Unsaved Recommendation objects
+        """
+        self.business_ids.add(business.id)
+        self.recommendations.extend(recommendations)
+
+    def flush(self) -> int:
+        """
+        Replace the stored recommendations of the queued businesses
+
+        Returns:
+            Number of recommendations created
+        """
+        if not self.business_ids:
+            return 0
+
+        with transaction.atomic():
+            deleted, _ = Recommendation.objects.filter(
+                content_type=self.content_type,
+                object_id=self.article.id,
+                business_id__in=self.business_ids
+            ).delete()
+            created = Recommendation.objects.bulk_create(self.recommendations)
+
+        if deleted:
+            logger.info(
+                f"Replaced {deleted} existing recommendations for article {self.article.id} "
+                f"across {len(self.business_ids)} businesses"
+            )
+
+        self.business_ids = set()
+        self.recommendations = []
+        return len(created)
+
+
 class MLOrchestrator:
     """Main orchestrator for the complete ML pipeline"""
 
+    # event_type -> (category, subcategory)
+    CATEGORY_MAP = {
+        'sports_match': ('deportes', 'futbol'),
+        'marathon': ('deportes', 'atletismo'),
+        'concert': ('entretenimiento', 'musica'),
+        'festival': ('eventos', 'festival'),
+        'conference': ('negocios', 'conferencia'),
+        'exposition': ('cultura', 'exposicion'),
+        'food_event': ('gastronomia', 'festival-gastronomico'),
+        'cultural': ('cultura', 'evento-cultural'),
+        'nightlife': ('entretenimiento', 'vida-nocturna'),
+        'politics': ('comunidad', 'politica'),
+        'international': ('comunidad', 'internacional'),
+        'conflict': ('comunidad', 'seguridad'),
+        'crime': ('comunidad', 'seguridad'),
+    }
+
+    # Confidence of the reduced features set by a prescreen rejection
+    PRESCREEN_CONFIDENCE = 0.5
+
+    # Article fields written by each pipeline stage; process_article saves
+    # only the ones whose value changed (see _save_changed)
+    FEATURE_FIELDS = [
+        'event_type_detected', 'event_subtype', 'category', 'subcategory',
+        'primary_city', 'neighborhood', 'venue_name', 'event_country', 'colombian_involvement',
+        'event_start_datetime', 'event_end_datetime', 'event_duration_hours',
+        'expected_attendance', 'event_scale', 'extracted_keywords', 'entities',
+    ]
+    SUITABILITY_FIELDS = [
+        'business_suitability_score', 'features_extracted', 'feature_extraction_date',
+        'feature_extraction_confidence', 'feature_completeness_score', 'processing_error',
+    ]
+    LLM_FIELDS = [
+        'llm_features_extracted', 'llm_extraction_date', 'llm_extraction_results', 'extraction_comparison',
+    ]
+    BROADCASTABILITY_FIELDS = [
+        'sport_type', 'competition_level', 'broadcastability_score', 'hype_score', 'is_broadcastable',
+    ]
+    PIPELINE_FIELDS = FEATURE_FIELDS + SUITABILITY_FIELDS + LLM_FIELDS + BROADCASTABILITY_FIELDS
+
+    # Results of an earlier full run, reset to their defaults when a
+    # reprocessed article is rejected by the prescreen
+    PRESCREEN_CLEARED_FIELDS = [
+        'primary_city', 'neighborhood', 'venue_name', 'event_country', 'colombian_involvement',
+        'event_start_datetime', 'event_end_datetime', 'event_duration_hours',
+        'expected_attendance', 'event_scale', 'extracted_keywords', 'entities',
+    ] + LLM_FIELDS + BROADCASTABILITY_FIELDS
+
     def __init__(self):
-        self.nlp = NLPProcessor()
         self.feature_extractor = FeatureExtractor()
+        self.nlp = self.feature_extractor.nlp  # Share the profile-pruned model
         self.llm_extractor = LLMExtractor()
-        self.broadcastability_calc = BroadcastabilityCalculator()  # task-9.7
         self.prefilter = PreFilter()
         self.geo_matcher = GeographicMatcher()
         self.business_matcher = BusinessMatcher()
         self.rec_generator = RecommendationGenerator()
 
+    def warm_up(self):
+        """
+        Preload what the first article would otherwise pay for: a first
+        spaCy run, the compiled extraction patterns, the shared
+        broadcastability and business type taxonomies and the business
+        index (the model itself loads in __init__)
+        """
+        self.nlp.process_text(
+            'Concierto en el Estadio Atanasio Girardot de Medellín el 15 de marzo',
+            extractors=FeatureExtractor.NLP_EXTRACTORS
+        )
+        self.feature_extractor._load_patterns_cached()
+        BroadcastabilityCalculator.get_shared()
+        BusinessTypeScorer.get_shared()
+        BusinessIndex.get_shared()
+
+    @property
+    def broadcastability_calc(self) -> BroadcastabilityCalculator:
+        """Process-wide calculator, hot-reloaded on taxonomy edits (task-9.7)"""
+        return BroadcastabilityCalculator.get_shared()
+
+    @property
+    def type_scorer(self) -> BusinessTypeScorer:
+        """Process-wide business type scorer, rebuilt on business type edits"""
+        return BusinessTypeScorer.get_shared()
+
+    @property
+    def business_index(self) -> 'BusinessIndex':
+        """Process-wide candidate business index, rebuilt on Business saves"""
+        return BusinessIndex.get_shared()
+
+    @staticmethod
+    def save_type_relevance(
+        scores: List[Tuple[NewsArticle, List[Tuple[Any, Dict[str, Any]]]]]
+    ) -> int:
+        """
+        Upsert ArticleBusinessTypeRelevance rows for one or more articles
+
+        All rows are written with one bulk INSERT ... ON CONFLICT
+        (article, business_type) DO UPDATE; rows of business types an
+        article no longer scores for are removed with one DELETE.
+
+        Args:
+            scores: (article, [(BusinessType, result), ...]) pairs, results
+                    as returned by BusinessTypeScorer.score
+
+        Returns:
+            Number of rows written
+        """
+        from news.models import ArticleBusinessTypeRelevance
+
+        rows = []
+        stale = Q()
+        for article, results in scores:
+            stale |= Q(article=article) & ~Q(
+                business_type__in=[biz_type.id for biz_type, _ in results]
+            )
+            rows.extend(
+                ArticleBusinessTypeRelevance(
+                    article=article,
+                    business_type=biz_type,
+                    relevance_score=result['relevance_score'],
+                    suitability_component=result['suitability_component'],
+                    keyword_component=result['keyword_component'],
+                    event_scale_component=result['event_scale_component'],
+                    neighborhood_component=result['neighborhood_component'],
+                    matching_keywords=result['matching_keywords']
+                )
+                for biz_type, result in results
+            )
+
+        if stale:
+            ArticleBusinessTypeRelevance.objects.filter(stale).delete()
+        if rows:
+            ArticleBusinessTypeRelevance.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['article', 'business_type'],
+                update_fields=[
+                    'relevance_score', 'suitability_component', 'keyword_component',
+                    'event_scale_component', 'neighborhood_component',
+                    'matching_keywords', 'calculated_at',
+                ],
+            )
+        return len(rows)
+
     def _compare_extractions(self, spacy_features: Dict[str, Any], llm_features: Dict[str, Any]) -> Dict[str, Any]:
         """
         Compare spaCy and LLM extraction results
@@ -972,8 +1376,188 @@ class MLOrchestrator:
 
         return comparison
 
+    def _snapshot(self, article: NewsArticle) -> Dict[str, Any]:
+        """Values of the pipeline fields before processing"""
+        return {field: getattr(article, field) for field in self.PIPELINE_FIELDS}
+
+    def _save_changed(self, article: NewsArticle, original: Dict[str, Any]) -> List[str]:
+        """
+        Save only the pipeline fields that differ from the snapshot
+
+        Reprocessing an article mostly reproduces its previous results, so
+        this avoids rewriting unchanged columns (large JSON in particular).
+
+        Args:
+            article: NewsArticle object
+            original: Result of _snapshot() taken before processing
+
+        Returns:
+            Names of the fields written
+        """
+        changed = [
+            field for field in self.PIPELINE_FIELDS
+            if getattr(article, field) != original[field]
+        ]
+        if changed:
+            article.save(update_fields=changed + ['updated_at'])
+        return changed
+
+    def _set_category(self, article: NewsArticle):
+        """Set category and subcategory from the detected event type"""
+        if article.event_type_detected:
+            category, subcategory = self.CATEGORY_MAP.get(article.event_type_detected, ('comunidad', 'otros'))
+            article.category = category
+            article.subcategory = subcategory
+
+    def prescreen(self, article: NewsArticle) -> Optional[Dict[str, Any]]:
+        """
+        Regex-only first phase of process_article (see PreFilter.prescreen)
+
+        Args:
+            article: NewsArticle object
+
+        Returns:
+            Reduced features of a rejected article ('reason', 'event_type',
+            'event_subtype'), None if it needs the full pipeline
+        """
+        if not getattr(settings, 'ML_PRESCREEN_ENABLED', True):
+            return None
+
+        event_type, event_subtype = self.feature_extractor.extract_event_type(
+            self.prefilter.lead_text(article)
+        )
+        reason = self.prefilter.prescreen(article, event_type)
+        if reason is None:
+            return None
+
+        return {'reason': reason, 'event_type': event_type, 'event_subtype': event_subtype}
+
+    def _save_prescreened(self, article: NewsArticle, rejection: Dict[str, Any], save: bool) -> Dict[str, Any]:
+        """
+        Mark a prescreen-rejected article as processed with reduced features
+
+        Features, scores, type relevance rows and recommendations left by an
+        earlier full run are cleared, so they do not look current.
+
+        Args:
+            article: NewsArticle object
+            rejection: Result of prescreen()
+            save: Whether to save results to database
+
+        Returns:
+            Dictionary with processing results
+        """
+        original = self._snapshot(article)
+        for name in self.PRESCREEN_CLEARED_FIELDS:
+            field = article._meta.get_field(name)
+            setattr(article, field.attname, field.get_default())
+
+        article.event_type_detected = rejection['event_type'] or ''
+        article.event_subtype = rejection['event_subtype'] or ''
+        self._set_category(article)
+        article.business_suitability_score = 0.0
+
+        article.features_extracted = True
+        article.feature_extraction_date = timezone.now()
+        article.feature_extraction_confidence = self.PRESCREEN_CONFIDENCE
+        article.processing_error = ''
+
+        from news.utils import calculate_feature_completeness
+        article.feature_completeness_score = calculate_feature_completeness(article)
+
+        if save:
+            with transaction.atomic():
+                self._save_changed(article, original)
+                if original['features_extracted']:
+                    self._delete_derived_rows(article)
+
+        logger.info(f"Article {article.id} rejected by prescreen ({rejection['reason']}), skipping NLP")
+        return {
+            'success': True,
+            'processed': False,
+            'prescreened': True,
+            'reason': f"Prescreen rejected: {rejection['reason']}",
+            'features_extracted': True
+        }
+
+    def _delete_derived_rows(self, article: NewsArticle):
+        """Delete the type relevance rows and recommendations of an earlier run"""
+        from news.models import ArticleBusinessTypeRelevance
+
+        ArticleBusinessTypeRelevance.objects.filter(article=article).delete()
+        Recommendation.objects.filter(
+            content_type=self.rec_generator.article_content_type,
+            object_id=article.id
+        ).delete()
+
+    def process_articles(
+        self,
+        articles: List[NewsArticle],
+        save: bool = True,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process many articles, running spaCy over them with nlp.pipe.
+
+        Feature extraction is batched; the remaining steps (scoring,
+        LLM, recommendations) still run per article in their own transaction.
+
+        Args:
+            articles: NewsArticle objects to process
+            save: Whether to save results to database
+            batch_size: spaCy batch size (default: settings.ML_NLP_BATCH_SIZE)
+            n_process: spaCy processes (default: settings.ML_NLP_N_PROCESS)
+
+        Returns:
+            List of per-article result dictionaries (same shape as process_article)
+        """
+        articles = list(articles)
+        if batch_size is None:
+            batch_size = getattr(settings, 'ML_NLP_BATCH_SIZE', 50)
+        if n_process is None:
+            n_process = getattr(settings, 'ML_NLP_N_PROCESS', 1)
+
+        # Prescreen first so rejected articles never enter the spaCy batch
+        results: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        remaining = []
+        for position, article in enumerate(articles):
+            try:
+                rejection = self.prescreen(article)
+            except Exception as e:
+                logger.error(f"Prescreen failed for article {article.id}: {e}", exc_info=True)
+                rejection = None
+            if rejection:
+                results[position] = self._save_prescreened(article, rejection, save)
+            else:
+                remaining.append(position)
+
+        try:
+            features_list = self.feature_extractor.extract_batch(
+                [(articles[position].content, articles[position].title) for position in remaining],
+                batch_size=batch_size,
+                n_process=n_process
+            )
+        except Exception as e:
+            # Fall back to per-article extraction so one bad article can't sink the batch
+            logger.error(f"Batch feature extraction failed, extracting one by one: {e}", exc_info=True)
+            features_list = [None] * len(remaining)
+
+        for position, features in zip(remaining, features_list):
+            results[position] = self.process_article(
+                articles[position], save=save, features=features, prescreen=False
+            )
+
+        return results
+
     @transaction.atomic
-    def process_article(self, article: NewsArticle, save: bool = True) -> Dict[str, Any]:
+    def process_article(
+        self,
+        article: NewsArticle,
+        save: bool = True,
+        features: Optional[Dict[str, Any]] = None,
+        prescreen: bool = True
+    ) -> Dict[str, Any]:
         """
         Process a single article through the complete pipeline.
 
@@ -983,13 +1567,26 @@ class MLOrchestrator:
         Args:
             article: NewsArticle object
             save: Whether to save results to database
+            features: Features already extracted by a batch run
+                      (see process_articles); extracted here if omitted
+            prescreen: Run the regex-only prescreen before extraction
+                       (skipped when features are given)
 
         Returns:
             Dictionary with processing results
         """
+        original = self._snapshot(article)
+
         try:
+            # Step 0: Reject clearly irrelevant articles before running NLP
+            if prescreen and features is None:
+                rejection = self.prescreen(article)
+                if rejection:
+                    return self._save_prescreened(article, rejection, save)
+
             # Step 1: Extract features
-            features = self.feature_extractor.extract_all(article.content, article.title)
+            if features is None:
+                features = self.feature_extractor.extract_all(article.content, article.title)
 
             article.event_type_detected = features['event_type'] or ''
             article.event_subtype = features['event_subtype'] or ''
@@ -1011,26 +1608,7 @@ class MLOrchestrator:
             article.competition_level = features.get('competition_level', '') or ''
 
             # Map event_type to category and subcategory
-            category_map = {
-                'sports_match': ('deportes', 'futbol'),
-                'marathon': ('deportes', 'atletismo'),
-                'concert': ('entretenimiento', 'musica'),
-                'festival': ('eventos', 'festival'),
-                'conference': ('negocios', 'conferencia'),
-                'exposition': ('cultura', 'exposicion'),
-                'food_event': ('gastronomia', 'festival-gastronomico'),
-                'cultural': ('cultura', 'evento-cultural'),
-                'nightlife': ('entretenimiento', 'vida-nocturna'),
-                'politics': ('comunidad', 'politica'),
-                'international': ('comunidad', 'internacional'),
-                'conflict': ('comunidad', 'seguridad'),
-                'crime': ('comunidad', 'seguridad'),
-            }
-
-            if article.event_type_detected:
-                category, subcategory = category_map.get(article.event_type_detected, ('comunidad', 'otros'))
-                article.category = category
-                article.subcategory = subcategory
+            self._set_category(article)
 
             # Step 2: Calculate business suitability
             # Use primary business (business_id=1) for general suitability scoring
@@ -1118,8 +1696,9 @@ class MLOrchestrator:
                 article.hype_score = 0.0
                 article.is_broadcastable = False
 
+            # One save per article, of the fields that changed
             if save:
-                article.save()
+                self._save_changed(article, original)
 
             # Step 3: Early exit if not suitable
             if article.business_suitability_score < 0.3:
@@ -1131,68 +1710,42 @@ class MLOrchestrator:
                 }
 
             # Step 4: Calculate relevance for each business type
-            from businesses.models import BusinessType
-            from news.models import ArticleBusinessTypeRelevance
+            # All types scored in one pass (types below their suitability
+            # threshold are already left out)
+            relevance_results = self.type_scorer.score(article)
 
-            # Delete old scores (for reprocessing)
-            ArticleBusinessTypeRelevance.objects.filter(article=article).delete()
+            # Store in database: one upsert, replacing scores of a previous run
+            self.save_type_relevance([(article, relevance_results)])
 
-            business_types = BusinessType.objects.filter(is_active=True)
-            type_scores = {}
-
-            for biz_type in business_types:
-                # Check suitability threshold
-                if article.business_suitability_score < biz_type.min_suitability_threshold:
-                    continue
-
-                # Calculate relevance
-                result = self.business_matcher.calculate_relevance_for_type(article, biz_type)
-
-                # Store in database
-                ArticleBusinessTypeRelevance.objects.create(
-                    article=article,
-                    business_type=biz_type,
-                    relevance_score=result['relevance_score'],
-                    suitability_component=result['suitability_component'],
-                    keyword_component=result['keyword_component'],
-                    event_scale_component=result['event_scale_component'],
-                    neighborhood_component=result['neighborhood_component'],
-                    matching_keywords=result['matching_keywords']
-                )
-
-                type_scores[biz_type.code] = result['relevance_score']
+            type_scores = {
+                biz_type.code: result['relevance_score']
+                for biz_type, result in relevance_results
+            }
 
             # Step 5: Generate recommendations for matching businesses
             matching_businesses = []
+            business_index = self.business_index
 
-            for biz_type_code, relevance in type_scores.items():
-                biz_type = BusinessType.objects.get(code=biz_type_code)
+            for biz_type, result in relevance_results:
+                relevance = result['relevance_score']
 
                 # Only if relevance >= threshold
                 if relevance < biz_type.min_relevance_threshold:
                     continue
 
-                # Find businesses of this type
-                businesses = Business.objects.filter(
-                    business_type=biz_type,
-                    is_active=True
-                )
-
-                for business in businesses:
-                    # Geographic filter
-                    if not self.geo_matcher.is_relevant(article, business):
-                        continue
-
+                # Businesses of this type passing the geographic filter
+                for business in business_index.candidates(article, biz_type):
                     matching_businesses.append((business, relevance))
 
             # Step 6: Generate recommendations
             recommendations_created = 0
+            sink = RecommendationSink(article, self.rec_generator.article_content_type)
             for business, relevance in matching_businesses:
-                recs = self.rec_generator.generate(article, business, relevance)
-                if save:
-                    for rec in recs:
-                        rec.save()
-                        recommendations_created += 1
+                # Businesses without templates for this event keep their recommendations
+                if self.rec_generator.applies_to(article, business):
+                    sink.add(business, self.rec_generator.generate(article, business, relevance))
+            if save:
+                recommendations_created = sink.flush()
 
             return {
                 'success': True,
@@ -1209,7 +1762,7 @@ class MLOrchestrator:
             logger.error(f"Error processing article {article.id}: {e}")
             if save:
                 article.processing_error = str(e)
-                article.save()
+                article.save(update_fields=['processing_error', 'updated_at'])
             return {
                 'success': False,
                 'error': str(e)
@@ -7,7 +7,8 @@ Provides entity extraction, keyword extraction, and linguistic analysis.
 
 import spacy
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Union
+from spacy.tokens import Doc
 
 logger = logging.getLogger(__name__)
 
@@ -16,34 +17,119 @@ class NLPProcessor:
     """
     Singleton wrapper for spaCy Spanish NLP model.
     Loads model once and reuses for all processing.
+
+    Every extraction method accepts either raw text or an already parsed
+    Doc, so callers can parse an article once and share the Doc across
+    extractors. parse_count tracks how many times the pipeline ran.
+
+    One instance is kept per processing profile. A profile excludes the
+    pipeline components its extractors never use, which lowers model
+    memory and per-document latency:
+        - 'ner-only': entities only (extract_entities/locations/...)
+        - 'keywords': entities + POS/lemma for get_keywords
+        - 'full': whole pipeline (adds the parser for noun chunks)
     """
 
-    _instance = None
+    MODEL_NAME = 'es_core_news_md'
+
+    # All components shipped with es_core_news_md
+    MODEL_COMPONENTS = [
+        'tok2vec', 'morphologizer', 'parser', 'senter',
+        'attribute_ruler', 'lemmatizer', 'ner'
+    ]
+
+    # Components each extraction method needs (besides the tokenizer)
+    EXTRACTOR_COMPONENTS = {
+        'extract_entities': ['tok2vec', 'ner'],
+        'extract_locations': ['tok2vec', 'ner'],
+        'extract_organizations': ['tok2vec', 'ner'],
+        'extract_dates': ['tok2vec', 'ner'],
+        'extract_numbers': ['tok2vec', 'ner'],
+        'get_keywords': ['tok2vec', 'morphologizer', 'attribute_ruler', 'lemmatizer'],
+        'get_noun_chunks': ['tok2vec', 'morphologizer', 'parser'],
+    }
+
+    # Processing profiles, smallest first (None = keep whole pipeline)
+    PROFILES = {
+        'ner-only': ['tok2vec', 'ner'],
+        'keywords': ['tok2vec', 'morphologizer', 'attribute_ruler', 'lemmatizer', 'ner'],
+        'full': None,
+    }
+    DEFAULT_PROFILE = 'full'
+
+    _instances = {}
     _nlp = None
-
-    def __new__(cls):
-        """Singleton pattern to avoid loading model multiple times"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._load_model()
-        return cls._instance
+    parse_count = 0  # Number of spaCy pipeline runs for this instance
+
+    def __new__(cls, profile: Optional[str] = None):
+        """Singleton per profile to avoid loading model multiple times"""
+        profile = profile or cls.DEFAULT_PROFILE
+        if profile not in cls.PROFILES:
+            raise ValueError(
+                f"Unknown NLP profile '{profile}'. Choose one of: {', '.join(cls.PROFILES)}"
+            )
+
+        if profile not in cls._instances:
+            instance = super().__new__(cls)
+            instance.profile = profile
+            instance._load_model()
+            cls._instances[profile] = instance
+        return cls._instances[profile]
+
+    @classmethod
+    def components_for(cls, extractors: Iterable[str]) -> List[str]:
+        """Pipeline components needed by the given extraction methods"""
+        components = set()
+        for extractor in extractors:
+            components.update(cls.EXTRACTOR_COMPONENTS[extractor])
+        return [c for c in cls.MODEL_COMPONENTS if c in components]
+
+    @classmethod
+    def profile_for(cls, extractors: Iterable[str]) -> str:
+        """Smallest profile that keeps every component the extractors need"""
+        needed = set(cls.components_for(extractors))
+        for profile, components in cls.PROFILES.items():
+            if components is None or needed.issubset(components):
+                return profile
+        return 'full'
 
     def _load_model(self):
-        """Load Spanish spaCy model"""
+        """Load Spanish spaCy model, excluding components outside the profile"""
+        components = self.PROFILES[self.profile]
+        exclude = [] if components is None else [
+            c for c in self.MODEL_COMPONENTS if c not in components
+        ]
+
         try:
-            self._nlp = spacy.load('es_core_news_md')
-            logger.info("✅ Spanish NLP model loaded successfully")
+            self._nlp = spacy.load(self.MODEL_NAME, exclude=exclude)
+            logger.info(
+                f"✅ Spanish NLP model loaded successfully "
+                f"(profile: {self.profile}, pipes: {', '.join(self._nlp.pipe_names)})"
+            )
         except OSError as e:
             logger.error(f"❌ Failed to load Spanish model: {e}")
-            logger.error("Run: python -m spacy download es_core_news_md")
+            logger.error(f"Run: python -m spacy download {self.MODEL_NAME}")
             raise
 
-    def process_text(self, text: str) -> spacy.tokens.Doc:
+    def _enabled_pipes(self, extractors: Optional[Iterable[str]]) -> List[str]:
+        """Loaded pipes required by extractors (all loaded pipes if None)"""
+        if extractors is None:
+            return list(self._nlp.pipe_names)
+        needed = self.components_for(extractors)
+        return [name for name in self._nlp.pipe_names if name in needed]
+
+    def process_text(
+        self,
+        text: str,
+        extractors: Optional[Iterable[str]] = None
+    ) -> spacy.tokens.Doc:
         """
         Process text with spaCy pipeline
 
         Args:
             text: Input text to process
+            extractors: Extraction methods the Doc will be used for; other
+                        loaded components are skipped via select_pipes
 
         Returns:
             spaCy Doc object with linguistic annotations
@@ -51,14 +137,64 @@ class NLPProcessor:
         if not text or not isinstance(text, str):
             return None
 
-        return self._nlp(text[:1000000])  # Limit to 1M chars for safety
+        self.parse_count += 1
+        with self._nlp.select_pipes(enable=self._enabled_pipes(extractors)):
+            return self._nlp(text[:1000000])  # Limit to 1M chars for safety
+
+    def process_texts(
+        self,
+        texts: List[str],
+        batch_size: int = 50,
+        n_process: int = 1,
+        extractors: Optional[Iterable[str]] = None
+    ) -> List[Optional[Doc]]:
+        """
+        Process many texts in one batched spaCy run (nlp.pipe)
+
+        Args:
+            texts: Input texts to process
+            batch_size: Number of texts buffered per spaCy batch
+            n_process: Worker processes for spaCy (1 = in-process;
+                       >1 cannot be used inside daemonized Celery workers)
+            extractors: Extraction methods the Docs will be used for
+                        (see process_text)
 
-    def extract_entities(self, text: str) -> List[Dict[str, Any]]:
+        Returns:
+            List of Doc objects aligned with texts (None for empty/invalid text)
+        """
+        docs: List[Optional[Doc]] = [None] * len(texts)
+        valid = [
+            (idx, text[:1000000])  # Limit to 1M chars for safety
+            for idx, text in enumerate(texts)
+            if text and isinstance(text, str)
+        ]
+        if not valid:
+            return docs
+
+        indexes, valid_texts = zip(*valid)
+        with self._nlp.select_pipes(enable=self._enabled_pipes(extractors)):
+            parsed = self._nlp.pipe(valid_texts, batch_size=batch_size, n_process=n_process)
+            for idx, doc in zip(indexes, parsed):
+                docs[idx] = doc
+
+        self.parse_count += len(valid_texts)
+        return docs
+
+    def _as_doc(self, text: Union[str, Doc], extractor: Optional[str]) -> Optional[Doc]:
+        """
+        Return text as a Doc, running the pipeline only for raw strings
+        (restricted to extractor's components; whole pipeline if None)
+        """
+        if isinstance(text, Doc):
+            return text
+        return self.process_text(text, extractors=[extractor] if extractor else None)
+
+    def extract_entities(self, text: Union[str, Doc]) -> List[Dict[str, Any]]:
         """
         Extract named entities from text
 
         Args:
-            text: Input text
+            text: Input text or pre-parsed Doc
 
         Returns:
             List of entities with text, label, and start/end positions
@@ -67,7 +203,7 @@ class NLPProcessor:
                 {'text': 'Copa América', 'label': 'MISC', 'start': 15, 'end': 27}
             ]
         """
-        doc = self.process_text(text)
+        doc = self._as_doc(text, 'extract_entities')
         if not doc:
             return []
 
@@ -82,17 +218,17 @@ class NLPProcessor:
 
         return entities
 
-    def extract_locations(self, text: str) -> List[str]:
+    def extract_locations(self, text: Union[str, Doc]) -> List[str]:
         """
         Extract all location entities (LOC, GPE)
 
         Args:
-            text: Input text
+            text: Input text or pre-parsed Doc
 
         Returns:
             List of location names
         """
-        doc = self.process_text(text)
+        doc = self._as_doc(text, 'extract_locations')
         if not doc:
             return []
 
@@ -103,17 +239,17 @@ class NLPProcessor:
 
         return list(set(locations))  # Remove duplicates
 
-    def extract_organizations(self, text: str) -> List[str]:
+    def extract_organizations(self, text: Union[str, Doc]) -> List[str]:
         """
         Extract organization entities (for venue names, companies)
 
         Args:
-            text: Input text
+            text: Input text or pre-parsed Doc
 
         Returns:
             List of organization names
         """
-        doc = self.process_text(text)
+        doc = self._as_doc(text, 'extract_organizations')
         if not doc:
             return []
 
@@ -124,17 +260,17 @@ class NLPProcessor:
 
         return list(set(orgs))
 
-    def extract_dates(self, text: str) -> List[str]:
+    def extract_dates(self, text: Union[str, Doc]) -> List[str]:
         """
         Extract date/time entities
 
         Args:
-            text: Input text
+            text: Input text or pre-parsed Doc
 
         Returns:
             List of date/time expressions
         """
-        doc = self.process_text(text)
+        doc = self._as_doc(text, 'extract_dates')
         if not doc:
             return []
 
@@ -145,17 +281,17 @@ class NLPProcessor:
 
         return dates
 
-    def extract_numbers(self, text: str) -> List[str]:
+    def extract_numbers(self, text: Union[str, Doc]) -> List[str]:
         """
         Extract numeric entities (for attendance, capacity, etc.)
 
         Args:
-            text: Input text
+            text: Input text or pre-parsed Doc
 
         Returns:
             List of number expressions
         """
-        doc = self.process_text(text)
+        doc = self._as_doc(text, 'extract_numbers')
         if not doc:
             return []
 
@@ -166,34 +302,39 @@ class NLPProcessor:
 
         return numbers
 
-    def get_noun_chunks(self, text: str) -> List[str]:
+    def get_noun_chunks(self, text: Union[str, Doc]) -> List[str]:
         """
         Extract noun phrases (useful for venue names, event names)
 
         Args:
-            text: Input text
+            text: Input text or pre-parsed Doc
 
         Returns:
             List of noun phrases
         """
-        doc = self.process_text(text)
+        doc = self._as_doc(text, 'get_noun_chunks')
         if not doc:
             return []
 
+        # Noun chunks need the dependency parser (only in the 'full' profile)
+        if not doc.has_annotation('DEP'):
+            logger.warning(f"Noun chunks need the parser, not available in profile '{self.profile}'")
+            return []
+
         return [chunk.text for chunk in doc.noun_chunks]
 
-    def get_keywords(self, text: str, top_n: int = 10) -> List[str]:
+    def get_keywords(self, text: Union[str, Doc], top_n: int = 10) -> List[str]:
         """
         Extract most important keywords using TF-IDF-like approach
 
         Args:
-            text: Input text
+            text: Input text or pre-parsed Doc
             top_n: Number of keywords to return
 
         Returns:
             List of top keywords
         """
-        doc = self.process_text(text)
+        doc = self._as_doc(text, 'get_keywords')
         if not doc:
             return []
 
@@ -214,22 +355,25 @@ class NLPProcessor:
         # Return top N most common
         return [word for word, count in keyword_counts.most_common(top_n)]
 
-    def analyze_text(self, text: str) -> Dict[str, Any]:
+    def analyze_text(self, text: Union[str, Doc]) -> Dict[str, Any]:
         """
         Comprehensive text analysis with all features
 
         Args:
-            text: Input text
+            text: Input text or pre-parsed Doc
 
         Returns:
             Dictionary with all extracted features
         """
+        # Parse once and share the Doc across every extraction
+        doc = self._as_doc(text, None)
+
         return {
-            'entities': self.extract_entities(text),
-            'locations': self.extract_locations(text),
-            'organizations': self.extract_organizations(text),
-            'dates': self.extract_dates(text),
-            'numbers': self.extract_numbers(text),
-            'keywords': self.get_keywords(text, top_n=15),
-            'noun_chunks': self.get_noun_chunks(text)[:20]  # Limit to 20
+            'entities': self.extract_entities(doc),
+            'locations': self.extract_locations(doc),
+            'organizations': self.extract_organizations(doc),
+            'dates': self.extract_dates(doc),
+            'numbers': self.extract_numbers(doc),
+            'keywords': self.get_keywords(doc, top_n=15),
+            'noun_chunks': self.get_noun_chunks(doc)[:20]  # Limit to 20
         }
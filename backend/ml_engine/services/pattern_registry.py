@@ -0,0 +1,288 @@
+"""
+Pattern Registry
+
+Shared registry of precompiled regex tables.
+
+The hardcoded pattern tables of FeatureExtractor and PreFilter are
+compiled once (at import) and registered by name, so a bad pattern fails
+at import and tests can check each table. Each table exposes the match and
+count helpers the extractors need. This is not a speedup on its own: re
+already caches compiled string patterns (scripts/benchmark_regex_patterns.py
+measures the two within noise).
+
+PatternScanner covers large, curated pattern sets (ExtractionPattern):
+one literal pass over the text (LiteralScanner) selects the patterns that
+can match, and only those are counted.
+"""
+
+import re
+import logging
+from re import _constants as sre_constants
+from re import _parser as sre_parse
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PatternTable:
+    """Ordered list of compiled patterns with match/count helpers"""
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0):
+        self.sources = list(patterns)
+        self.flags = flags
+        self.compiled = [re.compile(pattern, flags) for pattern in self.sources]
+
+    def __len__(self) -> int:
+        return len(self.compiled)
+
+    def __iter__(self) -> Iterator[re.Pattern]:
+        return iter(self.compiled)
+
+    def first_match(self, text: str) -> Tuple[Optional[int], Optional[re.Match]]:
+        """
+        Find the first pattern (in table order) that matches text
+
+        Returns:
+            (pattern index, match object) or (None, None) if nothing matches
+        """
+        for idx, pattern in enumerate(self.compiled):
+            match = pattern.search(text)
+            if match:
+                return idx, match
+        return None, None
+
+    def search(self, text: str) -> Optional[re.Match]:
+        """First match object in table order, or None"""
+        return self.first_match(text)[1]
+
+    def matches(self, text: str) -> bool:
+        """True if any pattern matches text"""
+        return any(pattern.search(text) for pattern in self.compiled)
+
+    def count(self, text: str) -> int:
+        """Number of patterns that match text at least once"""
+        return sum(1 for pattern in self.compiled if pattern.search(text))
+
+    def count_all(self, text: str) -> int:
+        """Total number of matches of all patterns (same as summing re.findall)"""
+        return sum(
+            sum(1 for _ in pattern.finditer(text))
+            for pattern in self.compiled
+        )
+
+
+class PatternRegistry:
+    """
+    Process-wide registry of named PatternTables
+
+    Tables are compiled on first registration and reused afterwards;
+    registering the same name again returns the existing table.
+    """
+
+    _tables: Dict[str, PatternTable] = {}
+
+    @classmethod
+    def register(cls, name: str, patterns: Iterable[str], flags: int = 0) -> PatternTable:
+        """Compile and register a table (no-op if name is already registered)"""
+        if name not in cls._tables:
+            cls._tables[name] = PatternTable(patterns, flags)
+            logger.debug(f"Compiled pattern table '{name}' ({len(cls._tables[name])} patterns)")
+        return cls._tables[name]
+
+    @classmethod
+    def get(cls, name: str) -> PatternTable:
+        """Get a registered table (KeyError if not registered)"""
+        return cls._tables[name]
+
+    @classmethod
+    def names(cls) -> List[str]:
+        """Names of all registered tables"""
+        return sorted(cls._tables)
+
+
+class LiteralScanner:
+    """
+    Finds which of many literal strings occur in a text, in one pass
+
+    The literals are merged into one trie-shaped regex (an Aho-Corasick
+    style automaton) that is tried at every position of the text, so
+    overlapping and nested occurrences are all reported.
+    """
+
+    def __init__(self, literals: Iterable[str]):
+        self.literals = set(literal for literal in literals if literal)
+
+        # Every literal found at a position also implies its shorter
+        # prefixes there (the trie reports the longest one only)
+        self._implied = {
+            literal: [literal[:i] for i in range(1, len(literal) + 1)
+                      if literal[:i] in self.literals]
+            for literal in self.literals
+        }
+        self._regex = (
+            re.compile(f'(?=({self._trie_regex(self.literals)}))')
+            if self.literals else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.literals)
+
+    def find(self, text: str) -> Set[str]:
+        """Literals that occur in text (same as {l for l in literals if l in text})"""
+        if self._regex is None:
+            return set()
+        found = set()
+        for longest in {match.group(1) for match in self._regex.finditer(text)}:
+            found.update(self._implied[longest])
+        return found
+
+    @staticmethod
+    def _trie_regex(literals: Iterable[str]) -> str:
+        """Regex matching the longest of literals at a position, shaped as a trie"""
+        trie: Dict[str, dict] = {}
+        for literal in literals:
+            node = trie
+            for char in literal:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def build(node: Dict[str, dict]) -> str:
+            branches = [
+                re.escape(char) + build(child)
+                for char, child in sorted(node.items()) if char
+            ]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            return f'(?:{body})?' if '' in node else body
+
+        return build(trie)
+
+
+class PatternScanner:
+    """
+    Single-pass scanner for many weighted regex patterns
+
+    Every pattern is reduced (at build time) to the literal strings one of
+    which must appear in any of its matches, e.g. r'partido\\s+de\\s+f[uú]tbol'
+    -> {'partido'}, r'homicidio|crimen|robo' -> {'homicidio', 'crimen', 'robo'}.
+    A LiteralScanner reports every literal present in one pass over the
+    text. Only patterns whose literals were found, plus the few without
+    any required literal, are then counted with findall, so the counts
+    are exactly those of running every pattern on its own.
+
+    A single alternation of all patterns with named groups cannot be used:
+    it only reports the leftmost alternative at each position, losing
+    overlapping matches of other patterns, and Python's re does not
+    optimize large alternations.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]], flags: int = 0):
+        """
+        Args:
+            patterns: (regex, key) pairs; key is returned with the counts
+            flags: re flags used to compile every pattern
+        """
+        self.entries: List[Tuple[re.Pattern, Any]] = []
+        self._ungated: List[int] = []
+        self._by_literal: Dict[str, List[int]] = {}
+
+        for pattern, key in patterns:
+            try:
+                compiled = re.compile(pattern, flags)
+            except re.error as e:
+                logger.warning(f"Invalid regex pattern skipped: {pattern} - {e}")
+                continue
+
+            idx = len(self.entries)
+            self.entries.append((compiled, key))
+
+            literals = self.required_literals(pattern, flags)
+            if literals is None:
+                self._ungated.append(idx)
+            else:
+                for literal in literals:
+                    self._by_literal.setdefault(literal, []).append(idx)
+
+        self._literal_scanner = LiteralScanner(self._by_literal)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def candidates(self, text: str) -> List[int]:
+        """Indexes (in pattern order) of the patterns that may match text"""
+        candidates = set(self._ungated)
+        for literal in self._literal_scanner.find(text):
+            candidates.update(self._by_literal[literal])
+        return sorted(candidates)
+
+    def scan(self, text: str) -> List[Tuple[Any, int]]:
+        """
+        Count the matches of every pattern in text
+
+        Returns:
+            (key, match count) for each pattern with at least one match,
+            in pattern order (counts equal len(re.findall(pattern, text)))
+        """
+        hits = []
+        for idx in self.candidates(text):
+            compiled, key = self.entries[idx]
+            count = sum(1 for _ in compiled.finditer(text))
+            if count:
+                hits.append((key, count))
+        return hits
+
+    @classmethod
+    def required_literals(cls, pattern: str, flags: int = 0) -> Optional[Set[str]]:
+        """
+        Literals one of which occurs in every match of pattern
+        (None if no such set can be derived, e.g. case-insensitive patterns)
+        """
+        try:
+            parsed = sre_parse.parse(pattern, flags)
+        except re.error:
+            return None
+        if parsed.state.flags & re.IGNORECASE:
+            return None
+        return cls._required(list(parsed))
+
+    @classmethod
+    def _required(cls, items) -> Optional[Set[str]]:
+        """Required literal set for a parsed sequence (see required_literals)"""
+        if len(items) == 1:
+            op, av = items[0]
+            if op is sre_constants.BRANCH:
+                literals = set()
+                for branch in av[1]:
+                    branch_literals = cls._required(list(branch))
+                    if not branch_literals:
+                        return None
+                    literals |= branch_literals
+                return literals
+            if op is sre_constants.SUBPATTERN:
+                _, add_flags, _, sub = av
+                if add_flags & re.IGNORECASE:
+                    return None
+                return cls._required(list(sub))
+
+        # Longest run of consecutive literal characters
+        runs, current = [], []
+        for op, av in items:
+            if op is sre_constants.LITERAL:
+                current.append(chr(av))
+                continue
+            if current:
+                runs.append(''.join(current))
+                current = []
+            if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] >= 1:
+                sub_literals = cls._required(list(av[2]))
+                if sub_literals and len(sub_literals) == 1:
+                    runs.append(next(iter(sub_literals)))
+            elif op is sre_constants.SUBPATTERN and not av[1] & re.IGNORECASE:
+                sub_literals = cls._required(list(av[3]))
+                if sub_literals and len(sub_literals) == 1:
+                    runs.append(next(iter(sub_literals)))
+        if current:
+            runs.append(''.join(current))
+
+        return {max(runs, key=len)} if runs else None
@@ -0,0 +1 @@
+# Tests for ml_engine app
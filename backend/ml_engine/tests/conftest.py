@@ -0,0 +1,116 @@
+"""
+Shared fixtures for ml_engine tests
+
+The real es_core_news_md model is not needed: a blank Spanish pipeline
+with an entity ruler gives deterministic entities for the extractors.
+"""
+import pytest
+import spacy
+from django.utils import timezone
+
+from ml_engine.services.nlp_processor import NLPProcessor
+
+
+ENTITY_PATTERNS = [
+    {'label': 'LOC', 'pattern': 'Medellín'},
+    {'label': 'LOC', 'pattern': 'Bogotá'},
+    {'label': 'ORG', 'pattern': [{'LOWER': 'estadio'}, {'LOWER': 'atanasio'}, {'LOWER': 'girardot'}]},
+    {'label': 'DATE', 'pattern': [{'LIKE_NUM': True}, {'LOWER': 'de'}, {'LOWER': 'diciembre'}]},
+]
+
+
+@pytest.fixture
+def blank_nlp():
+    """Blank Spanish spaCy pipeline with a small entity ruler"""
+    nlp = spacy.blank('es')
+    ruler = nlp.add_pipe('entity_ruler', name='ner')
+    ruler.add_patterns(ENTITY_PATTERNS)
+    return nlp
+
+
+@pytest.fixture
+def nlp_processor(monkeypatch, blank_nlp):
+    """NLPProcessor singleton backed by the blank pipeline (FeatureExtractor profile)"""
+    monkeypatch.setattr(NLPProcessor, '_instances', {})
+    monkeypatch.setattr(NLPProcessor, '_load_model', lambda self: setattr(self, '_nlp', blank_nlp))
+    return NLPProcessor(profile='keywords')
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    """Local-memory cache instead of Redis (not available in tests)"""
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'ml-engine-tests',
+        }
+    }
+    from django.core.cache import cache
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_instances(monkeypatch):
+    """Fresh process-wide instances (get_shared) for every test"""
+    from ml_engine.services.broadcastability_calculator import BroadcastabilityCalculator
+    from ml_engine.services.business_type_scorer import BusinessTypeScorer
+    from ml_engine.services.ml_pipeline import BusinessIndex
+
+    for shared_cls in (BroadcastabilityCalculator, BusinessTypeScorer, BusinessIndex):
+        monkeypatch.setattr(shared_cls, '_shared', None)
+        monkeypatch.setattr(shared_cls, '_shared_version', None)
+
+
+@pytest.fixture
+def news_source(db):
+    from news.models import NewsSource
+    return NewsSource.objects.create(name='El Colombiano', source_type='newspaper', country='CO')
+
+
+@pytest.fixture
+def news_article(news_source):
+    """
+    Saved article; features_extracted=True keeps the post_save signal from
+    queueing the Celery task (no broker in tests)
+    """
+    from news.models import NewsArticle
+    return NewsArticle.objects.create(
+        source=news_source,
+        title='Partido de fútbol en el bar',
+        content='Transmisión del clásico con cerveza, música en vivo y comida típica.',
+        url='https://example.com/partido',
+        published_date=timezone.now(),
+        business_suitability_score=0.8,
+        event_scale='large',
+        features_extracted=True,
+    )
+
+
+@pytest.fixture
+def business_types(db):
+    """pub, restaurant and bookstore types with a few keywords each"""
+    from businesses.models import BusinessType, BusinessTypeKeyword
+
+    pub = BusinessType.objects.create(
+        code='pub', display_name='Pub', display_name_es='Pub',
+        keyword_weight=0.3, min_suitability_threshold=0.4
+    )
+    restaurant = BusinessType.objects.create(
+        code='restaurant', display_name='Restaurant', display_name_es='Restaurante',
+        event_scale_weight=0.1, min_suitability_threshold=0.5
+    )
+    bookstore = BusinessType.objects.create(
+        code='bookstore', display_name='Bookstore', display_name_es='Librería',
+        min_suitability_threshold=0.9
+    )
+    for biz_type, keyword, weight in [
+        (pub, 'Fútbol', 0.3), (pub, 'cerveza', 0.25), (pub, 'clásico', 0.6),
+        (pub, 'karaoke', 0.2),
+        (restaurant, 'comida', 0.2), (restaurant, 'comida típica', 0.15),
+        (bookstore, 'libro', 0.3),
+    ]:
+        BusinessTypeKeyword.objects.create(business_type=biz_type, keyword=keyword, weight=weight)
+    BusinessTypeKeyword.objects.create(business_type=restaurant, keyword='bar', is_active=False)
+    return [pub, restaurant, bookstore]
@@ -0,0 +1,38 @@
+"""
+Tests for the process-wide BroadcastabilityCalculator registry
+"""
+import pytest
+
+from event_taxonomy import cache as taxonomy_cache
+from event_taxonomy.models import SportType
+from ml_engine.services.broadcastability_calculator import BroadcastabilityCalculator
+
+
+@pytest.mark.django_db
+class TestSharedCalculator:
+
+    def test_loaded_once_per_process(self, django_assert_num_queries):
+        first = BroadcastabilityCalculator.get_shared()
+
+        with django_assert_num_queries(0):
+            second = BroadcastabilityCalculator.get_shared()
+
+        assert first is second
+
+    def test_hot_reload_on_version_bump(self, django_capture_on_commit_callbacks):
+        calculator = BroadcastabilityCalculator.get_shared()
+        assert 'soccer' not in calculator.sport_types
+
+        with django_capture_on_commit_callbacks(execute=True):
+            SportType.objects.create(
+                code='soccer', name_es='Fútbol', name_en='Soccer',
+                latin_america_appeal=0.95, keywords=['fútbol']
+            )
+
+        reloaded = BroadcastabilityCalculator.get_shared()
+
+        assert reloaded is calculator
+        assert 'soccer' in reloaded.sport_types
+        assert BroadcastabilityCalculator._shared_version == taxonomy_cache.get_version(
+            taxonomy_cache.BROADCASTABILITY
+        )
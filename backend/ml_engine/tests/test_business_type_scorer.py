@@ -0,0 +1,72 @@
+"""
+Tests for vectorized business type relevance scoring
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from businesses.models import BusinessTypeKeyword
+from event_taxonomy import cache as taxonomy_cache
+from ml_engine.services.business_type_scorer import BusinessTypeScorer
+from ml_engine.services.ml_pipeline import BusinessMatcher
+
+
+def make_article(**overrides):
+    fields = {
+        'title': 'Partido de fútbol en el bar',
+        'content': 'Transmisión del clásico con cerveza, música en vivo y comida típica.',
+        'business_suitability_score': 0.8,
+        'event_scale': 'large',
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.mark.django_db
+class TestBusinessTypeScorer:
+
+    @pytest.mark.parametrize('article', [
+        make_article(),
+        make_article(event_scale='massive', business_suitability_score=0.95),
+        make_article(title='Feria del libro', content='Lectura de un libro', event_scale='small'),
+    ])
+    def test_matches_per_type_calculation(self, business_types, article):
+        matcher = BusinessMatcher()
+        expected = {
+            biz_type.code: matcher.calculate_relevance_for_type(article, biz_type)
+            for biz_type in business_types
+            if article.business_suitability_score >= biz_type.min_suitability_threshold
+        }
+
+        scored = {biz_type.code: result for biz_type, result in BusinessTypeScorer().score(article)}
+
+        assert scored.keys() == expected.keys()
+        for code, result in scored.items():
+            assert result['matching_keywords'] == expected[code]['matching_keywords']
+            for field in ['relevance_score', 'suitability_component', 'keyword_component',
+                          'event_scale_component', 'neighborhood_component']:
+                assert result[field] == pytest.approx(expected[code][field])
+
+    def test_scoring_needs_no_queries(self, business_types, django_assert_num_queries):
+        scorer = BusinessTypeScorer()
+
+        with django_assert_num_queries(0):
+            results = scorer.score(make_article())
+
+        assert [biz_type.code for biz_type, _ in results] == ['pub', 'restaurant']
+
+    def test_shared_scorer_rebuilt_on_version_bump(self, business_types,
+                                                  django_capture_on_commit_callbacks):
+        scorer = BusinessTypeScorer.get_shared()
+        assert 'karaoke' in scorer.keywords
+
+        with django_capture_on_commit_callbacks(execute=True):
+            BusinessTypeKeyword.objects.filter(keyword='karaoke').delete()
+            BusinessTypeKeyword.objects.create(business_type=business_types[0], keyword='tarima')
+
+        assert BusinessTypeScorer.get_shared() is scorer
+        assert 'karaoke' not in scorer.keywords
+        assert 'tarima' in scorer.keywords
+        assert BusinessTypeScorer._shared_version == taxonomy_cache.get_version(
+            taxonomy_cache.BUSINESS_TYPES
+        )
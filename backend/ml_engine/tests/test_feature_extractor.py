@@ -0,0 +1,100 @@
+"""
+Tests for FeatureExtractor single-parse Doc reuse and batch extraction
+"""
+import pytest
+
+from ml_engine.services.feature_extractor import FeatureExtractor
+
+
+ARTICLE_TITLE = 'Gran concierto en Medellín'
+ARTICLE_CONTENT = (
+    'El concierto será el 20 de diciembre en el Estadio Atanasio Girardot '
+    'de Medellín. Se esperan más de 40.000 personas durante 3 horas.'
+)
+
+
+@pytest.mark.django_db
+class TestSingleParse:
+    """extract_all must run the spaCy pipeline once per article"""
+
+    def test_extract_all_parses_once(self, nlp_processor):
+        extractor = FeatureExtractor()
+
+        features = extractor.extract_all(ARTICLE_CONTENT, ARTICLE_TITLE)
+
+        assert features['nlp_parse_count'] == 1
+        assert nlp_processor.parse_count == 1
+
+    def test_shared_doc_features(self, nlp_processor):
+        extractor = FeatureExtractor()
+
+        features = extractor.extract_all(ARTICLE_CONTENT, ARTICLE_TITLE)
+
+        assert features['city'] == 'Medellín'
+        assert features['venue'] == 'Estadio Atanasio Girardot'
+        assert {'text': 'Medellín', 'label': 'LOC'}.items() <= features['entities'][0].items()
+
+    def test_parse_count_is_per_article(self, nlp_processor):
+        extractor = FeatureExtractor()
+
+        first = extractor.extract_all(ARTICLE_CONTENT, ARTICLE_TITLE)
+        second = extractor.extract_all('Feria del libro en Bogotá', 'Feria')
+
+        assert first['nlp_parse_count'] == 1
+        assert second['nlp_parse_count'] == 1
+        assert nlp_processor.parse_count == 2
+
+    def test_given_doc_is_not_counted(self, nlp_processor):
+        extractor = FeatureExtractor()
+        doc = nlp_processor.process_text(extractor.build_text(ARTICLE_CONTENT, ARTICLE_TITLE))
+
+        features = extractor.extract_all(ARTICLE_CONTENT, ARTICLE_TITLE, doc=doc)
+
+        assert features['nlp_parse_count'] == 0
+        assert nlp_processor.parse_count == 1
+
+    def test_nlp_methods_reuse_given_doc(self, nlp_processor):
+        doc = nlp_processor.process_text(ARTICLE_CONTENT)
+
+        assert nlp_processor.extract_locations(doc) == ['Medellín']
+        assert nlp_processor.extract_organizations(doc) == ['Estadio Atanasio Girardot']
+        assert nlp_processor.extract_dates(doc) == ['20 de diciembre']
+        nlp_processor.extract_entities(doc)
+        nlp_processor.get_keywords(doc)
+
+        assert nlp_processor.parse_count == 1
+
+
+@pytest.mark.django_db
+class TestBatchExtraction:
+    """extract_batch must parse N articles with one nlp.pipe run"""
+
+    ARTICLES = [
+        (ARTICLE_CONTENT, ARTICLE_TITLE),
+        ('Feria del libro el 5 de diciembre en Bogotá', 'Feria del libro'),
+        ('Festival gastronómico con chef invitados', 'Festival'),
+    ]
+
+    def test_batch_matches_single_extraction(self, nlp_processor):
+        extractor = FeatureExtractor()
+
+        batch = extractor.extract_batch(self.ARTICLES, batch_size=2)
+        single = [extractor.extract_all(text, title) for text, title in self.ARTICLES]
+
+        assert len(batch) == len(self.ARTICLES)
+        for batch_features, single_features in zip(batch, single):
+            assert batch_features == single_features
+
+    def test_batch_parses_each_article_once(self, nlp_processor):
+        extractor = FeatureExtractor()
+
+        features = extractor.extract_batch(self.ARTICLES)
+
+        assert nlp_processor.parse_count == len(self.ARTICLES)
+        assert [f['nlp_parse_count'] for f in features] == [1, 1, 1]
+
+    def test_process_texts_keeps_alignment(self, nlp_processor):
+        docs = nlp_processor.process_texts(['Medellín', '', None, 'Bogotá'])
+
+        assert [doc.text if doc else None for doc in docs] == ['Medellín', None, None, 'Bogotá']
+        assert nlp_processor.parse_count == 2
@@ -0,0 +1,369 @@
+"""
+Tests for MLOrchestrator persistence steps
+"""
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from businesses.models import Business
+from ml_engine.services.business_type_scorer import BusinessTypeScorer
+from ml_engine.services.ml_pipeline import (
+    BusinessIndex, GeographicMatcher, MLOrchestrator, PreFilter, RecommendationGenerator, RecommendationSink
+)
+from news.models import ArticleBusinessTypeRelevance, NewsArticle
+from recommendations.models import Recommendation
+
+
+@pytest.mark.django_db
+class TestSaveTypeRelevance:
+
+    def test_single_upsert_statement(self, news_article, business_types, django_assert_num_queries):
+        results = BusinessTypeScorer().score(news_article)
+
+        # One DELETE for stale rows + one INSERT ... ON CONFLICT DO UPDATE
+        with django_assert_num_queries(2):
+            written = MLOrchestrator.save_type_relevance([(news_article, results)])
+
+        assert written == 2
+        rows = {
+            row.business_type.code: row
+            for row in ArticleBusinessTypeRelevance.objects.filter(article=news_article)
+        }
+        assert rows.keys() == {'pub', 'restaurant'}
+        assert rows['pub'].matching_keywords == ['Fútbol', 'cerveza', 'clásico']
+
+    def test_reprocessing_updates_and_removes_stale_rows(self, news_article, business_types):
+        pub, restaurant, _ = business_types
+        MLOrchestrator.save_type_relevance([(news_article, BusinessTypeScorer().score(news_article))])
+        first_ids = set(
+            ArticleBusinessTypeRelevance.objects.filter(article=news_article).values_list('id', flat=True)
+        )
+
+        # Restaurant no longer reaches its suitability threshold
+        news_article.business_suitability_score = 0.45
+        results = BusinessTypeScorer().score(news_article)
+        MLOrchestrator.save_type_relevance([(news_article, results)])
+
+        rows = list(ArticleBusinessTypeRelevance.objects.filter(article=news_article))
+        assert [row.business_type_id for row in rows] == [pub.id]
+        assert rows[0].id in first_ids  # Updated in place
+        assert rows[0].relevance_score == pytest.approx(results[0][1]['relevance_score'])
+
+
+@pytest.fixture
+def businesses(business_types):
+    """Pubs and restaurants across cities with different geographic preferences"""
+    pub, restaurant, _ = business_types
+    owner = User.objects.create_user(username='owner', password='secret')
+    # Pub Medellín (El Poblado, 2 km) only wants events near it
+    specs = [
+        ('Pub Medellín', pub, 'medellin', True, True, True, (6.2086, -75.5659, 2.0, False)),
+        ('Pub Bogotá', pub, 'bogota', True, False, True, None),
+        ('Pub Cartagena', pub, 'cartagena', False, True, True, None),
+        ('Pub cerrado', pub, 'medellin', True, True, False, None),
+        ('Restaurante Medellín', restaurant, 'medellin', False, True, True, (6.2442, -75.5905, 5.0, True)),
+        ('Restaurante Barranquilla', restaurant, 'barranquilla', False, False, True, None),
+    ]
+    created = []
+    for name, biz_type, city, has_tv_screens, include_national_events, is_active, geo in specs:
+        latitude, longitude, radius, citywide = geo or (None, None, 5.0, True)
+        created.append(Business.objects.create(
+            owner=owner, name=name, business_type=biz_type, city=city,
+            has_tv_screens=has_tv_screens, include_national_events=include_national_events,
+            is_active=is_active, latitude=latitude, longitude=longitude,
+            geographic_radius_km=radius, include_citywide_events=citywide
+        ))
+    return created
+
+
+@pytest.mark.django_db
+class TestBusinessIndex:
+
+    @pytest.mark.parametrize('features', [
+        {'event_country': 'Colombia', 'primary_city': 'Medellín', 'event_scale': 'large'},
+        {'event_country': 'Colombia', 'primary_city': 'Bogotá', 'event_scale': 'small'},
+        {'event_country': 'Argentina', 'colombian_involvement': True, 'event_type_detected': 'sports_match'},
+        {'event_country': 'Argentina', 'colombian_involvement': False},
+        {'event_country': ''},
+        # Geolocated: El Poblado, Envigado (outside Medellín), Medellín centre
+        {'event_country': 'Colombia', 'primary_city': 'Medellín', 'latitude': 6.2100, 'longitude': -75.5670},
+        {'event_country': 'Colombia', 'primary_city': 'Envigado', 'event_scale': 'small',
+         'latitude': 6.1950, 'longitude': -75.5750},
+        {'event_country': 'Colombia', 'primary_city': 'Medellín', 'event_scale': 'small',
+         'latitude': 6.2518, 'longitude': -75.5636},
+    ])
+    def test_same_candidates_as_per_business_check(self, news_article, businesses, business_types, features):
+        for field, value in features.items():
+            setattr(news_article, field, value)
+        index = BusinessIndex()
+        geo_matcher = GeographicMatcher()
+
+        for biz_type in business_types:
+            expected = {
+                business.id
+                for business in Business.objects.filter(business_type=biz_type, is_active=True)
+                if geo_matcher.is_relevant(news_article, business)
+            }
+            assert {business.id for business in index.candidates(news_article, biz_type)} == expected
+
+    def test_radius_matching(self, news_article, businesses, business_types):
+        pub, restaurant, _ = business_types
+        index = BusinessIndex()
+        news_article.event_country = 'Colombia'
+        news_article.event_scale = 'small'
+
+        # Envigado is another city, but within 2 km of the Poblado pub
+        news_article.primary_city = 'Envigado'
+        news_article.latitude, news_article.longitude = 6.1950, -75.5750
+        assert [business.name for business in index.candidates(news_article, pub)] == ['Pub Medellín']
+        assert index.candidates(news_article, restaurant) == []
+
+        # Medellín centre is outside its radius and it opted out of citywide events
+        news_article.primary_city = 'Medellín'
+        news_article.latitude, news_article.longitude = 6.2518, -75.5636
+        assert index.candidates(news_article, pub) == []
+        assert [business.name for business in index.candidates(news_article, restaurant)] == [
+            'Restaurante Medellín'
+        ]
+
+    def test_lookup_does_not_query(self, news_article, businesses, business_types, django_assert_num_queries):
+        pub, _, _ = business_types
+        news_article.event_country = 'Colombia'
+        news_article.primary_city = 'Medellín'
+        news_article.event_scale = 'small'
+        index = BusinessIndex()
+
+        with django_assert_num_queries(0):
+            candidates = index.candidates(news_article, pub)
+
+        assert [business.name for business in candidates] == ['Pub Medellín']
+        assert candidates[0].business_type == pub  # Loaded with the index
+
+    def test_rebuilt_on_business_save(self, news_article, businesses, business_types,
+                                      django_capture_on_commit_callbacks):
+        pub, _, _ = business_types
+        news_article.event_country = 'Colombia'
+        news_article.primary_city = 'Medellín'
+        news_article.event_scale = 'small'
+        index = BusinessIndex.get_shared()
+        closed_pub = businesses[3]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            closed_pub.is_active = True
+            closed_pub.save()
+
+        assert BusinessIndex.get_shared() is index
+        assert {business.name for business in index.candidates(news_article, pub)} == {
+            'Pub Medellín', 'Pub cerrado'
+        }
+
+
+@pytest.mark.django_db
+class TestRecommendationSink:
+
+    @pytest.fixture
+    def sports_article(self, news_article):
+        news_article.event_type_detected = 'sports_match'
+        return news_article
+
+    @staticmethod
+    def recommendations(generator, article, business):
+        """Three unsaved recommendations, as generate() builds them"""
+        return [
+            Recommendation(
+                business=business, content_type=generator.article_content_type, object_id=article.id,
+                title=f'Campaña de marketing {number}', description='Promoción especial para el partido.',
+                category='marketing', action_type='create_promotion', priority='high',
+                confidence_score=0.8, impact_score=0.7,
+            )
+            for number in range(3)
+        ]
+
+    def write(self, article, businesses):
+        generator = RecommendationGenerator()
+        sink = RecommendationSink(article, generator.article_content_type)
+        for business in businesses:
+            sink.add(business, self.recommendations(generator, article, business))
+        return sink.flush()
+
+    def test_generate_matches_business_type_code(self, sports_article, businesses, django_assert_num_queries):
+        generator = RecommendationGenerator()
+        generator.article_content_type  # Resolved once per generator
+
+        with django_assert_num_queries(0):
+            recs = generator.generate(sports_article, businesses[0], 0.8)
+
+        assert len(recs) == 3
+        assert {rec.business for rec in recs} == {businesses[0]}
+
+    def test_generate_skips_other_business_types(self, sports_article, businesses, business_types):
+        _, _, bookstore = business_types
+        business = businesses[0]
+        business.business_type = bookstore
+
+        assert RecommendationGenerator().generate(sports_article, business, 0.8) == []
+
+    def test_query_count_does_not_grow_with_businesses(self, sports_article, businesses,
+                                                      django_assert_max_num_queries):
+        active = [business for business in businesses if business.is_active]
+        self.write(sports_article, active)  # Existing rows make flush delete
+
+        with django_assert_max_num_queries(6):
+            created = self.write(sports_article, active)
+
+        assert created == 3 * len(active)
+        assert Recommendation.objects.count() == created
+
+    def test_replaces_only_queued_businesses(self, sports_article, businesses):
+        kept, replaced = businesses[0], businesses[1]
+        self.write(sports_article, [kept, replaced])
+        kept_ids = set(kept.recommendations.values_list('id', flat=True))
+
+        self.write(sports_article, [replaced])
+
+        assert set(kept.recommendations.values_list('id', flat=True)) == kept_ids
+        assert replaced.recommendations.count() == 3
+
+
+    def test_businesses_without_templates_keep_recommendations(self, nlp_processor, news_article, businesses,
+                                                               monkeypatch):
+        pub = businesses[0]
+        self.write(news_article, [pub])
+        kept_ids = set(pub.recommendations.values_list('id', flat=True))
+
+        # Candidate pubs whose type has no sports_match templates
+        monkeypatch.setitem(RecommendationGenerator.TEMPLATES['sports_match'], 'business_types', ['restaurant'])
+        monkeypatch.setattr(BusinessIndex, 'candidates', lambda self, article, business_type: [
+            business for business in businesses
+            if business.business_type_id == business_type.id and business.is_active
+        ])
+
+        result = MLOrchestrator().process_article(news_article)
+
+        assert result['matching_businesses'] > 0
+        assert set(pub.recommendations.values_list('id', flat=True)) == kept_ids
+
+
+@pytest.mark.django_db
+class TestPrescreen:
+
+    @pytest.fixture
+    def make_article(self, news_source):
+        def make(title, content):
+            return NewsArticle.objects.create(
+                source=news_source, title=title, content=content,
+                url=f'https://example.com/{NewsArticle.objects.count()}',
+                published_date=timezone.now(), features_extracted=True
+            )
+        return make
+
+    @pytest.fixture
+    def orchestrator(self, nlp_processor):
+        return MLOrchestrator()
+
+    def test_crime_article_skips_nlp(self, orchestrator, nlp_processor, make_article):
+        article = make_article(
+            'Capturan banda dedicada al hurto en Medellín',
+            'La policía desarticuló la banda tras un robo en el centro.\nSegundo párrafo del artículo.'
+        )
+
+        result = orchestrator.process_article(article)
+
+        assert result['prescreened'] is True
+        assert nlp_processor.parse_count == 0
+        article.refresh_from_db()
+        assert article.features_extracted
+        assert article.event_type_detected == 'crime'
+        assert article.category == 'comunidad'
+        assert article.business_suitability_score == 0.0
+
+    def test_reprocessed_article_drops_earlier_results(self, orchestrator, make_article, businesses,
+                                                      business_types):
+        article = make_article(
+            'Capturan banda dedicada al hurto en Medellín',
+            'La policía desarticuló la banda tras un robo en el centro.\nSegundo párrafo del artículo.'
+        )
+        # Results of an earlier full run
+        article.primary_city = 'Medellín'
+        article.event_scale = 'large'
+        article.broadcastability_score = 0.9
+        article.save()
+        MLOrchestrator.save_type_relevance([(article, BusinessTypeScorer().score(article))])
+        generator = orchestrator.rec_generator
+        sink = RecommendationSink(article, generator.article_content_type)
+        sink.add(businesses[0], TestRecommendationSink.recommendations(generator, article, businesses[0]))
+        sink.flush()
+
+        result = orchestrator.process_article(article)
+
+        assert result['prescreened'] is True
+        article.refresh_from_db()
+        assert article.primary_city == ''
+        assert article.event_scale == ''
+        assert article.broadcastability_score == 0.0
+        assert not ArticleBusinessTypeRelevance.objects.filter(article=article).exists()
+        assert not Recommendation.objects.filter(object_id=article.id).exists()
+
+    def test_paywall_anywhere_is_rejected(self, make_article):
+        article = make_article('Festival gastronómico en Medellín', 'Comida típica.\nSuscríbete para seguir leyendo.')
+        assert PreFilter().prescreen(article, 'food_event') == 'paywall'
+
+    def test_hospitality_lead_is_not_rejected(self, make_article):
+        article = make_article('Robo en un restaurante del Poblado', 'El restaurante reabre el viernes.')
+        assert PreFilter().prescreen(article, 'crime') is None
+
+    def test_lead_is_title_and_first_paragraph(self, make_article):
+        article = make_article('Concierto en el estadio', 'Gran concierto el sábado.\nSin robos reportados el año pasado.')
+        lead = PreFilter.lead_text(article)
+        assert 'robos' not in lead
+
+    def test_batch_leaves_rejected_articles_out_of_spacy(self, orchestrator, nlp_processor, make_article, monkeypatch):
+        crime = make_article('Secuestro en la vía al mar', 'Las autoridades investigan el secuestro.')
+        concert = make_article('Concierto en Medellín', 'Gran concierto de rock este sábado en el estadio.')
+        batched = []
+        original_extract_batch = orchestrator.feature_extractor.extract_batch
+
+        def extract_batch(items, **kwargs):
+            batched.extend(title for _, title in items)
+            return original_extract_batch(items, **kwargs)
+        monkeypatch.setattr(orchestrator.feature_extractor, 'extract_batch', extract_batch)
+
+        results = orchestrator.process_articles([crime, concert])
+
+        assert batched == [concert.title]
+        assert results[0]['prescreened'] is True
+        assert 'prescreened' not in results[1]
+
+    def test_can_be_disabled(self, orchestrator, make_article, settings):
+        settings.ML_PRESCREEN_ENABLED = False
+        article = make_article('Secuestro en la vía al mar', 'Las autoridades investigan el secuestro.')
+        assert orchestrator.prescreen(article) is None
+
+
+@pytest.mark.django_db
+class TestProcessArticleSaves:
+
+    def article_updates(self, orchestrator, article):
+        with CaptureQueriesContext(connection) as captured:
+            orchestrator.process_article(article)
+        return [
+            query['sql'] for query in captured.captured_queries
+            if query['sql'].startswith('UPDATE "news_newsarticle"')
+        ]
+
+    def test_one_narrow_save_per_run(self, nlp_processor, news_article):
+        orchestrator = MLOrchestrator()
+
+        first = self.article_updates(orchestrator, news_article)
+        assert len(first) == 1
+        assert '"event_type_detected"' in first[0]
+        assert '"content"' not in first[0] and '"title"' not in first[0]
+
+        # Reprocessing with the same results only refreshes the timestamps
+        second = self.article_updates(orchestrator, news_article)
+        assert len(second) == 1
+        assert '"feature_extraction_date"' in second[0]
+        assert '"event_type_detected"' not in second[0]
+        assert '"entities"' not in second[0]
@@ -0,0 +1,100 @@
+"""
+Tests for NLPProcessor processing profiles (pipeline component pruning)
+"""
+import pytest
+import spacy
+from spacy.language import Language
+
+from ml_engine.services.feature_extractor import FeatureExtractor
+from ml_engine.services.nlp_processor import NLPProcessor
+
+
+CALLED_COMPONENTS = []
+
+
+@Language.factory('test_recorder')
+def create_recorder(nlp, name):
+    """Pipeline component that records its name when it runs"""
+    def recorder(doc):
+        CALLED_COMPONENTS.append(name)
+        return doc
+    return recorder
+
+
+@pytest.fixture
+def fake_full_model(monkeypatch):
+    """Replace spacy.load with a blank pipeline exposing the md component names"""
+    loaded = []
+
+    def fake_load(name, exclude=()):
+        nlp = spacy.blank('es')
+        for component in NLPProcessor.MODEL_COMPONENTS:
+            if component not in exclude:
+                nlp.add_pipe('test_recorder', name=component)
+        loaded.append({'name': name, 'exclude': list(exclude)})
+        return nlp
+
+    monkeypatch.setattr(NLPProcessor, '_instances', {})
+    monkeypatch.setattr(spacy, 'load', fake_load)
+    CALLED_COMPONENTS.clear()
+    return loaded
+
+
+class TestProfileSelection:
+
+    def test_ner_extractors_use_ner_only(self):
+        assert NLPProcessor.profile_for(['extract_entities', 'extract_dates']) == 'ner-only'
+
+    def test_keywords_need_keywords_profile(self):
+        assert NLPProcessor.profile_for(['extract_entities', 'get_keywords']) == 'keywords'
+
+    def test_noun_chunks_need_full_profile(self):
+        assert NLPProcessor.profile_for(['get_noun_chunks']) == 'full'
+
+    def test_feature_extractor_declares_keywords_profile(self):
+        assert NLPProcessor.profile_for(FeatureExtractor.NLP_EXTRACTORS) == 'keywords'
+
+    def test_unknown_profile_rejected(self):
+        with pytest.raises(ValueError):
+            NLPProcessor(profile='tiny')
+
+
+class TestProfileLoading:
+
+    def test_ner_only_excludes_unused_components(self, fake_full_model):
+        nlp = NLPProcessor(profile='ner-only')
+
+        assert nlp._nlp.pipe_names == ['tok2vec', 'ner']
+        assert 'parser' in fake_full_model[0]['exclude']
+        assert 'lemmatizer' in fake_full_model[0]['exclude']
+
+    def test_full_profile_keeps_everything(self, fake_full_model):
+        nlp = NLPProcessor(profile='full')
+
+        assert fake_full_model[0]['exclude'] == []
+        assert nlp._nlp.pipe_names == NLPProcessor.MODEL_COMPONENTS
+
+    def test_one_instance_per_profile(self, fake_full_model):
+        assert NLPProcessor(profile='keywords') is NLPProcessor(profile='keywords')
+        assert NLPProcessor(profile='keywords') is not NLPProcessor(profile='ner-only')
+        assert len(fake_full_model) == 2
+
+    def test_process_text_runs_only_declared_components(self, fake_full_model):
+        nlp = NLPProcessor(profile='full')
+
+        nlp.extract_entities('Concierto en Medellín')
+
+        assert CALLED_COMPONENTS == ['tok2vec', 'ner']
+        assert nlp._nlp.pipe_names == NLPProcessor.MODEL_COMPONENTS
+
+    def test_batch_runs_only_declared_components(self, fake_full_model):
+        nlp = NLPProcessor(profile='full')
+
+        nlp.process_texts(['uno', 'dos'], extractors=FeatureExtractor.NLP_EXTRACTORS)
+
+        assert set(CALLED_COMPONENTS) == {
+            'tok2vec', 'morphologizer', 'attribute_ruler', 'lemmatizer', 'ner'
+        }
+
+    def test_noun_chunks_without_parser(self, nlp_processor):
+        assert nlp_processor.get_noun_chunks('Gran concierto en Medellín') == []
@@ -0,0 +1,87 @@
+"""
+Tests for the versioned extraction pattern snapshot shared across workers
+"""
+import pytest
+from django.core.cache import cache
+
+from event_taxonomy import cache as taxonomy_cache
+from event_taxonomy.models import EventType, ExtractionPattern
+from ml_engine.services.feature_extractor import FeatureExtractor
+
+
+@pytest.fixture
+def concert_type(db):
+    return EventType.objects.create(code='concert', name_es='Concierto', name_en='Concert')
+
+
+@pytest.mark.django_db
+class TestVersionedSnapshot:
+
+    def test_bump_version_increments(self):
+        version = taxonomy_cache.get_version(taxonomy_cache.EXTRACTION_PATTERNS)
+
+        taxonomy_cache.bump_version(taxonomy_cache.EXTRACTION_PATTERNS)
+
+        assert taxonomy_cache.get_version(taxonomy_cache.EXTRACTION_PATTERNS) == version + 1
+
+    def test_pattern_save_bumps_version_on_commit(self, concert_type, django_capture_on_commit_callbacks):
+        version = taxonomy_cache.get_version(taxonomy_cache.EXTRACTION_PATTERNS)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            pattern = ExtractionPattern.objects.create(
+                target='type', event_type=concert_type, pattern=r'concierto'
+            )
+        assert taxonomy_cache.get_version(taxonomy_cache.EXTRACTION_PATTERNS) == version + 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            pattern.delete()
+        assert taxonomy_cache.get_version(taxonomy_cache.EXTRACTION_PATTERNS) == version + 2
+
+    def test_snapshot_is_built_once_per_version(self, concert_type, django_assert_num_queries):
+        ExtractionPattern.objects.create(target='type', event_type=concert_type, pattern=r'concierto')
+        version = taxonomy_cache.get_version(taxonomy_cache.EXTRACTION_PATTERNS)
+
+        with django_assert_num_queries(1):
+            _, first = taxonomy_cache.get_extraction_pattern_snapshot(version)
+        with django_assert_num_queries(0):
+            _, second = taxonomy_cache.get_extraction_pattern_snapshot(version)
+
+        assert first == second == [{
+            'target': 'type', 'event_type': 'concert', 'event_subtype': None,
+            'pattern': 'concierto', 'weight': 1.0,
+        }]
+
+
+@pytest.mark.django_db
+class TestFeatureExtractorReload:
+
+    def test_reloads_only_on_version_change(self, nlp_processor, concert_type, django_assert_num_queries):
+        ExtractionPattern.objects.create(target='type', event_type=concert_type, pattern=r'concierto')
+        extractor = FeatureExtractor()
+
+        assert extractor.extract_event_type('gran concierto') == ('concert', None)
+        scanner = extractor._pattern_scanner
+
+        # Same version: no database queries, scanner not recompiled
+        with django_assert_num_queries(0):
+            assert extractor.extract_event_type('otro concierto') == ('concert', None)
+        assert extractor._pattern_scanner is scanner
+
+        # Pattern edit elsewhere bumps the version: next call reloads
+        ExtractionPattern.objects.create(target='type', event_type=concert_type, pattern=r'recital')
+        taxonomy_cache.bump_version(taxonomy_cache.EXTRACTION_PATTERNS)
+
+        assert extractor.extract_event_type('un recital') == ('concert', None)
+        assert extractor._pattern_scanner is not scanner
+
+    def test_falls_back_to_database_when_cache_is_down(self, nlp_processor, concert_type, monkeypatch):
+        ExtractionPattern.objects.create(target='type', event_type=concert_type, pattern=r'concierto')
+
+        def cache_down(*args, **kwargs):
+            raise ConnectionError('cache down')
+        monkeypatch.setattr(cache, 'get', cache_down)
+
+        extractor = FeatureExtractor()
+
+        assert extractor.extract_event_type('gran concierto') == ('concert', None)
+        assert extractor._pattern_version is None
@@ -0,0 +1,170 @@
+"""
+Tests for the precompiled regex tables (PatternRegistry)
+"""
+import re
+
+import pytest
+
+from ml_engine.services.pattern_registry import (
+    LiteralScanner,
+    PatternRegistry,
+    PatternScanner,
+    PatternTable
+)
+from ml_engine.services.feature_extractor import FeatureExtractor
+from ml_engine.services.ml_pipeline import PreFilter
+
+
+TEXTS = [
+    'concierto de rock el sábado 15 de marzo a las 8 pm, más de 40.000 personas',
+    'festival gastronómico del 20 al 22 de marzo con cerveza, bar y música en vivo',
+    'la selección colombia jugará contra argentina en brasil durante 2 horas',
+    'accidente deja un muerto; suscríbete para leer el contenido exclusivo',
+    '',
+]
+
+
+class TestPatternTable:
+
+    def test_helpers_match_raw_re(self):
+        patterns = [r'bar', r'caf[eé]', r'm[uú]sica\s+en\s+vivo']
+        table = PatternTable(patterns)
+
+        for text in TEXTS:
+            assert table.matches(text) == any(re.search(p, text) for p in patterns)
+            assert table.count(text) == sum(1 for p in patterns if re.search(p, text))
+            assert table.count_all(text) == sum(len(re.findall(p, text)) for p in patterns)
+
+    def test_first_match_returns_table_index(self):
+        table = PatternTable([r'argentina', r'brasil'])
+
+        idx, match = table.first_match('en brasil y argentina')
+
+        assert idx == 0
+        assert match.group(0) == 'argentina'
+        assert table.first_match('en chile') == (None, None)
+
+    def test_register_compiles_once(self):
+        first = PatternRegistry.register('tests.once', [r'uno'])
+        second = PatternRegistry.register('tests.once', [r'dos'])
+
+        assert first is second
+        assert PatternRegistry.get('tests.once').sources == [r'uno']
+        assert 'tests.once' in PatternRegistry.names()
+
+
+class TestRegisteredTables:
+    """Compiled tables must give the same results as the raw pattern strings"""
+
+    @pytest.mark.parametrize('text', TEXTS)
+    def test_event_type_counts(self, text):
+        for event_type, patterns in FeatureExtractor.EVENT_TYPE_PATTERNS.items():
+            expected = sum(len(re.findall(p, text)) for p in patterns)
+            assert FeatureExtractor.EVENT_TYPE_TABLES[event_type].count_all(text) == expected
+
+    @pytest.mark.parametrize('text', TEXTS)
+    def test_prefilter_tables(self, text):
+        assert PreFilter.PAYWALL_TABLE.matches(text) == any(
+            re.search(p, text) for p in PreFilter.PAYWALL_PATTERNS
+        )
+        assert PreFilter.HOSPITALITY_TABLE.count(text) == sum(
+            1 for kw in PreFilter.HOSPITALITY_KEYWORDS if re.search(kw, text)
+        )
+        assert PreFilter.NEGATIVE_TABLE.count(text) == sum(
+            1 for kw in PreFilter.NEGATIVE_KEYWORDS if re.search(kw, text)
+        )
+
+    def test_country_and_involvement(self, nlp_processor):
+        extractor = FeatureExtractor()
+
+        assert extractor.extract_event_country(TEXTS[2], '') == 'Brasil'
+        assert extractor.detect_colombian_involvement(TEXTS[2]) is True
+        assert extractor.detect_colombian_involvement(TEXTS[0]) is False
+
+    def test_duration_multipliers(self, nlp_processor):
+        extractor = FeatureExtractor()
+
+        assert extractor.extract_duration('el evento dura 3 horas') == 3.0
+        assert extractor.extract_duration('son 2 días de feria') == 48.0
+        assert extractor.extract_duration('fiesta todo el día') == 12.0
+        assert extractor.extract_duration('sin duración') is None
+
+
+SCANNER_PATTERNS = [
+    r'partido\s+de\s+f[uú]tbol',
+    r'partido.*contra',
+    r'vs\.?',
+    r'\bteatro\b',
+    r'obra\s+de\s+teatro',
+    r'congreso',
+    r'pol[ií]tica|gobierno|congreso',
+    r'colombia\s+(vs|contra)',
+    r'(?i)FIESTA',
+    r'\d+\s+personas',
+]
+
+
+class TestLiteralScanner:
+
+    def test_finds_nested_and_overlapping_literals(self):
+        literals = ['bar', 'sports bar', 'sport', 'arte', 'cerveza', 'comida típica', 'comida']
+        scanner = LiteralScanner(literals)
+
+        for text in TEXTS + ['sports barte con comida típica', 'bares y cerveza']:
+            assert scanner.find(text) == {literal for literal in literals if literal in text}
+
+
+class TestPatternScanner:
+
+    def test_required_literals(self):
+        assert PatternScanner.required_literals(r'partido\s+de\s+f[uú]tbol') == {'partido'}
+        assert PatternScanner.required_literals(r'homicidio|crimen|robo') == {'homicidio', 'crimen', 'robo'}
+        assert PatternScanner.required_literals(r'(?i)fiesta') is None
+        assert PatternScanner.required_literals(r'\d+') is None
+
+    @pytest.mark.parametrize('text', TEXTS + [
+        'obra de teatro en el congreso: partido de fútbol colombia vs argentina, partido contra chile',
+        'la política del gobierno en el congreso, fiesta y FIESTA para 300 personas',
+    ])
+    def test_counts_match_findall(self, text):
+        scanner = PatternScanner((p, p) for p in SCANNER_PATTERNS)
+
+        expected = [
+            (p, len(re.findall(p, text))) for p in SCANNER_PATTERNS if re.findall(p, text)
+        ]
+        assert scanner.scan(text) == expected
+
+    def test_invalid_patterns_are_skipped(self):
+        scanner = PatternScanner([(r'concierto', 'ok'), (r'(sin cerrar', 'bad')])
+
+        assert len(scanner) == 1
+        assert scanner.scan('gran concierto') == [('ok', 1)]
+
+
+@pytest.mark.django_db
+class TestEventTypeScanning:
+    """extract_event_type scores database patterns through the scanner"""
+
+    @pytest.fixture
+    def taxonomy(self):
+        from event_taxonomy.models import EventType, EventSubtype, ExtractionPattern
+
+        sports = EventType.objects.create(code='sports_match', name_es='Deportes', name_en='Sports')
+        cultural = EventType.objects.create(code='cultural', name_es='Cultural', name_en='Cultural')
+        soccer = EventSubtype.objects.create(
+            event_type=sports, code='colombian_soccer',
+            name_es='Fútbol Colombiano', name_en='Colombian Soccer'
+        )
+        ExtractionPattern.objects.create(target='type', event_type=sports, pattern=r'partido', weight=1.5)
+        ExtractionPattern.objects.create(target='type', event_type=cultural, pattern=r'\bteatro\b', weight=1.7)
+        ExtractionPattern.objects.create(
+            target='subtype', event_type=sports, event_subtype=soccer,
+            pattern=r'selección\s+colombia', weight=2.0
+        )
+
+    def test_weighted_type_and_subtype(self, nlp_processor, taxonomy):
+        extractor = FeatureExtractor()
+        text = 'Partido de la Selección Colombia: el partido será en el teatro'
+
+        assert extractor.extract_event_type(text) == ('sports_match', 'colombian_soccer')
+        assert extractor.extract_event_type('Obra en el teatro') == ('cultural', None)
@@ -0,0 +1,44 @@
+"""
+Tests for the worker-lifetime MLOrchestrator used by the Celery tasks
+"""
+import pytest
+
+from ml_engine import tasks
+from ml_engine.services.broadcastability_calculator import BroadcastabilityCalculator
+
+
+@pytest.fixture
+def fresh_worker(monkeypatch, nlp_processor):
+    """Worker process state before warm-up"""
+    monkeypatch.setattr(tasks, '_orchestrator', None)
+
+
+@pytest.mark.django_db
+class TestWorkerOrchestrator:
+
+    def test_orchestrator_is_reused(self, fresh_worker):
+        assert tasks.get_orchestrator() is tasks.get_orchestrator()
+
+    def test_worker_process_init_warms_up(self, fresh_worker, nlp_processor):
+        tasks.warm_up_orchestrator()
+
+        orchestrator = tasks._orchestrator
+        assert orchestrator is not None
+        assert orchestrator.feature_extractor._pattern_scanner is not None
+        assert BroadcastabilityCalculator._shared is not None
+        assert nlp_processor.parse_count == 1
+
+    def test_warm_up_failure_is_retried_lazily(self, fresh_worker, monkeypatch):
+        def broken_warm_up(self):
+            raise RuntimeError('model missing')
+        monkeypatch.setattr('ml_engine.services.ml_pipeline.MLOrchestrator.warm_up', broken_warm_up)
+
+        tasks.warm_up_orchestrator()
+
+        assert tasks._orchestrator is None
+        assert tasks.get_orchestrator() is tasks._orchestrator is not None
+
+
+def test_batch_task_retries_like_single_article_task():
+    for option in ('max_retries', 'default_retry_delay', 'autoretry_for', 'retry_backoff', 'retry_jitter'):
+        assert getattr(tasks.process_articles_batch, option) == getattr(tasks.process_article_async, option)
@@ -166,6 +166,9 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# Worker processes preload the ML pipeline on start (ml_engine.tasks.warm_up_orchestrator);
+# loading the spaCy model takes longer than Celery's default 4s start-up allowance
+CELERY_WORKER_PROC_ALIVE_TIMEOUT = env.int('CELERY_WORKER_PROC_ALIVE_TIMEOUT', default=60)
 
 # Caching
 CACHES = {
@@ -224,4 +227,41 @@ BUSINESS_TYPES = [
 
 # ML Engine Settings
 ML_MODELS_PATH = BASE_DIR / 'ml_models'
-SPACY_MODEL = 'es_core_news_sm'
\ No newline at end of file
+SPACY_MODEL = 'es_core_news_sm'
+
+# Batched spaCy processing (nlp.pipe) for bulk article runs
+ML_NLP_BATCH_SIZE = env.int('ML_NLP_BATCH_SIZE', default=50)
+ML_NLP_N_PROCESS = env.int('ML_NLP_N_PROCESS', default=1)
+
+# Regex-only prescreen that skips spaCy for paywalled and crime/conflict articles
+ML_PRESCREEN_ENABLED = env.bool('ML_PRESCREEN_ENABLED', default=True)
+
+# News crawler: sources crawled concurrently by bulk runs, and at most this
+# many at once per domain (news.services.crawl_pool)
+CRAWLER_MAX_WORKERS = env.int('CRAWLER_MAX_WORKERS', default=8)
+CRAWLER_PER_DOMAIN_CONCURRENCY = env.int('CRAWLER_PER_DOMAIN_CONCURRENCY', default=1)
+
+# Async page fetcher (news.services.async_fetcher): requests per second and
+# burst per host, and requests in flight at once
+CRAWLER_HOST_RATE = env.float('CRAWLER_HOST_RATE', default=1.0)
+CRAWLER_HOST_BURST = env.int('CRAWLER_HOST_BURST', default=2)
+CRAWLER_FETCH_CONCURRENCY = env.int('CRAWLER_FETCH_CONCURRENCY', default=10)
+
+# Seconds a host's robots.txt is cached for all crawler workers
+# (news.services.robots_policy)
+CRAWLER_ROBOTS_TTL = env.int('CRAWLER_ROBOTS_TTL', default=60 * 60 * 24)
+
+# RSS discovery (news.services.rss_discovery): candidate feeds probed per
+# second and at once per host
+RSS_DISCOVERY_HOST_RATE = env.float('RSS_DISCOVERY_HOST_RATE', default=5.0)
+RSS_DISCOVERY_PER_HOST = env.int('RSS_DISCOVERY_PER_HOST', default=4)
+
+# Parser for link discovery on section pages and homepages: 'lxml' or
+# 'html.parser' (BeautifulSoup) (news.services.html_parser)
+CRAWLER_HTML_PARSER = env('CRAWLER_HTML_PARSER', default='lxml')
+
+# Raw crawl response store (news.services.response_store): 'off', 'record'
+# (keep every downloaded page) or 'replay' (read pages from the store instead
+# of the network, for offline re-extraction)
+CRAWLER_RESPONSE_STORE_MODE = env('CRAWLER_RESPONSE_STORE_MODE', default='off')
+CRAWLER_RESPONSE_STORE_DIR = env('CRAWLER_RESPONSE_STORE_DIR', default=str(BASE_DIR / 'crawl_store'))
\ No newline at end of file
@@ -1,3 +1,6 @@
+from itertools import islice
+
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db.models import Q
 from news.models import NewsArticle
@@ -23,7 +26,13 @@ class Command(BaseCommand):
             '--batch-size',
             type=int,
             default=10,
-            help='Number of articles to process before committing (default: 10)'
+            help='Number of articles parsed per spaCy nlp.pipe batch and between progress updates (default: 10)'
+        )
+        parser.add_argument(
+            '--n-process',
+            type=int,
+            default=settings.ML_NLP_N_PROCESS,
+            help=f'spaCy worker processes for nlp.pipe (default: {settings.ML_NLP_N_PROCESS})'
         )
 
     def handle(self, *args, **options):
@@ -62,10 +71,34 @@ class Command(BaseCommand):
         failed = 0
         errors = []
 
-        for article in queryset.iterator(chunk_size=batch_size):
+        articles = queryset.iterator(chunk_size=batch_size)
+
+        while True:
+            batch = list(islice(articles, batch_size))
+            if not batch:
+                break
+
             try:
-                result = orchestrator.process_article(article, save=True)
+                results = orchestrator.process_articles(
+                    batch,
+                    save=True,
+                    batch_size=batch_size,
+                    n_process=options['n_process']
+                )
+            except Exception as e:
+                for article in batch:
+                    failed += 1
+                    error_msg = f'Article {article.id}: {str(e)}'
+                    errors.append(error_msg)
+                    self.stdout.write(
+                        self.style.ERROR(
+                            f'[{processed + 1}/{total}] ERROR {article.id}: {str(e)}'
+                        )
+                    )
+                    processed += 1
+                continue
 
+            for article, result in zip(batch, results):
                 if result['success']:
                     success += 1
                     type_count = len(result.get('type_scores', {}))
@@ -82,25 +115,14 @@ class Command(BaseCommand):
                         )
                     )
 
-            except Exception as e:
-                failed += 1
-                error_msg = f'Article {article.id}: {str(e)}'
-                errors.append(error_msg)
-                self.stdout.write(
-                    self.style.ERROR(
-                        f'[{processed + 1}/{total}] ERROR {article.id}: {str(e)}'
-                    )
-                )
-
-            processed += 1
+                processed += 1
 
             # Progress update every batch
-            if processed % batch_size == 0:
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'Progress: {processed}/{total} ({success} success, {failed} failed)'
-                    )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Progress: {processed}/{total} ({success} success, {failed} failed)'
                 )
+            )
 
         # Final summary
         self.stdout.write('\n' + '=' * 60)
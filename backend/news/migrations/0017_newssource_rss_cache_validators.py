@@ -0,0 +1,23 @@
+# Generated by Django 5.1.5 on 2026-10-16 19:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0016_remove_newsarticle_news_newsar_busines_9d5769_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newssource',
+            name='rss_etag',
+            field=models.CharField(blank=True, help_text='Se envía como If-None-Match en el siguiente rastreo', max_length=255, verbose_name='ETag del RSS'),
+        ),
+        migrations.AddField(
+            model_name='newssource',
+            name='rss_last_modified',
+            field=models.CharField(blank=True, help_text='Se envía como If-Modified-Since en el siguiente rastreo', max_length=100, verbose_name='Last-Modified del RSS'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.5 on 2026-10-16 19:45
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_content_hashes(apps, schema_editor):
+    """Store the content hash of every existing article"""
+    NewsArticle = apps.get_model('news', 'NewsArticle')
+
+    batch = []
+    for article in NewsArticle.objects.only('id', 'content').iterator(chunk_size=500):
+        article.content_hash = hashlib.md5(article.content.encode()).hexdigest()
+        batch.append(article)
+        if len(batch) == 500:
+            NewsArticle.objects.bulk_update(batch, ['content_hash'])
+            batch = []
+
+    if batch:
+        NewsArticle.objects.bulk_update(batch, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0017_newssource_rss_cache_validators'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newsarticle',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='MD5 del contenido, para detectar cambios sin recargar el texto completo', max_length=32, verbose_name='Hash del contenido'),
+        ),
+        migrations.RunPython(backfill_content_hashes, migrations.RunPython.noop),
+    ]
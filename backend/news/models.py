@@ -1,3 +1,4 @@
+import hashlib
 from django.db import models
 from django.contrib.auth.models import User
 import json
@@ -338,6 +339,20 @@ class NewsSource(models.Model):
         verbose_name='Conteo de fallos consecutivos'
     )
 
+    # HTTP cache validators of the RSS feed, sent back as conditional GET
+    rss_etag = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name='ETag del RSS',
+        help_text='Se envía como If-None-Match en el siguiente rastreo'
+    )
+    rss_last_modified = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='Last-Modified del RSS',
+        help_text='Se envía como If-Modified-Since en el siguiente rastreo'
+    )
+
     # Legacy scraping configuration (keep for backwards compatibility)
     scraping_enabled = models.BooleanField(default=False, verbose_name='Scraping habilitado')
     css_selectors = models.JSONField(
@@ -529,6 +544,13 @@ class NewsArticle(models.Model):
         help_text='Extracto del primer párrafo para mostrar en UI (auto-generado)'
     )
     url = models.URLField(unique=True, verbose_name='URL original')
+    content_hash = models.CharField(
+        max_length=32,
+        blank=True,
+        editable=False,
+        verbose_name='Hash del contenido',
+        help_text='MD5 del contenido, para detectar cambios sin recargar el texto completo'
+    )
     
     # Article metadata
     author = models.CharField(max_length=200, blank=True, verbose_name='Autor')
@@ -812,30 +834,66 @@ class NewsArticle(models.Model):
     def __str__(self):
         return f"{self.title} - {self.source.name}"
 
-    def save(self, *args, **kwargs):
-        """Prevent modification of crawler-generated fields after creation"""
-        # Fields that cannot be modified after creation (data integrity)
-        protected_fields = [
-            'source_id', 'title', 'content', 'first_paragraph', 'url', 'author',
-            'published_date', 'section', 'crawl_section'
-        ]
+    # Fields that cannot be modified after creation (data integrity)
+    PROTECTED_FIELDS = [
+        'source_id', 'title', 'content', 'first_paragraph', 'url', 'author',
+        'published_date', 'section', 'crawl_section'
+    ]
 
-        # If this is an update (not a new object)
-        if self.pk:
-            try:
-                existing = NewsArticle.objects.get(pk=self.pk)
+    @staticmethod
+    def hash_content(content: str) -> str:
+        """Content hash stored in content_hash"""
+        return hashlib.md5(content.encode()).hexdigest()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded values of the protected fields (see save)"""
+        instance = super().from_db(db, field_names, values)
+        instance._remember_protected_values()
+        return instance
 
-                # Check if any protected field was modified
-                for field in protected_fields:
-                    old_value = getattr(existing, field)
-                    new_value = getattr(self, field)
+    def _remember_protected_values(self):
+        """Keep the stored values of the (non-deferred) protected fields"""
+        self._protected_values = {
+            field: getattr(self, field)
+            for field in self.PROTECTED_FIELDS
+            if field in self.__dict__
+        }
 
-                    # Restore original value if it was changed
-                    if old_value != new_value:
-                        setattr(self, field, old_value)
+    def save(self, *args, **kwargs):
+        """
+        Prevent modification of crawler-generated fields after creation
+
+        Updates never write the protected fields: they are left out of
+        update_fields, and changes made in memory to a loaded or created
+        article are reverted to the values it was stored with.
+        """
+        if self._state.adding or kwargs.get('force_insert'):
+            if not self.content_hash:
+                self.content_hash = self.hash_content(self.content)
+            super().save(*args, **kwargs)
+            self._remember_protected_values()
+            return
 
-            except NewsArticle.DoesNotExist:
-                pass  # New object, allow all fields
+        # Restore original values if they were changed
+        for field, old_value in getattr(self, '_protected_values', {}).items():
+            if getattr(self, field) != old_value:
+                setattr(self, field, old_value)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            # Every loaded (non-deferred) field, as a plain save would write
+            deferred = self.get_deferred_fields()
+            update_fields = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in deferred
+            ]
+        kwargs['update_fields'] = [
+            field for field in update_fields
+            if field not in self.PROTECTED_FIELDS and f'{field}_id' not in self.PROTECTED_FIELDS
+        ]
+        if not kwargs['update_fields']:
+            return  # Only protected fields requested: nothing to write
 
         super().save(*args, **kwargs)
 
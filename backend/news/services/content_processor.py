@@ -6,12 +6,12 @@ handles content validation, deduplication, and prepares articles for ML processi
 """
 
 import logging
-import hashlib
 import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from django.utils import timezone
 from django.db import transaction
+from django.db.models.signals import post_save
 
 import feedparser
 from bs4 import BeautifulSoup
@@ -19,6 +19,7 @@ from bs4 import BeautifulSoup
 from ..models import NewsSource, NewsArticle, CrawlHistory
 from .rss_discovery import RSSDiscoveryService
 from .manual_crawler import ManualCrawlerService
+from .crawl_pool import CrawlPool, per_thread
 
 logger = logging.getLogger(__name__)
 
@@ -143,7 +144,8 @@ class ContentProcessorService:
                 # STEP 2: Try RSS first (unless forced manual)
                 if not force_manual and (source.rss_url or source.discovered_rss_url):
                     rss_result = self._process_rss_feed(source)
-                    if rss_result['success'] and rss_result['articles_saved'] > 0:
+                    # An unchanged feed (304) is a successful RSS crawl with nothing new
+                    if rss_result['success'] and (rss_result['articles_saved'] > 0 or rss_result['not_modified']):
                         result.update(rss_result)
                         result['method_used'] = 'rss'
                         crawl_history.crawl_type = 'rss'
@@ -300,6 +302,7 @@ class ContentProcessorService:
             'articles_saved': 0,
             'articles_updated': 0,
             'articles_skipped': 0,
+            'not_modified': False,
             'errors': []
         }
 
@@ -312,10 +315,23 @@ class ContentProcessorService:
 
             logger.info(f"Processing RSS feed: {feed_url}")
 
-            # Fetch and parse RSS feed
-            response = self.rss_service.session.get(feed_url, timeout=15)
+            # Conditional GET: the feed is only sent again if it changed
+            # since the validators stored on the last successful crawl
+            headers = {}
+            if source.rss_etag:
+                headers['If-None-Match'] = source.rss_etag
+            if source.rss_last_modified:
+                headers['If-Modified-Since'] = source.rss_last_modified
+
+            response = self.rss_service.session.get(feed_url, headers=headers, timeout=15)
             response.raise_for_status()
 
+            if response.status_code == 304:
+                logger.info(f"RSS feed not modified since last crawl: {feed_url}")
+                result['not_modified'] = True
+                result['success'] = True
+                return result
+
             feed = feedparser.parse(response.content)
 
             if feed.bozo and feed.bozo_exception:
@@ -325,39 +341,46 @@ class ContentProcessorService:
             result['articles_found'] = len(feed.entries)
             logger.info(f"Found {len(feed.entries)} entries in RSS feed")
 
-            # Process each entry
-            processed_count = 0
+            # Standardize each entry
+            articles_data = []
             for entry in feed.entries:
                 try:
                     logger.debug(f"Processing entry: {entry.get('title', 'No title')[:50]}")
                     article_data = self._standardize_rss_entry(entry, source)
 
                     if article_data:
-                        save_result = self._save_article(article_data, source)
-                        if save_result == 'created':
-                            result['articles_saved'] += 1
-                            logger.info(f"Created new article: {article_data['title'][:50]}")
-                        elif save_result == 'updated':
-                            result['articles_updated'] += 1
-                            logger.info(f"Updated article: {article_data['title'][:50]}")
-                        elif save_result == 'error':
-                            result['errors'].append(f"Failed to save article: {article_data['title'][:50]}")
-                        else:
-                            result['articles_skipped'] += 1
-                            logger.debug(f"Skipped article: {article_data['title'][:50]}")
+                        articles_data.append(article_data)
                     else:
                         logger.warning(f"Failed to standardize entry: {entry.get('title', 'No title')[:50]}")
 
-                    processed_count += 1
-
                 except Exception as e:
                     error_msg = f"RSS entry processing failed: {str(e)}"
                     logger.warning(error_msg)
                     result['errors'].append(error_msg)
 
+            # Save the whole feed at once
+            save_results = self._save_articles(articles_data, source)
+            for article_data, save_result in zip(articles_data, save_results):
+                if save_result == 'created':
+                    result['articles_saved'] += 1
+                    logger.info(f"Created new article: {article_data['title'][:50]}")
+                elif save_result == 'updated':
+                    result['articles_updated'] += 1
+                    logger.info(f"Updated article: {article_data['title'][:50]}")
+                elif save_result == 'error':
+                    result['errors'].append(f"Failed to save article: {article_data['title'][:50]}")
+                else:
+                    result['articles_skipped'] += 1
+                    logger.debug(f"Skipped article: {article_data['title'][:50]}")
+
             logger.info(f"RSS processing completed: {result['articles_saved']} saved, {result['articles_skipped']} skipped")
             result['success'] = True
 
+            # Remember the validators for the next conditional GET
+            source.rss_etag = response.headers.get('ETag', '')[:255]
+            source.rss_last_modified = response.headers.get('Last-Modified', '')[:100]
+            source.save(update_fields=['rss_etag', 'rss_last_modified'])
+
         except Exception as e:
             error_msg = f"RSS feed processing failed: {str(e)}"
             logger.error(error_msg)
@@ -413,23 +436,26 @@ class ContentProcessorService:
             result['articles_found'] = len(all_articles)
 
             # Process crawled articles
+            articles_data = []
             for article_data in all_articles:
                 try:
                     standardized_data = self._standardize_manual_article(article_data, source)
                     if standardized_data:
-                        save_result = self._save_article(standardized_data, source)
-                        if save_result == 'created':
-                            result['articles_saved'] += 1
-                        elif save_result == 'updated':
-                            result['articles_updated'] += 1
-                        else:
-                            result['articles_skipped'] += 1
+                        articles_data.append(standardized_data)
 
                 except Exception as e:
                     error_msg = f"Manual article processing failed: {str(e)}"
                     logger.warning(error_msg)
                     result['errors'].append(error_msg)
 
+            for save_result in self._save_articles(articles_data, source):
+                if save_result == 'created':
+                    result['articles_saved'] += 1
+                elif save_result == 'updated':
+                    result['articles_updated'] += 1
+                else:
+                    result['articles_skipped'] += 1
+
             result['success'] = True
 
         except Exception as e:
@@ -580,6 +606,124 @@ class ContentProcessorService:
 
         return ''
 
+    def _save_articles(self, articles_data: List[Dict], source: NewsSource) -> List[str]:
+        """
+        Save a batch of articles with deduplication
+
+        All URLs are looked up with one query that loads only the stored
+        content hash and title, so existing articles are never reloaded in
+        full. New articles are inserted with a single bulk_create.
+
+        Args:
+            articles_data: Standardized article dicts
+            source: NewsSource the articles belong to
+
+        Returns:
+            'created', 'updated', 'skipped' or 'error' for each article, in order
+        """
+        if not articles_data:
+            return []
+
+        try:
+            existing_articles = {
+                article.url: article
+                for article in NewsArticle.objects.filter(
+                    url__in={article_data['url'] for article_data in articles_data}
+                ).only('id', 'url', 'title', 'content_hash')
+            }
+        except Exception as e:
+            logger.error(f"Article lookup failed: {str(e)}")
+            return ['error'] * len(articles_data)
+
+        results = ['skipped'] * len(articles_data)
+        new_positions = []
+        seen_urls = set()
+
+        for position, article_data in enumerate(articles_data):
+            if article_data['url'] in seen_urls:
+                continue  # Listed twice in the same batch
+            seen_urls.add(article_data['url'])
+
+            existing_article = existing_articles.get(article_data['url'])
+            if existing_article is None:
+                new_positions.append(position)
+            elif self._has_content_changed(existing_article, article_data):
+                results[position] = self._update_article(existing_article, article_data)
+
+        if new_positions:
+            created = self._create_articles([articles_data[position] for position in new_positions], source)
+            for position, save_result in zip(new_positions, created):
+                results[position] = save_result
+
+        return results
+
+    def _create_articles(self, articles_data: List[Dict], source: NewsSource) -> List[str]:
+        """
+        Insert new articles with one bulk_create
+
+        bulk_create does not send post_save, so it is sent for every created
+        article afterwards: that is what queues ML processing (news.signals).
+        If the batch insert fails (e.g. a concurrent crawl stored one of the
+        URLs first), the articles are saved one by one instead.
+
+        Returns:
+            Save result for each article, in order
+        """
+        articles = [
+            NewsArticle(
+                source=source,
+                content_hash=NewsArticle.hash_content(article_data['content']),
+                **article_data
+            )
+            for article_data in articles_data
+        ]
+
+        try:
+            with transaction.atomic():
+                NewsArticle.objects.bulk_create(articles)
+        except Exception as e:
+            logger.warning(f"Bulk article insert failed, saving one by one: {str(e)}")
+            return [self._save_article(article_data, source) for article_data in articles_data]
+
+        for article in articles:
+            post_save.send(
+                sender=NewsArticle, instance=article, created=True,
+                update_fields=None, raw=False, using=article._state.db
+            )
+
+        return ['created'] * len(articles)
+
+    def _update_article(self, existing_article: NewsArticle, article_data: Dict) -> str:
+        """
+        Update an existing article with re-crawled data
+
+        Crawler fields (NewsArticle.PROTECTED_FIELDS) are never rewritten, so
+        an article whose changes are all in those fields is skipped without
+        an UPDATE (its content_hash keeps matching the stored content).
+
+        Returns:
+            'updated', 'skipped' or 'error'
+        """
+        update_fields = [
+            field for field in article_data
+            if field != 'url' and field not in NewsArticle.PROTECTED_FIELDS
+        ]
+        if not update_fields:
+            return 'skipped'
+
+        try:
+            with transaction.atomic():
+                for field in update_fields:
+                    setattr(existing_article, field, article_data[field])
+
+                existing_article.updated_at = timezone.now()
+                existing_article.save(update_fields=update_fields + ['updated_at'])
+            return 'updated'
+
+        except Exception as e:
+            logger.error(f"Article save failed: {str(e)}")
+            return 'error'
+
     def _save_article(self, article_data: Dict, source: NewsSource) -> str:
         """
         Save article to database with deduplication
@@ -594,15 +738,7 @@ class ContentProcessorService:
             if existing_article:
                 # Check if content has changed significantly
                 if self._has_content_changed(existing_article, article_data):
-                    # Update existing article using atomic transaction
-                    with transaction.atomic():
-                        for field, value in article_data.items():
-                            if field != 'url':  # Don't update URL
-                                setattr(existing_article, field, value)
-
-                        existing_article.updated_at = timezone.now()
-                        existing_article.save()
-                    return 'updated'
+                    return self._update_article(existing_article, article_data)
                 else:
                     return 'skipped'
 
@@ -622,8 +758,8 @@ class ContentProcessorService:
     def _has_content_changed(self, existing_article: NewsArticle, new_data: Dict) -> bool:
         """Check if article content has changed significantly"""
         # Compare content hashes
-        existing_hash = hashlib.md5(existing_article.content.encode()).hexdigest()
-        new_hash = hashlib.md5(new_data['content'].encode()).hexdigest()
+        existing_hash = existing_article.content_hash
+        new_hash = NewsArticle.hash_content(new_data['content'])
 
         if existing_hash != new_hash:
             return True
@@ -671,8 +807,8 @@ class ContentProcessorService:
             'last_successful_crawl': crawl_history.filter(status='success').first().crawl_date if crawl_history.filter(status='success').exists() else None
         }
 
-    def bulk_process_sources(self, country_code: str = None) -> Dict[str, any]:
-        """Process multiple news sources in bulk"""
+    def bulk_process_sources(self, country_code: str = None, max_workers: Optional[int] = None) -> Dict[str, any]:
+        """Process multiple news sources in bulk, concurrently (see CrawlPool)"""
         result = {
             'total_sources': 0,
             'successful_sources': 0,
@@ -691,25 +827,27 @@ class ContentProcessorService:
             if country_code:
                 sources = sources.filter(country=country_code)
 
-            result['total_sources'] = sources.count()
+            sources = list(sources)
+            result['total_sources'] = len(sources)
 
-            # Process each source
-            for source in sources:
-                try:
-                    source_result = self.process_news_source(source)
-
-                    if source_result['success']:
-                        result['successful_sources'] += 1
-                        result['total_articles'] += source_result['articles_saved']
-                    else:
-                        result['failed_sources'] += 1
-                        result['errors'].extend(source_result['errors'])
+            # Process sources concurrently, each worker thread with its own services
+            processor = per_thread(ContentProcessorService)
+            crawled = CrawlPool(max_workers=max_workers).map(
+                lambda source: processor().process_news_source(source), sources
+            )
 
-                except Exception as e:
-                    error_msg = f"Bulk processing failed for source {source.name}: {str(e)}"
+            for source, source_result, error in crawled:
+                if error is not None:
+                    error_msg = f"Bulk processing failed for source {source.name}: {str(error)}"
                     logger.error(error_msg)
                     result['errors'].append(error_msg)
                     result['failed_sources'] += 1
+                elif source_result['success']:
+                    result['successful_sources'] += 1
+                    result['total_articles'] += source_result['articles_saved']
+                else:
+                    result['failed_sources'] += 1
+                    result['errors'].extend(source_result['errors'])
 
         except Exception as e:
             error_msg = f"Bulk processing failed: {str(e)}"
@@ -719,4 +857,4 @@ class ContentProcessorService:
         finally:
             result['processing_duration'] = (timezone.now() - start_time).total_seconds()
 
-        return result
\ No newline at end of file
+        return result
@@ -14,6 +14,7 @@ from ..models import NewsSource, CrawlHistory
 from .rss_discovery import RSSDiscoveryService
 from .manual_crawler import ManualCrawlerService
 from .content_processor import ContentProcessorService
+from .crawl_pool import CrawlPool, per_thread
 
 logger = logging.getLogger(__name__)
 
@@ -142,13 +143,22 @@ class CrawlerOrchestratorService:
 
         return result
 
-    def bulk_crawl(self, country_code: str = None, source_ids: List[int] = None) -> Dict[str, any]:
+    def bulk_crawl(
+        self,
+        country_code: str = None,
+        source_ids: List[int] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, any]:
         """
         Perform bulk crawling of multiple sources
 
+        Sources are crawled concurrently (see CrawlPool), at most
+        settings.CRAWLER_PER_DOMAIN_CONCURRENCY at once per domain.
+
         Args:
             country_code: Limit crawling to sources from specific country
             source_ids: List of specific source IDs to crawl
+            max_workers: Sources crawled at once (default: settings.CRAWLER_MAX_WORKERS)
 
         Returns:
             Dict containing bulk crawl results
@@ -180,33 +190,37 @@ class CrawlerOrchestratorService:
 
             logger.info(f"Starting bulk crawl for {len(sources)} sources")
 
-            # Process each source
-            for source in sources:
-                try:
-                    logger.info(f"Processing source: {source.name}")
+            # Crawl concurrently, each worker thread with its own services
+            content_processor = per_thread(ContentProcessorService)
 
-                    source_result = self.content_processor.process_news_source(source)
-                    source_result['source_name'] = source.name
+            def crawl(source):
+                logger.info(f"Processing source: {source.name}")
+                return content_processor().process_news_source(source)
 
-                    result['source_results'].append(source_result)
-                    result['processed_sources'] += 1
+            # Merge results in source order
+            for source, source_result, error in CrawlPool(max_workers=max_workers).map(crawl, sources):
+                if error is not None:
+                    error_msg = f"Failed to process source {source.name}: {str(error)}"
+                    logger.error(error_msg)
+                    result['errors'].append(error_msg)
+                    result['failed_crawls'] += 1
+                    continue
 
-                    if source_result['success']:
-                        result['successful_crawls'] += 1
-                        result['total_articles'] += source_result['articles_saved']
-                    else:
-                        result['failed_crawls'] += 1
+                source_result['source_name'] = source.name
 
-                    # Add any errors from this source to the main error list
-                    if source_result['errors']:
-                        result['errors'].extend([f"{source.name}: {error}" for error in source_result['errors']])
+                result['source_results'].append(source_result)
+                result['processed_sources'] += 1
 
-                except Exception as e:
-                    error_msg = f"Failed to process source {source.name}: {str(e)}"
-                    logger.error(error_msg)
-                    result['errors'].append(error_msg)
+                if source_result['success']:
+                    result['successful_crawls'] += 1
+                    result['total_articles'] += source_result['articles_saved']
+                else:
                     result['failed_crawls'] += 1
 
+                # Add any errors from this source to the main error list
+                if source_result['errors']:
+                    result['errors'].extend([f"{source.name}: {error}" for error in source_result['errors']])
+
             result['success'] = result['successful_crawls'] > 0
 
             logger.info(f"Bulk crawl completed: {result['successful_crawls']}/{result['total_sources']} sources successful")
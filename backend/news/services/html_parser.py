@@ -0,0 +1,150 @@
+"""
+Pluggable HTML Parsing for NaviGate Link Discovery
+
+Section pages and homepages are only searched with CSS selectors for links,
+titles and meta tags, so they do not need a BeautifulSoup tree built with the
+pure-Python html.parser. parse_html() returns a page with a small
+BeautifulSoup-like API (select, select_one, title; elements with get,
+get_text and str()) backed by the parser chosen in CRAWLER_HTML_PARSER:
+
+- 'lxml' (default): libxml2 tree queried with compiled CSS selectors
+- 'html.parser': BeautifulSoup with html.parser (previous behaviour)
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Dict, List, Optional, Type, Union
+
+import lxml.html
+from bs4 import BeautifulSoup
+from django.conf import settings
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+logger = logging.getLogger(__name__)
+
+
+class HTMLPage(ABC):
+    """Parsed page; backends implement select()"""
+
+    def __init__(self, content: Union[bytes, str]):
+        self.content = content
+
+    @abstractmethod
+    def select(self, selector: str) -> List:
+        """Elements matching a CSS selector, in document order"""
+
+    def select_one(self, selector: str):
+        """First element matching a CSS selector, or None"""
+        elements = self.select(selector)
+        return elements[0] if elements else None
+
+    def title(self) -> Optional[str]:
+        """Text of the <title> element"""
+        title_tag = self.select_one('title')
+        return title_tag.get_text().strip() if title_tag is not None else None
+
+
+class SoupPage(HTMLPage):
+    """BeautifulSoup with the pure-Python html.parser"""
+
+    def __init__(self, content: Union[bytes, str]):
+        super().__init__(content)
+        self.soup = BeautifulSoup(content, 'html.parser')
+
+    def select(self, selector: str) -> List:
+        return self.soup.select(selector)
+
+
+class LxmlElement:
+    """lxml element with the BeautifulSoup Tag methods link discovery uses"""
+
+    __slots__ = ('node',)
+
+    # Text nodes as BeautifulSoup's get_text() returns them (no script, style or template)
+    TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+
+    def __init__(self, node: lxml.html.HtmlElement):
+        self.node = node
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self.node.get(name, default)
+
+    def get_text(self, strip: bool = False) -> str:
+        texts = self.TEXT_XPATH(self.node)
+        if strip:
+            return ''.join(text.strip() for text in texts)
+        return ''.join(texts)
+
+    def __str__(self) -> str:
+        return lxml.html.tostring(self.node, encoding='unicode', with_tail=False)
+
+
+@lru_cache(maxsize=256)
+def _compiled_selector(selector: str) -> CSSSelector:
+    """CSS selector compiled to XPath once per process"""
+    return CSSSelector(selector)
+
+
+class LxmlPage(HTMLPage):
+    """libxml2 HTML parser queried with compiled CSS selectors"""
+
+    def __init__(self, content: Union[bytes, str]):
+        super().__init__(content)
+        self.tree = self._parse(content)
+
+    @staticmethod
+    def _parse(content: Union[bytes, str]) -> lxml.html.HtmlElement:
+        """
+        Parse a page, decoding UTF-8 ourselves
+
+        libxml2 assumes Latin-1 for byte strings without a charset
+        declaration, which would garble Spanish text served as UTF-8.
+        """
+        if isinstance(content, bytes):
+            try:
+                content = content.decode('utf-8')
+            except UnicodeDecodeError:
+                pass  # Let libxml2 use the declared charset
+
+        try:
+            return lxml.html.document_fromstring(content)
+        except ValueError:
+            # Text with an XML encoding declaration: parse it as bytes
+            try:
+                return lxml.html.document_fromstring(content.encode('utf-8'))
+            except etree.ParserError:
+                pass
+        except etree.ParserError:
+            pass  # Empty document
+
+        return lxml.html.document_fromstring('<html></html>')
+
+    def select(self, selector: str) -> List[LxmlElement]:
+        return [LxmlElement(node) for node in _compiled_selector(selector)(self.tree)]
+
+
+PARSERS: Dict[str, Type[HTMLPage]] = {
+    'lxml': LxmlPage,
+    'html.parser': SoupPage,
+}
+
+
+def parse_html(content: Union[bytes, str], parser: Optional[str] = None) -> HTMLPage:
+    """
+    Parse a page for link discovery
+
+    Args:
+        content: Page HTML (bytes as downloaded, or text)
+        parser: Backend name (default: settings.CRAWLER_HTML_PARSER)
+
+    Returns:
+        Parsed HTMLPage
+    """
+    parser = parser or getattr(settings, 'CRAWLER_HTML_PARSER', 'lxml')
+    page_class = PARSERS.get(parser)
+    if page_class is None:
+        logger.warning(f"Unknown HTML parser '{parser}', using lxml")
+        page_class = LxmlPage
+    return page_class(content)
@@ -2,7 +2,7 @@
 Manual News Crawler Service for NaviGate
 
 This service performs manual crawling of news websites that don't have RSS feeds,
-using content extraction libraries like Trafilatura and BeautifulSoup to extract
+using content extraction libraries like Trafilatura and lxml to extract
 articles, metadata, and site structure.
 """
 
@@ -12,20 +12,40 @@ import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs
-import urllib.robotparser
 
 import requests
-from bs4 import BeautifulSoup
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
 import trafilatura
 from trafilatura.settings import use_config
+from trafilatura.utils import load_html
 import htmldate
 
+from .async_fetcher import AsyncFetcher
+from .html_parser import HTMLPage, parse_html
+from .response_store import mount_store
+from .robots_policy import RobotsPolicyStore
+
 logger = logging.getLogger(__name__)
 
 
 class ManualCrawlerService:
     """Service for manually crawling news websites without RSS feeds"""
 
+    # Fallback selectors for article pages, compiled once
+    AUTHOR_SELECTORS = [
+        CSSSelector(selector) for selector in (
+            '.author', '.byline', '.writer', '.journalist',
+            '[rel="author"]', '.post-author', '.article-author'
+        )
+    ]
+    DATE_SELECTORS = [
+        CSSSelector(selector) for selector in (
+            'time[datetime]', '.date', '.publish-date', '.article-date',
+            '.post-date', '[itemprop="datePublished"]'
+        )
+    ]
+
     def __init__(self, timeout: int = 15, user_agent: str = None, max_articles: int = 50):
         """
         Initialize manual crawler service
@@ -53,11 +73,20 @@ class ManualCrawlerService:
             'Connection': 'keep-alive',
         })
 
+        # Record or replay raw responses (CRAWLER_RESPONSE_STORE_MODE)
+        mount_store(self.session)
+
         # Setup trafilatura config for better Spanish content extraction
         self.trafilatura_config = use_config()
         self.trafilatura_config.set("DEFAULT", "EXTRACTION_TIMEOUT", "10")
         self.trafilatura_config.set("DEFAULT", "MIN_EXTRACTED_SIZE", "200")
 
+        # Concurrent page downloads, rate limited per host (no fixed sleeps)
+        self.fetcher = AsyncFetcher(headers=dict(self.session.headers), timeout=timeout)
+
+        # robots.txt policies, shared with the other workers through the cache
+        self.robots = RobotsPolicyStore(self.user_agent, session=self.session, timeout=timeout)
+
     def discover_site_structure(self, website_url: str) -> Dict[str, any]:
         """
         Discover the structure of a news website including sections and article patterns
@@ -88,22 +117,21 @@ class ManualCrawlerService:
             response = self.session.get(website_url, timeout=self.timeout)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page = parse_html(response.content)
 
             # Extract website title
-            title_tag = soup.find('title')
-            result['website_title'] = title_tag.get_text().strip() if title_tag else None
+            result['website_title'] = page.title()
 
             # Discover navigation sections
-            sections = self._discover_sections(soup, website_url)
+            sections = self._discover_sections(page, website_url)
             result['sections'] = sections
 
             # Analyze article link patterns
-            article_patterns = self._analyze_article_patterns(soup, website_url)
+            article_patterns = self._analyze_article_patterns(page, website_url)
             result['article_patterns'] = article_patterns
 
             # Look for pagination patterns
-            pagination_patterns = self._discover_pagination_patterns(soup, website_url)
+            pagination_patterns = self._discover_pagination_patterns(page, website_url)
             result['pagination_patterns'] = pagination_patterns
 
             result['success'] = True
@@ -144,31 +172,47 @@ class ManualCrawlerService:
                 result['errors'].append("Crawling not allowed by robots.txt")
                 return result
 
+            # Pace the site as its robots.txt asks
+            crawl_delay = self.robots.crawl_delay(section_url)
+            if crawl_delay:
+                self.fetcher.set_host_delay(section_url, crawl_delay)
+
             # Get section page
-            response = self.session.get(section_url, timeout=self.timeout)
-            response.raise_for_status()
+            section_page = self.fetcher.fetch_many([section_url])[0]
+            if not section_page['success']:
+                error_msg = f"Section crawl failed for {section_url}: {section_page['error']}"
+                logger.error(error_msg)
+                result['errors'].append(error_msg)
+                return result
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page = parse_html(section_page['content'])
 
             # Find article links
-            article_links = self._extract_article_links(soup, section_url)
+            article_links = self._extract_article_links(page, section_url)
             result['total_found'] = len(article_links)
 
             # Limit articles to crawl
             article_links = article_links[:max_articles]
 
+            # Download article pages concurrently; the fetcher keeps each
+            # host within its rate limit
+            pages = self.fetcher.fetch_many([link_info['url'] for link_info in article_links])
+
             # Extract articles
             articles = []
-            for link_info in article_links:
+            for link_info, page in zip(article_links, pages):
+                if not page['success']:
+                    logger.warning(f"Failed to fetch article {link_info['url']}: {page['error']}")
+                    continue
+
                 try:
-                    article = self._extract_article(link_info['url'], link_info.get('section'))
+                    article = self._extract_article(
+                        link_info['url'], link_info.get('section'), html=page['content']
+                    )
                     if article:
                         articles.append(article)
                         result['total_extracted'] += 1
 
-                    # Be respectful - wait between requests
-                    time.sleep(1)
-
                 except Exception as e:
                     error_msg = f"Failed to extract article {link_info['url']}: {str(e)}"
                     logger.warning(error_msg)
@@ -241,8 +285,7 @@ class ManualCrawlerService:
                 result['total_errors'] += len(section_result['errors'])
                 result['errors'].extend(section_result['errors'])
 
-                # Respectful delay between sections
-                time.sleep(2)
+                # No delay between sections: self.fetcher rate limits every host
 
             result['articles'] = all_articles
             result['total_articles'] = len(all_articles)
@@ -281,7 +324,7 @@ class ManualCrawlerService:
             response.raise_for_status()
 
             content = response.text.lower()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page = parse_html(response.content)
 
             # Check for JavaScript framework indicators
             frameworks_detected = []
@@ -296,7 +339,7 @@ class ManualCrawlerService:
                 frameworks_detected.append('Next.js')
 
             # Check for minimal HTML content (typical of SPAs)
-            body_text = soup.find('body')
+            body_text = page.select_one('body')
             if body_text:
                 visible_text = body_text.get_text(strip=True)
                 # If body has very little text but page loads in browser, likely SPA
@@ -304,20 +347,21 @@ class ManualCrawlerService:
                     result['indicators'].append('minimal_body_content')
 
             # Check script to content ratio
-            scripts = soup.find_all('script')
+            scripts = page.select('script')
             script_size = sum(len(str(script)) for script in scripts)
-            body_size = len(str(soup.find('body'))) if soup.find('body') else 0
+            body_size = len(str(body_text)) if body_text else 0
 
             if body_size > 0 and script_size > body_size * 2:
                 result['indicators'].append('high_script_ratio')
 
             # Check for article-like links
-            total_links = len(soup.find_all('a', href=True))
+            links = page.select('a[href]')
+            total_links = len(links)
             article_patterns = [
                 'article', 'post', 'noticia', 'news', 'story'
             ]
             article_like_links = 0
-            for link in soup.find_all('a', href=True):
+            for link in links:
                 href = link.get('href', '').lower()
                 text = link.get_text().lower()
                 if any(pattern in href or pattern in text for pattern in article_patterns):
@@ -344,21 +388,14 @@ class ManualCrawlerService:
         return result
 
     def _check_robots_txt(self, url: str) -> bool:
-        """Check if crawling is allowed by robots.txt"""
+        """Check if crawling is allowed by robots.txt (cached, see RobotsPolicyStore)"""
         try:
-            parsed_url = urlparse(url)
-            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
-
-            rp = urllib.robotparser.RobotFileParser()
-            rp.set_url(robots_url)
-            rp.read()
-
-            return rp.can_fetch(self.user_agent, url)
+            return self.robots.can_fetch(url)
         except Exception as e:
             logger.warning(f"Could not check robots.txt for {url}: {e}")
             return True
 
-    def _discover_sections(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    def _discover_sections(self, page: HTMLPage, base_url: str) -> List[Dict]:
         """Discover navigation sections from the homepage"""
         sections = []
 
@@ -375,7 +412,7 @@ class ManualCrawlerService:
         ]
 
         for selector in nav_selectors:
-            nav_links = soup.select(selector)
+            nav_links = page.select(selector)
 
             for link in nav_links:
                 text = link.get_text().strip()
@@ -418,7 +455,7 @@ class ManualCrawlerService:
 
         return unique_sections[:10]  # Limit to 10 sections
 
-    def _analyze_article_patterns(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    def _analyze_article_patterns(self, page: HTMLPage, base_url: str) -> List[Dict]:
         """Analyze patterns in article links to understand site structure"""
         patterns = []
 
@@ -436,7 +473,7 @@ class ManualCrawlerService:
         ]
 
         for selector in article_selectors:
-            links = soup.select(selector)
+            links = page.select(selector)
             if len(links) >= 3:  # If we find at least 3 matching links, it's likely a pattern
                 urls = [urljoin(base_url, link.get('href')) for link in links if link.get('href')]
 
@@ -483,7 +520,7 @@ class ManualCrawlerService:
             'total_urls': len(urls)
         }
 
-    def _discover_pagination_patterns(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    def _discover_pagination_patterns(self, page: HTMLPage, base_url: str) -> List[Dict]:
         """Discover pagination patterns for navigating through article lists"""
         patterns = []
 
@@ -497,7 +534,7 @@ class ManualCrawlerService:
         ]
 
         for selector in pagination_selectors:
-            links = soup.select(selector)
+            links = page.select(selector)
             if links:
                 next_links = []
                 for link in links:
@@ -516,7 +553,7 @@ class ManualCrawlerService:
 
         return patterns
 
-    def _extract_article_links(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    def _extract_article_links(self, page: HTMLPage, base_url: str) -> List[Dict]:
         """Extract article links from a section page"""
         article_links = []
 
@@ -547,7 +584,7 @@ class ManualCrawlerService:
         seen_urls = set()
 
         for strategy in strategies:
-            links = soup.select(strategy['selector'])
+            links = page.select(strategy['selector'])
 
             for link in links:
                 href = link.get('href')
@@ -621,15 +658,33 @@ class ManualCrawlerService:
 
         return None
 
-    def _extract_article(self, article_url: str, section: str = None) -> Optional[Dict]:
-        """Extract full article content from URL"""
+    def _extract_article(self, article_url: str, section: str = None, html: bytes = None) -> Optional[Dict]:
+        """
+        Extract full article content from URL
+
+        The page is parsed once into an lxml tree shared by trafilatura,
+        htmldate and the fallback selectors (each library copies the tree
+        before modifying it).
+
+        Args:
+            article_url: Article URL
+            section: Section the article was found in
+            html: Page already downloaded (see crawl_section); fetched if omitted
+        """
         try:
-            response = self.session.get(article_url, timeout=self.timeout)
-            response.raise_for_status()
+            if html is None:
+                response = self.session.get(article_url, timeout=self.timeout)
+                response.raise_for_status()
+                html = response.content
+
+            tree = load_html(html)
+            if tree is None:
+                logger.warning(f"Could not parse article HTML: {article_url}")
+                return None
 
             # Use trafilatura for main content extraction
             article_text = trafilatura.extract(
-                response.content,
+                tree,
                 config=self.trafilatura_config,
                 include_comments=False,
                 include_tables=True
@@ -640,19 +695,16 @@ class ManualCrawlerService:
                 return None
 
             # Extract metadata using trafilatura
-            metadata = trafilatura.extract_metadata(response.content)
-
-            # Parse HTML for additional metadata
-            soup = BeautifulSoup(response.content, 'html.parser')
+            metadata = trafilatura.extract_metadata(tree)
 
             # Extract title
             title = None
             if metadata and metadata.title:
                 title = metadata.title
             else:
-                title_tag = soup.find('title')
-                if title_tag:
-                    title = title_tag.get_text().strip()
+                title_tag = tree.find('.//title')
+                if title_tag is not None:
+                    title = title_tag.text_content().strip()
 
             # Extract author
             author = None
@@ -660,15 +712,9 @@ class ManualCrawlerService:
                 author = metadata.author
             else:
                 # Try common author selectors
-                author_selectors = [
-                    '.author', '.byline', '.writer', '.journalist',
-                    '[rel="author"]', '.post-author', '.article-author'
-                ]
-                for selector in author_selectors:
-                    author_element = soup.select_one(selector)
-                    if author_element:
-                        author = author_element.get_text().strip()
-                        break
+                author_element = self._select_first(tree, self.AUTHOR_SELECTORS)
+                if author_element is not None:
+                    author = author_element.text_content().strip()
 
             # Extract publication date
             published_date = None
@@ -676,7 +722,7 @@ class ManualCrawlerService:
                 published_date = metadata.date
             else:
                 # Use htmldate for date extraction
-                date_result = htmldate.find_date(response.content, original_date=True)
+                date_result = htmldate.find_date(tree, original_date=True)
                 if date_result:
                     try:
                         published_date = datetime.strptime(date_result, '%Y-%m-%d')
@@ -685,14 +731,11 @@ class ManualCrawlerService:
 
             # If no date found, try manual extraction
             if not published_date:
-                date_selectors = [
-                    'time[datetime]', '.date', '.publish-date', '.article-date',
-                    '.post-date', '[itemprop="datePublished"]'
-                ]
-                for selector in date_selectors:
-                    date_element = soup.select_one(selector)
-                    if date_element:
-                        date_text = date_element.get('datetime') or date_element.get_text()
+                for selector in self.DATE_SELECTORS:
+                    date_elements = selector(tree)
+                    if date_elements:
+                        date_element = date_elements[0]
+                        date_text = date_element.get('datetime') or date_element.text_content()
                         published_date = self._parse_date_text(date_text)
                         if published_date:
                             break
@@ -720,6 +763,15 @@ class ManualCrawlerService:
             logger.error(f"Article extraction failed for {article_url}: {str(e)}")
             return None
 
+    @staticmethod
+    def _select_first(tree: HtmlElement, selectors: List[CSSSelector]) -> Optional[HtmlElement]:
+        """First element matched by the first selector that matches anything"""
+        for selector in selectors:
+            elements = selector(tree)
+            if elements:
+                return elements[0]
+        return None
+
     def _parse_date_text(self, date_text: str) -> Optional[datetime]:
         """Parse various date formats commonly found in Spanish news sites"""
         if not date_text:
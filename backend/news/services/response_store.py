@@ -0,0 +1,202 @@
+"""
+Raw Crawl Response Store for NaviGate News Crawler
+
+Keeps the raw responses downloaded by the crawler services on local disk, so
+articles can be re-extracted offline and extraction changes benchmarked
+without crawling the publishers again. CRAWLER_RESPONSE_STORE_MODE selects:
+
+- 'off' (default): nothing is stored
+- 'record': successful responses (and the redirects leading to them) are
+  stored as they are downloaded
+- 'replay': responses are read from the store instead of the network
+
+Layout under CRAWLER_RESPONSE_STORE_DIR (content-addressed):
+
+    blobs/<sha256 of body>.gz    gzip-compressed body, shared by identical pages
+    urls/<sha256 of URL>.json    URL, status, headers, body hash, fetch time
+"""
+
+import gzip
+import hashlib
+import http.client
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+OFF = 'off'
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+class ResponseStore:
+    """Content-addressed store of raw responses (latest response per URL)"""
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize store
+
+        Args:
+            root: Store directory (default: settings.CRAWLER_RESPONSE_STORE_DIR)
+        """
+        self.root = Path(root or getattr(settings, 'CRAWLER_RESPONSE_STORE_DIR', 'crawl_store'))
+
+    @classmethod
+    def mode(cls) -> str:
+        """Configured mode: 'off', 'record' or 'replay'"""
+        return getattr(settings, 'CRAWLER_RESPONSE_STORE_MODE', OFF)
+
+    @classmethod
+    def from_settings(cls) -> Optional['ResponseStore']:
+        """Configured store, or None when the store is off"""
+        if cls.mode() not in (RECORD, REPLAY):
+            return None
+        return cls()
+
+    @staticmethod
+    def url_key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.root / 'blobs' / content_hash[:2] / f'{content_hash}.gz'
+
+    def _record_path(self, url: str) -> Path:
+        key = self.url_key(url)
+        return self.root / 'urls' / key[:2] / f'{key}.json'
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        """Write a file atomically (concurrent crawls may store the same page)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def save(self, url: str, status_code: int, headers: Mapping[str, str], content: bytes) -> str:
+        """
+        Store a response
+
+        Args:
+            url: Requested URL
+            status_code: HTTP status
+            headers: Response headers
+            content: Response body (decoded transfer encoding)
+
+        Returns:
+            Content hash (sha256) of the body
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+
+        blob_path = self._blob_path(content_hash)
+        if not blob_path.exists():
+            self._write(blob_path, gzip.compress(content))
+
+        record = {
+            'url': url,
+            'status_code': status_code,
+            'headers': dict(headers),
+            'content_hash': content_hash,
+            'fetched_at': datetime.now(timezone.utc).isoformat(),
+        }
+        self._write(self._record_path(url), json.dumps(record, ensure_ascii=False).encode())
+
+        return content_hash
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Stored response of a URL
+
+        Returns:
+            Record dict (url, status_code, headers, content_hash, fetched_at)
+            with the body as 'content', or None if the URL is not stored
+        """
+        try:
+            record = json.loads(self._record_path(url).read_bytes())
+            record['content'] = gzip.decompress(self._blob_path(record['content_hash']).read_bytes())
+        except FileNotFoundError:
+            return None
+        return record
+
+    def urls(self) -> Iterator[str]:
+        """Every stored URL (for bulk re-extraction)"""
+        for path in sorted((self.root / 'urls').glob('*/*.json')):
+            yield json.loads(path.read_bytes())['url']
+
+
+class StoreAdapter(HTTPAdapter):
+    """
+    requests transport that records responses to, or replays them from, a
+    ResponseStore
+
+    The adapter sees every hop of a redirect chain, so redirects are stored
+    too and replaying the originally requested URL follows the same chain.
+    In replay mode URLs missing from the store get a 404 response, so
+    callers treat them as unavailable pages (and robots.txt as absent).
+    """
+
+    def __init__(self, store: ResponseStore, replay: bool = False, **kwargs):
+        self.store = store
+        self.replay = replay
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.replay:
+            return self._replay(request)
+
+        response = super().send(request, **kwargs)
+        storable = 200 <= response.status_code < 300 or response.is_redirect
+        if storable and not kwargs.get('stream'):
+            try:
+                self.store.save(request.url, response.status_code, response.headers, response.content)
+            except OSError as e:
+                logger.warning(f"Could not store response for {request.url}: {e}")
+        return response
+
+    def _replay(self, request: requests.PreparedRequest) -> requests.Response:
+        """Build a response from the store"""
+        record = self.store.load(request.url)
+
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content_consumed = True
+
+        if record is None:
+            response.status_code = 404
+            response.reason = 'Not in response store'
+            response._content = b''
+            return response
+
+        response.status_code = record['status_code']
+        response.reason = http.client.responses.get(record['status_code'], '')
+        response.headers = CaseInsensitiveDict(record['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = record['content']
+        return response
+
+
+def mount_store(session: requests.Session) -> requests.Session:
+    """Record or replay a session's responses as configured (no-op when off)"""
+    store = ResponseStore.from_settings()
+    if store is not None:
+        adapter = StoreAdapter(store, replay=ResponseStore.mode() == REPLAY)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    return session
@@ -0,0 +1,171 @@
+"""
+Shared robots.txt Policy Store for NaviGate News Crawler
+
+Every host's robots.txt is downloaded once per CRAWLER_ROBOTS_TTL and kept in
+the shared cache (Redis, see CACHES), so crawler services and Celery workers
+stop fetching it again for every section, discovery run and source. Parsed
+policies are also kept in memory for the lifetime of the store.
+
+When crawl responses are replayed (see response_store), policies come from
+the store and stay in memory only: a robots.txt missing from the store must
+not overwrite the live policy the other workers share.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+import urllib.robotparser
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+from .response_store import REPLAY, ResponseStore
+
+logger = logging.getLogger(__name__)
+
+ROBOTS_KEY = 'news:robots:{host}'
+ERROR_TTL = 60 * 5  # Unreachable robots.txt: retry soon
+
+
+class RobotsPolicyStore:
+    """Per-host robots.txt policies with a TTL, shared through the cache"""
+
+    def __init__(
+        self,
+        user_agent: str,
+        session: Optional[requests.Session] = None,
+        timeout: float = 10,
+        ttl: Optional[int] = None
+    ):
+        """
+        Initialize policy store
+
+        Args:
+            user_agent: User agent the rules are matched against (and sent)
+            session: Session used to download robots.txt
+            timeout: Download timeout in seconds
+            ttl: Seconds a downloaded policy stays valid (default: settings.CRAWLER_ROBOTS_TTL)
+        """
+        self.user_agent = user_agent
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.ttl = ttl or getattr(settings, 'CRAWLER_ROBOTS_TTL', 60 * 60 * 24)
+        self.shared = ResponseStore.mode() != REPLAY
+        self._parsers: Dict[str, Tuple[float, urllib.robotparser.RobotFileParser]] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """scheme://netloc the robots.txt of url belongs to"""
+        parsed_url = urlparse(url)
+        return f"{parsed_url.scheme}://{parsed_url.netloc}".lower()
+
+    def can_fetch(self, url: str) -> bool:
+        """Check if crawling url is allowed by its host's robots.txt"""
+        return self.get_parser(url).can_fetch(self.user_agent, url)
+
+    def crawl_delay(self, url: str) -> Optional[float]:
+        """
+        Seconds to wait between requests to url's host, if robots.txt asks
+
+        Uses Crawl-delay, or Request-rate when only that is given.
+        """
+        parser = self.get_parser(url)
+
+        delay = parser.crawl_delay(self.user_agent)
+        if delay is not None:
+            return float(delay)
+
+        rate = parser.request_rate(self.user_agent)
+        if rate is not None and rate.requests:
+            return rate.seconds / rate.requests
+
+        return None
+
+    def get_parser(self, url: str) -> urllib.robotparser.RobotFileParser:
+        """Parsed robots.txt of url's host (memory, then shared cache, then download)"""
+        host = self.host_of(url)
+
+        expires_at, parser = self._parsers.get(host, (0, None))
+        if parser is not None and expires_at > time.time():
+            return parser
+
+        policy = self._get_cached(host) if self.shared else None
+        if policy is None:
+            policy = self._download(host)
+            if self.shared:
+                self._set_cached(host, policy)
+
+        parser = self._build_parser(host, policy)
+        self._parsers[host] = (policy['expires_at'], parser)
+        return parser
+
+    def _download(self, host: str) -> Dict[str, Any]:
+        """
+        Download a host's robots.txt
+
+        Mirrors RobotFileParser.read(): 401/403 disallow everything, other
+        4xx allow everything. Network errors and 5xx allow crawling, as the
+        crawler always did, but are only kept for ERROR_TTL.
+
+        Returns:
+            Picklable policy dict: rules ('rules', 'allow_all' or
+            'disallow_all'), lines and expires_at
+        """
+        robots_url = f"{host}/robots.txt"
+        policy = {'rules': 'allow_all', 'lines': [], 'expires_at': time.time() + self.ttl}
+
+        try:
+            response = self.session.get(robots_url, timeout=self.timeout)
+
+            if response.status_code in (401, 403):
+                policy['rules'] = 'disallow_all'
+            elif response.status_code >= 500:
+                logger.warning(f"robots.txt unavailable for {host}: HTTP {response.status_code}")
+                policy['expires_at'] = time.time() + ERROR_TTL
+            elif response.status_code < 400:
+                policy['rules'] = 'rules'
+                policy['lines'] = response.text.splitlines()
+
+        except requests.RequestException as e:
+            logger.warning(f"Could not check robots.txt for {host}: {e}")
+            policy['expires_at'] = time.time() + ERROR_TTL
+
+        return policy
+
+    @staticmethod
+    def _build_parser(host: str, policy: Dict[str, Any]) -> urllib.robotparser.RobotFileParser:
+        """RobotFileParser for a cached policy"""
+        parser = urllib.robotparser.RobotFileParser(f"{host}/robots.txt")
+
+        if policy['rules'] == 'disallow_all':
+            parser.disallow_all = True
+        elif policy['rules'] == 'allow_all':
+            parser.allow_all = True
+        else:
+            parser.parse(policy['lines'])
+
+        return parser
+
+    @staticmethod
+    def _get_cached(host: str) -> Optional[Dict[str, Any]]:
+        """Policy stored in the shared cache, if still valid (never raises)"""
+        try:
+            policy = cache.get(ROBOTS_KEY.format(host=host))
+        except Exception as e:
+            logger.warning(f"robots.txt cache unavailable: {e}")
+            return None
+
+        if policy is None or policy['expires_at'] <= time.time():
+            return None
+        return policy
+
+    @staticmethod
+    def _set_cached(host: str, policy: Dict[str, Any]) -> None:
+        """Share a policy with the other workers (never raises)"""
+        timeout = max(1, int(policy['expires_at'] - time.time()))
+        try:
+            cache.set(ROBOTS_KEY.format(host=host), policy, timeout=timeout)
+        except Exception as e:
+            logger.warning(f"robots.txt cache unavailable: {e}")
@@ -8,13 +8,16 @@ This service automatically discovers RSS feeds from news websites using multiple
 """
 
 import logging
-import time
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
-import urllib.robotparser
 import requests
-from bs4 import BeautifulSoup
 import feedparser
+from django.conf import settings
+
+from .async_fetcher import AsyncFetcher
+from .html_parser import HTMLPage, parse_html
+from .response_store import mount_store
+from .robots_policy import RobotsPolicyStore
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,14 @@ logger = logging.getLogger(__name__)
 class RSSDiscoveryService:
     """Service for discovering RSS feeds from news websites"""
 
+    # Reported discovery method of each kind of candidate feed
+    DISCOVERY_METHODS = {
+        'html_head': 'html_parsing',
+        'html_content': 'html_parsing',
+        'common_location': 'common_locations',
+        'cms_pattern': 'cms_patterns',
+    }
+
     def __init__(self, timeout: int = 10, user_agent: str = None):
         """
         Initialize RSS discovery service
@@ -45,6 +56,22 @@ class RSSDiscoveryService:
             'Connection': 'keep-alive',
         })
 
+        # Record or replay raw responses (CRAWLER_RESPONSE_STORE_MODE)
+        mount_store(self.session)
+
+        # robots.txt policies, shared with the other workers through the cache
+        self.robots = RobotsPolicyStore(self.user_agent, session=self.session, timeout=timeout)
+
+        # Candidate feeds are probed concurrently, a few at a time per host
+        per_host = getattr(settings, 'RSS_DISCOVERY_PER_HOST', 4)
+        self.fetcher = AsyncFetcher(
+            headers=dict(self.session.headers),
+            timeout=timeout,
+            rate_per_host=getattr(settings, 'RSS_DISCOVERY_HOST_RATE', 5.0),
+            burst=per_host,
+            per_host=per_host
+        )
+
     def discover_rss_feeds(self, website_url: str) -> Dict[str, any]:
         """
         Discover RSS feeds for a given website
@@ -74,29 +101,35 @@ class RSSDiscoveryService:
                 result['error'] = "Crawling not allowed by robots.txt"
                 return result
 
-            # Try multiple discovery methods
-            feeds = []
-
-            # Method 1: Parse HTML for RSS links
-            html_feeds = self._discover_from_html(website_url)
-            if html_feeds:
-                feeds.extend(html_feeds)
-                result['discovery_methods'].append('html_parsing')
+            # Get the homepage once: it has the feed links and the site info
+            homepage = self.fetcher.fetch_many([website_url])[0]
+            page = None
+            if homepage['success']:
+                page = parse_html(homepage['content'])
+            else:
+                logger.warning(f"HTML parsing failed for {website_url}: {homepage['error']}")
 
-            # Method 2: Try common RSS locations
-            common_feeds = self._try_common_locations(website_url)
-            if common_feeds:
-                feeds.extend(common_feeds)
-                result['discovery_methods'].append('common_locations')
+            head_feeds, content_feeds = self._discover_from_html(page, website_url)
 
-            # Method 3: Try WordPress/CMS specific patterns
-            cms_feeds = self._try_cms_patterns(website_url)
-            if cms_feeds:
-                feeds.extend(cms_feeds)
-                result['discovery_methods'].append('cms_patterns')
+            # Probe candidates concurrently, best kind first (see
+            # _select_primary_feed), and stop at the first kind that has
+            # a valid feed
+            candidate_tiers = [
+                head_feeds,
+                self._try_common_locations(website_url) + self._try_cms_patterns(website_url),
+                content_feeds,
+            ]
+            unique_feeds = []
+            seen_urls = set()
+            for candidates in candidate_tiers:
+                unique_feeds = self._deduplicate_and_validate_feeds(candidates, seen_urls)
+                if unique_feeds:
+                    break
 
-            # Remove duplicates and validate feeds
-            unique_feeds = self._deduplicate_and_validate_feeds(feeds)
+            for feed in unique_feeds:
+                method = self.DISCOVERY_METHODS[feed['discovery_method']]
+                if method not in result['discovery_methods']:
+                    result['discovery_methods'].append(method)
 
             if unique_feeds:
                 result['success'] = True
@@ -104,7 +137,7 @@ class RSSDiscoveryService:
                 result['primary_feed'] = self._select_primary_feed(unique_feeds)
 
                 # Get website title and sections
-                title, sections = self._extract_website_info(website_url)
+                title, sections = self._extract_website_info(page, website_url)
                 result['website_title'] = title
                 result['discovered_sections'] = sections
             else:
@@ -117,72 +150,68 @@ class RSSDiscoveryService:
         return result
 
     def _check_robots_txt(self, website_url: str) -> bool:
-        """Check if crawling is allowed by robots.txt"""
+        """Check if crawling is allowed by robots.txt (cached, see RobotsPolicyStore)"""
         try:
-            parsed_url = urlparse(website_url)
-            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
-
-            rp = urllib.robotparser.RobotFileParser()
-            rp.set_url(robots_url)
-            rp.read()
-
-            return rp.can_fetch(self.user_agent, website_url)
+            return self.robots.can_fetch(website_url)
         except Exception as e:
             logger.warning(f"Could not check robots.txt for {website_url}: {e}")
             return True  # Allow crawling if robots.txt check fails
 
-    def _discover_from_html(self, website_url: str) -> List[Dict]:
-        """Discover RSS feeds by parsing HTML head section"""
-        feeds = []
+    def _discover_from_html(
+        self,
+        page: Optional[HTMLPage],
+        website_url: str
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Find feed links in the homepage
 
-        try:
-            response = self.session.get(website_url, timeout=self.timeout)
-            response.raise_for_status()
+        Returns:
+            (feeds linked in the HTML head, RSS-looking links in the page content)
+        """
+        head_feeds = []
+        content_feeds = []
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Look for RSS/Atom links in head
-            rss_links = soup.find_all('link', {
-                'type': ['application/rss+xml', 'application/atom+xml', 'application/xml']
-            })
-
-            for link in rss_links:
-                href = link.get('href')
-                if href:
-                    absolute_url = urljoin(website_url, href)
-                    title = link.get('title', 'RSS Feed')
-                    feed_type = link.get('type', 'application/rss+xml')
-
-                    feeds.append({
-                        'url': absolute_url,
-                        'title': title,
-                        'type': feed_type,
-                        'discovery_method': 'html_head'
-                    })
-
-            # Also look for RSS links in the page content
-            rss_text_links = soup.find_all('a', href=True)
-            for link in rss_text_links:
-                href = link.get('href', '').lower()
-                text = link.get_text().lower()
-
-                if any(keyword in href or keyword in text for keyword in ['rss', 'feed', 'xml', 'atom']):
-                    absolute_url = urljoin(website_url, link['href'])
-                    feeds.append({
-                        'url': absolute_url,
-                        'title': link.get_text() or 'RSS Feed',
-                        'type': 'application/rss+xml',
-                        'discovery_method': 'html_content'
-                    })
+        if page is None:
+            return head_feeds, content_feeds
 
-        except Exception as e:
-            logger.warning(f"HTML parsing failed for {website_url}: {e}")
+        # Look for RSS/Atom links in head
+        rss_links = page.select(
+            'link[type="application/rss+xml"], link[type="application/atom+xml"], link[type="application/xml"]'
+        )
 
-        return feeds
+        for link in rss_links:
+            href = link.get('href')
+            if href:
+                absolute_url = urljoin(website_url, href)
+                title = link.get('title', 'RSS Feed')
+                feed_type = link.get('type', 'application/rss+xml')
+
+                head_feeds.append({
+                    'url': absolute_url,
+                    'title': title,
+                    'type': feed_type,
+                    'discovery_method': 'html_head'
+                })
+
+        # Also look for RSS links in the page content
+        rss_text_links = page.select('a[href]')
+        for link in rss_text_links:
+            href = link.get('href', '').lower()
+            text = link.get_text().lower()
+
+            if any(keyword in href or keyword in text for keyword in ['rss', 'feed', 'xml', 'atom']):
+                absolute_url = urljoin(website_url, link.get('href'))
+                content_feeds.append({
+                    'url': absolute_url,
+                    'title': link.get_text() or 'RSS Feed',
+                    'type': 'application/rss+xml',
+                    'discovery_method': 'html_content'
+                })
+
+        return head_feeds, content_feeds
 
     def _try_common_locations(self, website_url: str) -> List[Dict]:
-        """Try common RSS feed locations"""
-        feeds = []
+        """Candidate feeds at common RSS feed locations"""
         common_paths = [
             '/feed/',
             '/feeds/',
@@ -200,31 +229,18 @@ class RSSDiscoveryService:
 
         base_url = website_url.rstrip('/')
 
-        for path in common_paths:
-            try:
-                feed_url = base_url + path
-                response = self.session.head(feed_url, timeout=5)
-
-                if response.status_code == 200:
-                    content_type = response.headers.get('content-type', '').lower()
-                    if any(t in content_type for t in ['xml', 'rss', 'atom']):
-                        feeds.append({
-                            'url': feed_url,
-                            'title': f'RSS Feed ({path})',
-                            'type': 'application/rss+xml',
-                            'discovery_method': 'common_location'
-                        })
-
-                time.sleep(0.5)  # Be respectful to the server
-
-            except Exception:
-                continue  # Silently skip failed attempts
-
-        return feeds
+        return [
+            {
+                'url': base_url + path,
+                'title': f'RSS Feed ({path})',
+                'type': 'application/rss+xml',
+                'discovery_method': 'common_location'
+            }
+            for path in common_paths
+        ]
 
     def _try_cms_patterns(self, website_url: str) -> List[Dict]:
-        """Try CMS-specific RSS patterns (WordPress, Drupal, etc.)"""
-        feeds = []
+        """Candidate feeds at CMS-specific RSS locations (WordPress, Drupal, etc.)"""
         base_url = website_url.rstrip('/')
 
         cms_patterns = [
@@ -244,56 +260,52 @@ class RSSDiscoveryService:
             '/feeds/all.rss.xml',
         ]
 
-        for pattern in cms_patterns:
-            try:
-                feed_url = base_url + pattern
-                response = self.session.head(feed_url, timeout=3)
-
-                if response.status_code == 200:
-                    feeds.append({
-                        'url': feed_url,
-                        'title': f'CMS Feed ({pattern})',
-                        'type': 'application/rss+xml',
-                        'discovery_method': 'cms_pattern'
-                    })
-
-                time.sleep(0.3)
+        return [
+            {
+                'url': base_url + pattern,
+                'title': f'CMS Feed ({pattern})',
+                'type': 'application/rss+xml',
+                'discovery_method': 'cms_pattern'
+            }
+            for pattern in cms_patterns
+        ]
 
-            except Exception:
-                continue
+    def _deduplicate_and_validate_feeds(self, feeds: List[Dict], seen_urls: Set[str]) -> List[Dict]:
+        """
+        Remove duplicates and validate feeds
 
-        return feeds
+        Candidates are downloaded concurrently (at most
+        RSS_DISCOVERY_PER_HOST at once per host) and each downloaded body
+        is validated directly, so no feed is fetched twice.
 
-    def _deduplicate_and_validate_feeds(self, feeds: List[Dict]) -> List[Dict]:
-        """Remove duplicates and validate feeds"""
-        seen_urls = set()
-        valid_feeds = []
+        Args:
+            feeds: Candidate feed dicts
+            seen_urls: URLs already probed; updated in place
 
+        Returns:
+            Valid feeds, in candidate order
+        """
+        unique_feeds = []
         for feed in feeds:
-            url = feed['url']
-            if url in seen_urls:
-                continue
-
-            seen_urls.add(url)
+            if feed['url'] not in seen_urls:
+                seen_urls.add(feed['url'])
+                unique_feeds.append(feed)
 
-            # Validate feed by fetching and parsing
-            if self._validate_feed(url):
-                valid_feeds.append(feed)
+        pages = self.fetcher.fetch_many([feed['url'] for feed in unique_feeds])
 
-        return valid_feeds
+        return [
+            feed for feed, page in zip(unique_feeds, pages)
+            if page['success'] and self._validate_feed(page['content'])
+        ]
 
-    def _validate_feed(self, feed_url: str) -> bool:
-        """Validate that a URL actually contains a valid RSS/Atom feed"""
+    def _validate_feed(self, content: bytes) -> bool:
+        """Validate that a downloaded body is a valid RSS/Atom feed"""
         try:
-            response = self.session.get(feed_url, timeout=5)
-            if response.status_code != 200:
-                return False
-
             # Use feedparser to validate
-            feed = feedparser.parse(response.content)
+            feed = feedparser.parse(content)
 
             # Check if it's a valid feed with entries
-            return (
+            return bool(
                 hasattr(feed, 'version') and
                 feed.version and
                 len(feed.entries) > 0
@@ -326,16 +338,18 @@ class RSSDiscoveryService:
         # Finally, just return the first one
         return feeds[0]
 
-    def _extract_website_info(self, website_url: str) -> Tuple[Optional[str], List[str]]:
-        """Extract website title and discover main sections"""
-        try:
-            response = self.session.get(website_url, timeout=self.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+    def _extract_website_info(
+        self,
+        page: Optional[HTMLPage],
+        website_url: str
+    ) -> Tuple[Optional[str], List[str]]:
+        """Extract website title and discover main sections from the homepage"""
+        if page is None:
+            return None, []
 
+        try:
             # Get clean site name
-            site_name = self._extract_clean_site_name(soup, website_url)
+            site_name = self._extract_clean_site_name(page, website_url)
 
             # Discover main navigation sections
             sections = []
@@ -349,7 +363,7 @@ class RSSDiscoveryService:
             ]
 
             for selector in nav_selectors:
-                nav_links = soup.select(selector)
+                nav_links = page.select(selector)
                 for link in nav_links[:10]:  # Limit to first 10
                     text = link.get_text().strip()
                     href = link.get('href')
@@ -372,7 +386,7 @@ class RSSDiscoveryService:
             logger.warning(f"Could not extract website info for {website_url}: {e}")
             return None, []
 
-    def _extract_clean_site_name(self, soup: BeautifulSoup, website_url: str) -> Optional[str]:
+    def _extract_clean_site_name(self, page: HTMLPage, website_url: str) -> Optional[str]:
         """
         Extract clean site name from HTML using multiple strategies
 
@@ -382,19 +396,18 @@ class RSSDiscoveryService:
         3. Domain name (cleaned)
         """
         # Strategy 1: Check for og:site_name meta tag
-        og_site_name = soup.find('meta', property='og:site_name')
+        og_site_name = page.select_one('meta[property="og:site_name"]')
         if og_site_name and og_site_name.get('content'):
-            return og_site_name['content'].strip()
+            return og_site_name.get('content').strip()
 
         # Strategy 2: Check for application-name meta tag
-        app_name = soup.find('meta', {'name': 'application-name'})
+        app_name = page.select_one('meta[name="application-name"]')
         if app_name and app_name.get('content'):
-            return app_name['content'].strip()
+            return app_name.get('content').strip()
 
         # Strategy 3: Extract from title tag (common pattern: "Page Title | Site Name")
-        title_tag = soup.find('title')
-        if title_tag:
-            title_text = title_tag.get_text().strip()
+        title_text = page.title()
+        if title_text is not None:
 
             # Common separators used in titles
             separators = ['|', '-', '–', '—', ':', '•']
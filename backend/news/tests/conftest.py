@@ -0,0 +1,69 @@
+"""
+Shared fixtures for news tests
+
+stub_server serves canned pages on a local port, so crawler code runs its
+real HTTP stack without reaching the network.
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves server.pages ({path: (status, headers, body)}), 404 otherwise"""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.headers.get('Host'), self.path, time.monotonic()))
+
+        status, headers, body = server.pages.get(self.path, (404, {}, b'not found'))
+        if callable(body):
+            status, headers, body = body(self)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """
+    Local HTTP server; set server.pages, read server.requests
+    ([(host header, path, monotonic time)]). server.url(path, host=...)
+    builds URLs, with host '127.0.0.1' or 'localhost' for two distinct hosts.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.pages = {}
+    server.requests = []
+    server.lock = threading.Lock()
+    port = server.server_address[1]
+    server.url = lambda path, host='127.0.0.1': f'http://{host}:{port}{path}'
+
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    """Local-memory cache instead of Redis (not available in tests)"""
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'news-tests',
+        }
+    }
+    from django.core.cache import cache
+    cache.clear()
+    yield
+    cache.clear()
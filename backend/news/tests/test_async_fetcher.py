@@ -0,0 +1,125 @@
+"""
+Tests for the async page fetcher and the manual crawler using it
+"""
+import time
+
+from news.services import async_fetcher
+from news.services.async_fetcher import AsyncFetcher, TokenBucket
+from news.services.manual_crawler import ManualCrawlerService
+
+
+ARTICLE_TEXT = (
+    'El Atanasio Girardot recibirá este domingo el clásico paisa entre Nacional y Medellín. '
+    'Las autoridades esperan más de cuarenta mil asistentes y recomiendan llegar temprano al estadio. '
+    'Los bares y restaurantes de la zona preparan transmisiones especiales para los aficionados.'
+)
+
+
+def article_page(number):
+    return (
+        f'<html><head><title>Partido {number}</title></head><body><article>'
+        f'<h1>Clásico número {number}</h1><p>{ARTICLE_TEXT}</p><p>{ARTICLE_TEXT}</p>'
+        f'</article></body></html>'
+    ).encode()
+
+
+class TestTokenBucket:
+
+    def test_waits_grow_after_burst(self, monkeypatch):
+        monkeypatch.setattr(async_fetcher.time, 'monotonic', lambda: 100.0)
+        bucket = TokenBucket(rate=2.0, capacity=2)
+
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    def test_refills_over_time(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(async_fetcher.time, 'monotonic', lambda: now[0])
+        bucket = TokenBucket(rate=2.0, capacity=1)
+        bucket.reserve()
+
+        now[0] += 0.5
+        assert bucket.reserve() == 0.0
+
+
+class TestAsyncFetcher:
+
+    def test_hosts_in_parallel_each_rate_limited(self, stub_server):
+        for number in range(3):
+            stub_server.pages[f'/nota-{number}'] = (200, {}, article_page(number))
+        urls = [
+            stub_server.url(f'/nota-{number}', host=host)
+            for host in ('127.0.0.1', 'localhost') for number in range(3)
+        ]
+        fetcher = AsyncFetcher(rate_per_host=10.0, burst=1)
+
+        results = fetcher.fetch_many(urls)
+
+        assert [result['success'] for result in results] == [True] * 6
+        assert results[4]['content'] == article_page(1)
+
+        by_host = {}
+        for host, _, at in stub_server.requests:
+            by_host.setdefault(host.split(':')[0], []).append(at)
+        for times in by_host.values():
+            gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+            assert min(gaps) >= 0.08  # 10 requests/s per host
+        # Both hosts start right away
+        assert abs(by_host['127.0.0.1'][0] - by_host['localhost'][0]) < 0.08
+
+    def test_errors_are_reported_per_url(self, stub_server):
+        stub_server.pages['/ok'] = (200, {}, b'ok')
+        fetcher = AsyncFetcher()
+
+        ok, missing = fetcher.fetch_many([stub_server.url('/ok'), stub_server.url('/missing')])
+
+        assert ok['success'] and ok['content'] == b'ok'
+        assert not missing['success'] and missing['status_code'] == 404
+
+    def test_per_host_limit(self, stub_server):
+        in_flight = {'now': 0, 'max': 0}
+
+        def slow_page(handler):
+            with stub_server.lock:
+                in_flight['now'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            time.sleep(0.1)
+            with stub_server.lock:
+                in_flight['now'] -= 1
+            return 200, {}, b'ok'
+        for number in range(6):
+            stub_server.pages[f'/nota-{number}'] = (200, {}, slow_page)
+        fetcher = AsyncFetcher(rate_per_host=100.0, burst=10, per_host=2)
+
+        results = fetcher.fetch_many([stub_server.url(f'/nota-{number}') for number in range(6)])
+
+        assert all(result['success'] for result in results)
+        assert in_flight['max'] == 2
+
+
+class TestManualCrawlerSection:
+
+    def test_crawl_section_without_fixed_sleeps(self, stub_server, monkeypatch):
+        links = ''.join(
+            f'<article><h2><a href="/deportes/clasico-{number}">Titular del clásico número {number}</a></h2></article>'
+            for number in range(5)
+        )
+        stub_server.pages['/deportes/'] = (200, {}, f'<html><body>{links}</body></html>'.encode())
+        for number in range(5):
+            stub_server.pages[f'/deportes/clasico-{number}'] = (200, {}, article_page(number))
+
+        def no_sleep(seconds):
+            raise AssertionError('crawl_section should not sleep')
+        monkeypatch.setattr('news.services.manual_crawler.time.sleep', no_sleep)
+
+        crawler = ManualCrawlerService()
+        crawler.fetcher = AsyncFetcher(rate_per_host=50.0, burst=5)
+        started = time.monotonic()
+
+        result = crawler.crawl_section(stub_server.url('/deportes/'))
+
+        assert result['success'], result['errors']
+        assert result['total_found'] == 5
+        assert result['total_extracted'] == 5
+        assert result['articles'][0]['title'] == 'Clásico número 0'
+        assert result['articles'][0]['crawl_section'] == 'deportes'
+        assert time.monotonic() - started < 5
@@ -0,0 +1,190 @@
+"""
+Tests for RSS ingestion in ContentProcessorService
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from news.models import NewsArticle, NewsSource
+from news.services.content_processor import ContentProcessorService
+
+
+FEED_ITEM = '''
+<item>
+  <title>{title}</title>
+  <link>{link}</link>
+  <description>{description}</description>
+  <pubDate>Sun, 12 Oct 2025 18:00:00 GMT</pubDate>
+</item>'''
+
+
+def rss_feed(items):
+    body = ''.join(FEED_ITEM.format(**item) for item in items)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f'<title>El Colombiano</title><link>https://example.com/</link>{body}</channel></rss>'
+    ).encode()
+
+
+@pytest.fixture
+def no_ml_queue(monkeypatch):
+    """New articles would queue the ML Celery task (no broker in tests)"""
+    queued = []
+    monkeypatch.setattr(
+        'ml_engine.tasks.process_article_async.apply_async',
+        lambda args, **kwargs: queued.append(args[0]) or type('Task', (), {'id': 'stub'})()
+    )
+    return queued
+
+
+@pytest.fixture
+def feed_source(db, stub_server):
+    items = [
+        {
+            'title': f'Clásico paisa número {number} en el Atanasio Girardot',
+            'link': f'https://example.com/deportes/clasico-{number}',
+            'description': 'Nacional y Medellín se enfrentan este domingo en un clásico que promete '
+                           'llenar el estadio y los bares de la ciudad con miles de aficionados.',
+        }
+        for number in range(3)
+    ]
+    stub_server.feed = rss_feed(items)
+
+    def feed(handler):
+        if handler.headers.get('If-None-Match') == '"v1"':
+            return 304, {}, b''
+        return 200, {
+            'Content-Type': 'application/rss+xml',
+            'ETag': '"v1"',
+            'Last-Modified': 'Sun, 12 Oct 2025 18:00:00 GMT',
+        }, stub_server.feed
+    stub_server.pages['/rss'] = (200, {}, feed)
+
+    return NewsSource.objects.create(
+        name='El Colombiano', source_type='newspaper', country='CO', rss_url=stub_server.url('/rss')
+    )
+
+
+@pytest.mark.django_db
+class TestConditionalRSS:
+
+    def test_unchanged_feed_is_not_parsed(self, feed_source, stub_server, no_ml_queue, monkeypatch):
+        processor = ContentProcessorService()
+
+        first = processor._process_rss_feed(feed_source)
+        assert first['articles_saved'] == 3
+        feed_source.refresh_from_db()
+        assert feed_source.rss_etag == '"v1"'
+        assert feed_source.rss_last_modified == 'Sun, 12 Oct 2025 18:00:00 GMT'
+
+        def no_parse(*args, **kwargs):
+            raise AssertionError('feed should not be parsed')
+        monkeypatch.setattr('news.services.content_processor.feedparser.parse', no_parse)
+
+        second = processor._process_rss_feed(feed_source)
+
+        assert second['success'] and second['not_modified']
+        assert second['articles_found'] == 0
+        assert stub_server.requests[-1][1] == '/rss'
+
+    def test_not_modified_feed_is_a_successful_rss_crawl(self, feed_source, no_ml_queue, monkeypatch):
+        processor = ContentProcessorService()
+        processor.process_news_source(feed_source)
+
+        def no_manual_crawl(source):
+            raise AssertionError('an unchanged feed should not fall back to manual crawling')
+        monkeypatch.setattr(processor, '_process_manual_crawl', no_manual_crawl)
+
+        result = processor.process_news_source(feed_source)
+
+        assert result['success']
+        assert result['method_used'] == 'rss'
+        assert result['not_modified']
+        assert NewsArticle.objects.filter(source=feed_source).count() == 3
+
+
+def article_queries(queries):
+    return [query['sql'] for query in queries if '"news_newsarticle"' in query['sql']]
+
+
+@pytest.mark.django_db
+class TestBatchedArticleSaves:
+
+    def test_new_articles_are_bulk_inserted_and_queued(self, feed_source, no_ml_queue):
+        processor = ContentProcessorService()
+
+        with CaptureQueriesContext(connection) as queries:
+            result = processor._process_rss_feed(feed_source)
+
+        assert result['articles_saved'] == 3
+        statements = article_queries(queries.captured_queries)
+        assert len([sql for sql in statements if sql.startswith('SELECT')]) == 1
+        assert len([sql for sql in statements if sql.startswith('INSERT')]) == 1
+
+        articles = NewsArticle.objects.filter(source=feed_source)
+        assert sorted(no_ml_queue) == sorted(article.id for article in articles)
+        assert all(
+            article.content_hash == NewsArticle.hash_content(article.content) for article in articles
+        )
+
+    def test_known_articles_are_skipped_without_loading_content(self, feed_source, no_ml_queue):
+        processor = ContentProcessorService()
+        processor._process_rss_feed(feed_source)
+        NewsSource.objects.filter(pk=feed_source.pk).update(rss_etag='')
+        feed_source.refresh_from_db()
+
+        with CaptureQueriesContext(connection) as queries:
+            result = processor._process_rss_feed(feed_source)
+
+        assert result['articles_skipped'] == 3
+        statements = article_queries(queries.captured_queries)
+        assert len(statements) == 1
+        assert '"news_newsarticle"."content"' not in statements[0]
+        assert len(no_ml_queue) == 3
+
+    def test_changed_and_repeated_entries(self, feed_source, stub_server, no_ml_queue):
+        processor = ContentProcessorService()
+        processor._process_rss_feed(feed_source)
+        NewsSource.objects.filter(pk=feed_source.pk).update(rss_etag='')
+        feed_source.refresh_from_db()
+
+        description = ('Nacional y Medellín se enfrentan este domingo; la alcaldía anuncia '
+                       'pantallas gigantes en los parques de la ciudad para ver el clásico.')
+        stub_server.feed = rss_feed([
+            {'title': 'Clásico paisa número 0 en el Atanasio Girardot',
+             'link': 'https://example.com/deportes/clasico-0', 'description': description},
+            {'title': 'Feria de las Flores abre con desfile de silleteros',
+             'link': 'https://example.com/cultura/feria', 'description': description},
+            {'title': 'Feria de las Flores abre con desfile de silleteros',
+             'link': 'https://example.com/cultura/feria', 'description': description},
+        ])
+
+        result = processor._process_rss_feed(feed_source)
+
+        # Changed text of a known entry: crawler fields are protected
+        assert result['articles_updated'] == 0
+        assert result['articles_saved'] == 1
+        assert result['articles_skipped'] == 2
+        assert NewsArticle.objects.filter(url='https://example.com/cultura/feria').count() == 1
+
+    def test_changed_entry_is_not_rewritten_on_every_crawl(self, feed_source, stub_server, no_ml_queue):
+        processor = ContentProcessorService()
+        processor._process_rss_feed(feed_source)
+        stub_server.feed = rss_feed([{
+            'title': 'Clásico paisa número 0 en el Atanasio Girardot',
+            'link': 'https://example.com/deportes/clasico-0',
+            'description': 'Nacional y Medellín se enfrentan este domingo; la alcaldía anuncia '
+                           'pantallas gigantes en los parques de la ciudad para ver el clásico.',
+        }])
+
+        for _ in range(2):
+            NewsSource.objects.filter(pk=feed_source.pk).update(rss_etag='')
+            feed_source.refresh_from_db()
+            with CaptureQueriesContext(connection) as queries:
+                result = processor._process_rss_feed(feed_source)
+
+        assert result['articles_skipped'] == 1
+        assert result['articles_updated'] == 0
+        assert not [sql for sql in article_queries(queries.captured_queries) if sql.startswith('UPDATE')]
+        article = NewsArticle.objects.get(url='https://example.com/deportes/clasico-0')
+        assert article.content_hash == NewsArticle.hash_content(article.content)
@@ -0,0 +1,126 @@
+"""
+Tests for concurrent source crawling
+"""
+import threading
+import time
+from collections import Counter
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from news.models import NewsArticle, NewsSource
+from news.services.content_processor import ContentProcessorService
+from news.services.crawl_pool import CrawlPool
+from news.services.crawler_orchestrator import CrawlerOrchestratorService
+
+
+def make_sources(urls):
+    return [NewsSource(id=index, name=f'Fuente {index}', crawler_url=url) for index, url in enumerate(urls, 1)]
+
+
+@pytest.fixture
+def concurrent_database(monkeypatch):
+    """Database backend with concurrent writers (tests run on SQLite)"""
+    monkeypatch.setattr(connection, 'vendor', 'postgresql')
+
+
+@pytest.mark.usefixtures('concurrent_database')
+class TestCrawlPool:
+
+    def test_per_domain_limit(self):
+        sources = make_sources([
+            'https://www.eltiempo.com/deportes', 'https://eltiempo.com/cultura',
+            'https://www.elcolombiano.com/', 'https://www.semana.com/',
+        ])
+        running = Counter()
+        peak = Counter()
+        lock = threading.Lock()
+
+        def crawl(source):
+            domain = CrawlPool.source_domain(source)
+            with lock:
+                running[domain] += 1
+                running['all'] += 1
+                peak[domain] = max(peak[domain], running[domain])
+                peak['all'] = max(peak['all'], running['all'])
+            time.sleep(0.05)
+            with lock:
+                running[domain] -= 1
+                running['all'] -= 1
+            return {'success': True}
+
+        CrawlPool(max_workers=4, per_domain=1).map(crawl, sources)
+
+        assert peak['eltiempo.com'] == 1
+        assert peak['all'] > 1
+
+    def test_results_in_source_order_with_errors(self):
+        sources = make_sources(['https://a.com/', 'https://b.com/', 'https://c.com/'])
+
+        def crawl(source):
+            if source.id == 2:
+                raise ConnectionError('timeout')
+            time.sleep(0.02 * (3 - source.id))
+            return {'success': True, 'source_id': source.id}
+
+        results = CrawlPool(max_workers=3).map(crawl, sources)
+
+        assert [source.id for source, _, _ in results] == [1, 2, 3]
+        assert results[0][1] == {'success': True, 'source_id': 1}
+        assert isinstance(results[1][2], ConnectionError)
+
+
+@pytest.mark.django_db
+class TestBulkCrawl:
+
+    def test_results_merged(self, concurrent_database, monkeypatch):
+        for name in ('El Tiempo', 'Semana', 'El Colombiano'):
+            NewsSource.objects.create(
+                name=name, source_type='newspaper', country='CO',
+                crawler_url=f"https://{name.lower().replace(' ', '')}.com/"
+            )
+        threads = set()
+
+        def process_news_source(self, source, force_manual=False):
+            threads.add(threading.current_thread().name)
+            if source.name == 'Semana':
+                raise ConnectionError('timeout')
+            return {'success': True, 'articles_saved': 2, 'errors': []}
+        monkeypatch.setattr(ContentProcessorService, 'process_news_source', process_news_source)
+
+        result = CrawlerOrchestratorService().bulk_crawl(country_code='CO', max_workers=3)
+
+        assert result['total_sources'] == 3
+        assert result['successful_crawls'] == 2
+        assert result['failed_crawls'] == 1
+        assert result['total_articles'] == 4
+        assert result['errors'] == ['Failed to process source Semana: timeout']
+        assert all(name.startswith('crawl') for name in threads)
+
+
+@pytest.mark.django_db
+def test_sqlite_writes_run_serially(monkeypatch):
+    monkeypatch.setattr('ml_engine.tasks.process_article_async.apply_async', lambda *args, **kwargs: None)
+    sources = [
+        NewsSource.objects.create(
+            name=f'Fuente {index}', source_type='newspaper', country='CO', crawler_url=f'https://fuente{index}.com/'
+        )
+        for index in range(6)
+    ]
+    threads = set()
+
+    def crawl(source):
+        threads.add(threading.current_thread().name)
+        for number in range(3):
+            NewsArticle.objects.create(
+                source=source, title=f'Nota {number}', content='Contenido de la nota.',
+                url=f'{source.crawler_url}nota-{number}', published_date=timezone.now()
+            )
+        return {'success': True}
+
+    results = CrawlPool(max_workers=4).map(crawl, sources)
+
+    assert [error for _, _, error in results] == [None] * len(sources)
+    assert NewsArticle.objects.count() == 3 * len(sources)
+    assert threads == {threading.current_thread().name}
@@ -0,0 +1,94 @@
+"""
+Equivalence tests for the link discovery parsers
+
+Every backend in html_parser.PARSERS must find the same links, sections,
+patterns and feeds as BeautifulSoup's html.parser on the archived pages in
+news/tests/pages (home and section pages with the markup quirks seen on
+Colombian news sites: unclosed <li>, block elements inside <p>, entities,
+Latin-1 without a UTF-8 fallback, and a Next.js shell).
+"""
+from pathlib import Path
+
+import pytest
+
+from news.services import html_parser
+from news.services.html_parser import parse_html
+from news.services.manual_crawler import ManualCrawlerService
+from news.services.rss_discovery import RSSDiscoveryService
+
+PAGES = Path(__file__).parent / 'pages'
+
+BASE_URLS = {
+    'portada.html': 'https://www.elcolombiano.com/',
+    'seccion_deportes.html': 'https://www.eltiempo.com/deportes',
+    'spa_semana.html': 'https://www.semana.com/',
+}
+
+BACKENDS = [name for name in html_parser.PARSERS if name != 'html.parser']
+
+
+def discovery(content, base_url, parser):
+    """Everything the crawlers take from a parsed page"""
+    page = parse_html(content, parser)
+    crawler = ManualCrawlerService()
+    rss = RSSDiscoveryService()
+    return {
+        'title': page.title(),
+        'article_links': crawler._extract_article_links(page, base_url),
+        'sections': crawler._discover_sections(page, base_url),
+        'article_patterns': crawler._analyze_article_patterns(page, base_url),
+        'pagination': crawler._discover_pagination_patterns(page, base_url),
+        'feeds': rss._discover_from_html(page, base_url),
+        'website_info': rss._extract_website_info(page, base_url),
+    }
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('name', sorted(BASE_URLS))
+def test_discovery_matches_html_parser(name, backend):
+    content = (PAGES / name).read_bytes()
+
+    expected = discovery(content, BASE_URLS[name], 'html.parser')
+    assert discovery(content, BASE_URLS[name], backend) == expected
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('name', sorted(BASE_URLS))
+def test_spa_detection_matches_html_parser(name, backend, stub_server, settings):
+    stub_server.pages['/'] = (200, {'Content-Type': 'text/html'}, (PAGES / name).read_bytes())
+    crawler = ManualCrawlerService()
+
+    settings.CRAWLER_HTML_PARSER = 'html.parser'
+    expected = crawler.detect_spa_framework(stub_server.url('/'))
+    settings.CRAWLER_HTML_PARSER = backend
+
+    assert crawler.detect_spa_framework(stub_server.url('/')) == expected
+
+
+def test_archived_pages_exercise_discovery():
+    portada = discovery((PAGES / 'portada.html').read_bytes(), BASE_URLS['portada.html'], 'lxml')
+    section = discovery(
+        (PAGES / 'seccion_deportes.html').read_bytes(), BASE_URLS['seccion_deportes.html'], 'lxml'
+    )
+
+    assert [section['title'] for section in portada['sections']] == [
+        'Antioquia', 'Colombia', 'Deportes & Fútbol', 'Cultura', 'Negocios'
+    ]
+    assert len(portada['article_links']) == 5
+    head_feeds, content_feeds = portada['feeds']
+    assert [feed['url'] for feed in head_feeds] == [
+        'https://www.elcolombiano.com/rss/portada.xml', 'https://www.elcolombiano.com/rss/deportes.xml'
+    ]
+    assert [feed['url'] for feed in content_feeds] == [
+        'https://www.elcolombiano.com/rss', 'https://www.elcolombiano.com/servicios/feed-noticias'
+    ]
+    assert portada['pagination'][0]['next_urls'] == ['https://www.elcolombiano.com/?page=2']
+
+    assert section['title'] == 'Deportes - Últimas noticias deportivas - El Tiempo'
+    assert section['website_info'][0] == 'El Tiempo'
+    assert len(section['article_links']) == 8
+
+
+def test_default_backend_is_lxml():
+    assert isinstance(parse_html(b'<p>hola</p>'), html_parser.LxmlPage)
+    assert isinstance(parse_html(b'<p>hola</p>', 'desconocido'), html_parser.LxmlPage)
@@ -0,0 +1,52 @@
+"""
+Tests for article extraction in ManualCrawlerService
+"""
+from datetime import datetime
+
+from news.services import manual_crawler
+from news.services.manual_crawler import ManualCrawlerService
+from news.tests.test_async_fetcher import ARTICLE_TEXT
+
+
+def article_page(head='', byline=''):
+    return (
+        f'<html><head><title>Clásico paisa | El Colombiano</title>{head}</head><body>'
+        f'<div class="byline">{byline}</div><article><p>{ARTICLE_TEXT}</p><p>{ARTICLE_TEXT}</p>'
+        f'</article></body></html>'
+    ).encode()
+
+
+class TestExtractArticle:
+
+    def test_page_is_parsed_once(self, monkeypatch):
+        parses = []
+        real_load_html = manual_crawler.load_html
+        monkeypatch.setattr(manual_crawler, 'load_html', lambda html: parses.append(html) or real_load_html(html))
+
+        def no_page(*args, **kwargs):
+            raise AssertionError('article pages should not be parsed for link discovery')
+        monkeypatch.setattr(manual_crawler, 'parse_html', no_page)
+
+        article = ManualCrawlerService()._extract_article(
+            'https://example.com/deportes/clasico', 'deportes', html=article_page()
+        )
+
+        assert len(parses) == 1
+        assert article['content'].startswith('El Atanasio Girardot')
+        assert article['section'] == 'deportes'
+
+    def test_fallback_selectors(self, monkeypatch):
+        monkeypatch.setattr(manual_crawler.trafilatura, 'extract_metadata', lambda tree: None)
+        monkeypatch.setattr(manual_crawler.htmldate, 'find_date', lambda tree, **kwargs: None)
+        html = article_page(byline=' Redacción Deportes ').replace(
+            b'<article>', b'<article><time datetime="2025-10-12">12 de octubre</time>'
+        )
+
+        article = ManualCrawlerService()._extract_article('https://example.com/deportes/clasico', html=html)
+
+        assert article['title'] == 'Clásico paisa | El Colombiano'
+        assert article['author'] == 'Redacción Deportes'
+        assert article['published_date'] == datetime(2025, 10, 12)
+
+    def test_unparsable_page(self):
+        assert ManualCrawlerService()._extract_article('https://example.com/vacia', html=b'') is None
@@ -0,0 +1,79 @@
+"""
+Tests for NewsArticle protected crawler fields
+"""
+import pytest
+from django.utils import timezone
+
+from news.models import NewsArticle, NewsSource
+
+
+@pytest.fixture
+def article(db):
+    source = NewsSource.objects.create(name='El Colombiano', source_type='newspaper', country='CO')
+    NewsArticle.objects.create(
+        source=source,
+        title='Concierto en el Atanasio Girardot',
+        content='Contenido original del artículo.',
+        url='https://example.com/concierto',
+        published_date=timezone.now(),
+        features_extracted=True,
+    )
+    return NewsArticle.objects.get(url='https://example.com/concierto')
+
+
+@pytest.mark.django_db
+class TestNewsArticleSave:
+
+    def test_update_does_not_select(self, article, django_assert_num_queries):
+        article.event_type_detected = 'concert'
+
+        with django_assert_num_queries(1):
+            article.save()
+
+        assert NewsArticle.objects.get(pk=article.pk).event_type_detected == 'concert'
+
+    def test_protected_fields_are_restored(self, article):
+        article.title = 'Título cambiado'
+        article.content = 'Contenido cambiado'
+        article.event_scale = 'large'
+        article.save()
+
+        assert article.title == 'Concierto en el Atanasio Girardot'
+        stored = NewsArticle.objects.get(pk=article.pk)
+        assert stored.content == 'Contenido original del artículo.'
+        assert stored.event_scale == 'large'
+
+    def test_protected_fields_are_restored_after_create(self, article):
+        created = NewsArticle.objects.create(
+            source=article.source, title='Feria de las Flores', content='Contenido de la feria.',
+            url='https://example.com/feria', published_date=timezone.now(),
+        )
+        created.content = 'Contenido cambiado'
+        created.event_scale = 'massive'
+        created.save()
+
+        assert created.content == 'Contenido de la feria.'
+        stored = NewsArticle.objects.get(pk=created.pk)
+        assert stored.content == 'Contenido de la feria.'
+        assert stored.event_scale == 'massive'
+
+    def test_update_fields_drop_protected_fields(self, article, django_assert_num_queries):
+        article.url = 'https://example.com/otra'
+
+        with django_assert_num_queries(0):
+            article.save(update_fields=['url', 'source'])
+
+        article.category = 'entretenimiento'
+        article.save(update_fields=['content', 'category'])
+        assert NewsArticle.objects.get(pk=article.pk).category == 'entretenimiento'
+
+    def test_deferred_fields_are_not_written(self, article, django_assert_num_queries):
+        partial = NewsArticle.objects.only('id', 'event_scale').get(pk=article.pk)
+        partial.event_scale = 'massive'
+
+        with django_assert_num_queries(1):
+            partial.save()
+
+        stored = NewsArticle.objects.get(pk=article.pk)
+        assert stored.event_scale == 'massive'
+        assert stored.content == 'Contenido original del artículo.'
@@ -0,0 +1,146 @@
+"""
+Tests for the raw crawl response store and replay mode
+"""
+import asyncio
+
+import pytest
+from django.core.cache import cache
+
+from news.models import NewsSource
+from news.services.async_fetcher import AsyncFetcher
+from news.services.content_processor import ContentProcessorService
+from news.services.manual_crawler import ManualCrawlerService
+from news.services.response_store import ResponseStore
+from news.services.robots_policy import ROBOTS_KEY, RobotsPolicyStore
+from news.tests.test_async_fetcher import article_page
+from news.tests.test_content_processor import rss_feed
+
+
+@pytest.fixture
+def store_settings(settings, tmp_path):
+    settings.CRAWLER_RESPONSE_STORE_DIR = str(tmp_path / 'crawl_store')
+    settings.CRAWLER_HOST_RATE = 100.0
+    return settings
+
+
+@pytest.fixture
+def section_site(stub_server):
+    links = ''.join(
+        f'<article><h2><a href="/deportes/clasico-{number}">Clásico paisa número {number}</a></h2></article>'
+        for number in range(3)
+    )
+    stub_server.pages['/deportes/'] = (200, {'Content-Type': 'text/html'}, f'<html><body>{links}</body></html>'.encode())
+    for number in range(3):
+        stub_server.pages[f'/deportes/clasico-{number}'] = (200, {'Content-Type': 'text/html'}, article_page(number))
+    return stub_server
+
+
+class TestResponseStore:
+
+    def test_round_trip(self, tmp_path):
+        store = ResponseStore(tmp_path)
+
+        content_hash = store.save('https://example.com/a', 200, {'Content-Type': 'text/html'}, b'<html>a</html>')
+        record = store.load('https://example.com/a')
+
+        assert record['content'] == b'<html>a</html>'
+        assert record['headers'] == {'Content-Type': 'text/html'}
+        assert record['content_hash'] == content_hash
+        assert store.load('https://example.com/b') is None
+
+    def test_identical_bodies_share_a_blob(self, tmp_path):
+        store = ResponseStore(tmp_path)
+
+        store.save('https://example.com/a', 200, {}, b'misma pagina')
+        store.save('https://example.com/a?utm_source=x', 200, {}, b'misma pagina')
+
+        assert len(list((tmp_path / 'blobs').glob('*/*.gz'))) == 1
+        assert sorted(store.urls()) == ['https://example.com/a', 'https://example.com/a?utm_source=x']
+
+
+class TestReplay:
+
+    def test_section_crawl_replays_offline(self, section_site, store_settings):
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'record'
+        recorded = ManualCrawlerService().crawl_section(section_site.url('/deportes/'))
+        requests_made = len(section_site.requests)
+
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'replay'
+        replayed = ManualCrawlerService().crawl_section(section_site.url('/deportes/'))
+
+        assert recorded['total_extracted'] == 3
+        assert [a['content'] for a in replayed['articles']] == [a['content'] for a in recorded['articles']]
+        assert len(section_site.requests) == requests_made
+
+    def test_missing_urls_are_not_fetched(self, section_site, store_settings):
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'replay'
+        crawler = ManualCrawlerService()
+
+        result = crawler.crawl_section(section_site.url('/deportes/'))
+
+        assert not result['success']
+        assert 'Not in response store' in result['errors'][0]
+        assert crawler.session.get(section_site.url('/deportes/')).status_code == 404
+        assert section_site.requests == []
+
+    def test_fetch_all_replays_offline(self, section_site, store_settings):
+        urls = [section_site.url(f'/deportes/clasico-{number}') for number in range(3)]
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'record'
+        recorded = asyncio.run(AsyncFetcher().fetch_all(urls))
+        requests_made = len(section_site.requests)
+
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'replay'
+        replayed = asyncio.run(AsyncFetcher().fetch_all(urls + [section_site.url('/deportes/otra')]))
+
+        assert [r['content'] for r in replayed[:3]] == [r['content'] for r in recorded]
+        assert replayed[3]['error'] == 'Not in response store'
+        assert len(section_site.requests) == requests_made
+
+    def test_redirects_replay_from_the_requested_url(self, stub_server, store_settings):
+        stub_server.pages['/rss'] = (301, {'Location': '/feed/rss.xml'}, b'')
+        stub_server.pages['/feed/rss.xml'] = (200, {'Content-Type': 'application/rss+xml'}, b'<rss></rss>')
+
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'record'
+        recorded = ManualCrawlerService().session.get(stub_server.url('/rss'))
+        stub_server.pages.clear()
+
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'replay'
+        replayed = ManualCrawlerService().session.get(stub_server.url('/rss'))
+
+        assert recorded.status_code == 200
+        assert replayed.status_code == 200
+        assert replayed.content == b'<rss></rss>'
+        assert replayed.url == stub_server.url('/feed/rss.xml')
+        assert [r.status_code for r in replayed.history] == [301]
+
+    def test_replayed_robots_txt_is_not_shared(self, stub_server, store_settings):
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'replay'
+        crawler = ManualCrawlerService()
+
+        assert crawler._check_robots_txt(stub_server.url('/privado/nota'))
+        assert cache.get(ROBOTS_KEY.format(host=RobotsPolicyStore.host_of(stub_server.url('/')))) is None
+        assert stub_server.requests == []
+
+    @pytest.mark.django_db
+    def test_rss_feed_replays_offline(self, store_settings, stub_server, monkeypatch):
+        monkeypatch.setattr('ml_engine.tasks.process_article_async.apply_async', lambda *args, **kwargs: None)
+        stub_server.pages['/rss'] = (200, {'Content-Type': 'application/rss+xml'}, rss_feed([{
+            'title': 'Clásico paisa en el Atanasio Girardot',
+            'link': 'https://example.com/deportes/clasico',
+            'description': 'Nacional y Medellín se enfrentan este domingo en un clásico que promete '
+                           'llenar el estadio y los bares de la ciudad.',
+        }]))
+        source = NewsSource.objects.create(
+            name='El Colombiano', source_type='newspaper', country='CO', rss_url=stub_server.url('/rss')
+        )
+
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'record'
+        ContentProcessorService()._process_rss_feed(source)
+        stub_server.pages.clear()
+
+        store_settings.CRAWLER_RESPONSE_STORE_MODE = 'replay'
+        result = ContentProcessorService()._process_rss_feed(source)
+
+        assert result['success']
+        assert result['articles_found'] == 1
+        assert result['articles_skipped'] == 1
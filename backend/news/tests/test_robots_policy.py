@@ -0,0 +1,84 @@
+"""
+Tests for the shared robots.txt policy store
+"""
+import time
+
+import pytest
+
+from news.services.async_fetcher import AsyncFetcher
+from news.services.manual_crawler import ManualCrawlerService
+from news.services.robots_policy import RobotsPolicyStore
+
+ROBOTS_TXT = b'''User-agent: *
+Disallow: /privado/
+Crawl-delay: 4
+'''
+
+
+def robots_requests(server):
+    return [path for _, path, _ in server.requests if path == '/robots.txt']
+
+
+@pytest.fixture
+def robots_server(stub_server):
+    stub_server.pages['/robots.txt'] = (200, {'Content-Type': 'text/plain'}, ROBOTS_TXT)
+    return stub_server
+
+
+class TestRobotsPolicyStore:
+
+    def test_rules_and_crawl_delay(self, robots_server):
+        store = RobotsPolicyStore('NaviGate-Bot/1.0')
+
+        assert store.can_fetch(robots_server.url('/deportes/'))
+        assert not store.can_fetch(robots_server.url('/privado/nota'))
+        assert store.crawl_delay(robots_server.url('/deportes/')) == 4.0
+        assert len(robots_requests(robots_server)) == 1
+
+    def test_shared_between_stores_per_host(self, robots_server):
+        RobotsPolicyStore('NaviGate-Bot/1.0').can_fetch(robots_server.url('/deportes/'))
+
+        other_worker = RobotsPolicyStore('NaviGate-Bot/1.0')
+        assert not other_worker.can_fetch(robots_server.url('/privado/nota'))
+        assert len(robots_requests(robots_server)) == 1
+
+        other_worker.can_fetch(robots_server.url('/deportes/', host='localhost'))
+        assert len(robots_requests(robots_server)) == 2
+
+    def test_expired_policy_is_downloaded_again(self, robots_server, monkeypatch):
+        store = RobotsPolicyStore('NaviGate-Bot/1.0', ttl=60)
+        store.can_fetch(robots_server.url('/deportes/'))
+
+        now = time.time() + 61
+        monkeypatch.setattr('news.services.robots_policy.time.time', lambda: now)
+        store.can_fetch(robots_server.url('/deportes/'))
+
+        assert len(robots_requests(robots_server)) == 2
+
+    @pytest.mark.parametrize('status,allowed', [(404, True), (403, False), (503, True)])
+    def test_unavailable_robots_txt(self, stub_server, status, allowed):
+        stub_server.pages['/robots.txt'] = (status, {}, b'')
+        store = RobotsPolicyStore('NaviGate-Bot/1.0')
+
+        assert store.can_fetch(stub_server.url('/privado/nota')) is allowed
+
+
+def test_crawl_delay_slows_the_host_down(robots_server):
+    crawler = ManualCrawlerService()
+    robots_server.pages['/deportes/'] = (200, {'Content-Type': 'text/html'}, b'<html><body></body></html>')
+
+    crawler.crawl_section(robots_server.url('/deportes/'))
+    assert not crawler._check_robots_txt(robots_server.url('/privado/nota'))
+
+    bucket = crawler.fetcher.bucket_for(robots_server.url('/'))
+    assert bucket.rate == pytest.approx(0.25)
+    assert bucket.capacity == 1
+    assert len(robots_requests(robots_server)) == 1
+
+
+def test_host_delay_never_speeds_up():
+    fetcher = AsyncFetcher(rate_per_host=0.1, burst=2)
+
+    fetcher.set_host_delay('https://example.com/', 2)
+
+    assert fetcher.bucket_for('https://example.com/').rate == 0.1
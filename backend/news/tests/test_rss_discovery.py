@@ -0,0 +1,77 @@
+"""
+Tests for concurrent feed probing in RSSDiscoveryService
+"""
+import pytest
+
+from news.services.rss_discovery import RSSDiscoveryService
+from news.tests.test_content_processor import rss_feed
+
+FEED = rss_feed([{
+    'title': 'Clásico paisa en el Atanasio Girardot',
+    'link': 'https://example.com/deportes/clasico',
+    'description': 'Nacional y Medellín se enfrentan este domingo en el Atanasio Girardot.',
+}])
+
+RSS_HEADERS = {'Content-Type': 'application/rss+xml'}
+
+
+def homepage(head=''):
+    return (
+        f'<html><head><title>Portada | El Colombiano</title>{head}</head><body>'
+        '<nav><ul><li><a href="/deportes">Deportes</a></li><li><a href="/cultura">Cultura</a></li></ul></nav>'
+        '</body></html>'
+    ).encode()
+
+
+def paths(server):
+    return [path for _, path, _ in server.requests]
+
+
+@pytest.fixture
+def discovery(settings):
+    settings.RSS_DISCOVERY_HOST_RATE = 100.0
+    return RSSDiscoveryService()
+
+
+class TestFeedProbing:
+
+    def test_head_feed_short_circuits_probing(self, stub_server, discovery):
+        stub_server.pages['/'] = (200, {}, homepage(
+            '<link rel="alternate" type="application/rss+xml" title="Portada" href="/rss/portada.xml">'
+        ))
+        stub_server.pages['/rss/portada.xml'] = (200, RSS_HEADERS, FEED)
+        stub_server.pages['/feed/'] = (200, RSS_HEADERS, FEED)
+
+        result = discovery.discover_rss_feeds(stub_server.url('/'))
+
+        assert result['success']
+        assert result['primary_feed']['url'] == stub_server.url('/rss/portada.xml')
+        assert result['discovery_methods'] == ['html_parsing']
+        assert result['website_title'] == 'El Colombiano'
+        assert result['discovered_sections'] == ['Deportes', 'Cultura']
+        assert sorted(paths(stub_server)) == ['/', '/robots.txt', '/rss/portada.xml']
+
+    def test_candidates_are_fetched_once(self, stub_server, discovery):
+        stub_server.pages['/'] = (200, {}, homepage())
+        stub_server.pages['/feed/'] = (200, RSS_HEADERS, FEED)
+        stub_server.pages['/?feed=rss2'] = (200, RSS_HEADERS, FEED)
+        stub_server.pages['/rss.xml'] = (200, {}, b'<html>no es un feed</html>')
+
+        result = discovery.discover_rss_feeds(stub_server.url('/'))
+
+        assert [feed['url'] for feed in result['feeds']] == [
+            stub_server.url('/feed/'), stub_server.url('/?feed=rss2')
+        ]
+        assert result['primary_feed']['discovery_method'] == 'common_location'
+        assert result['discovery_methods'] == ['common_locations', 'cms_patterns']
+
+        requested = paths(stub_server)
+        assert len(requested) == len(set(requested))  # /rss.xml is both a common and a CMS path
+
+    def test_no_valid_feed(self, stub_server, discovery):
+        stub_server.pages['/'] = (200, {}, homepage())
+
+        result = discovery.discover_rss_feeds(stub_server.url('/'))
+
+        assert not result['success']
+        assert result['error'] == 'No valid RSS feeds found'
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+"""
+Benchmark for article page extraction (ManualCrawlerService._extract_article)
+
+Compares the previous extraction, which parsed every page three times
+(trafilatura.extract, trafilatura.extract_metadata and BeautifulSoup),
+against the single lxml tree now shared by trafilatura, htmldate and the
+fallback selectors. Also checks that both return the same fields.
+
+Pages are read from a directory of saved article pages (*.html, e.g.
+downloaded with `curl -o` from Colombian news sites), from a crawl response
+store (see news.services.response_store), or generated samples if neither
+is given.
+
+Run: python scripts/benchmark_html_extraction.py [--pages DIR | --store DIR] [--repeat 5]
+"""
+
+import os
+import sys
+import glob
+import timeit
+import argparse
+from datetime import datetime
+
+import django
+
+# Setup Django
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'navigate.settings')
+django.setup()
+
+import htmldate
+import trafilatura
+from bs4 import BeautifulSoup
+
+from news.services.manual_crawler import ManualCrawlerService
+from news.services.response_store import ResponseStore
+
+
+PARAGRAPHS = [
+    "El Atanasio Girardot recibirá este domingo el clásico paisa entre Atlético Nacional y "
+    "Deportivo Independiente Medellín. Las autoridades esperan más de cuarenta mil asistentes.",
+    "La Alcaldía de Medellín anunció pantallas gigantes en el Parque de los Deseos y en la "
+    "Plaza Botero para quienes no consigan boletas, con presencia de la Policía Metropolitana.",
+    "Los bares y restaurantes de El Poblado y Laureles preparan transmisiones especiales, "
+    "promociones en cerveza y reservas desde el mediodía para recibir a los aficionados.",
+    "Metro de Medellín ampliará su horario de operación hasta la medianoche y reforzará la "
+    "frecuencia en la línea A entre las estaciones Estadio y Parque Berrío.",
+]
+
+
+def sample_page(number):
+    """Article page shaped like a typical Colombian news site"""
+    navigation = ''.join(
+        f'<li><a href="/{section}">{section.title()}</a></li>'
+        for section in ('deportes', 'economia', 'cultura', 'politica', 'tecnologia')
+    )
+    related = ''.join(
+        f'<li><a href="/deportes/nota-{number}-{other}">Nota relacionada {other}</a></li>'
+        for other in range(30)
+    )
+    body = ''.join(f'<p>{PARAGRAPHS[(number + i) % len(PARAGRAPHS)]}</p>' for i in range(12))
+    return (
+        f'<html lang="es"><head><title>Clásico paisa número {number} | El Colombiano</title>'
+        f'<meta name="description" content="{PARAGRAPHS[0]}"></head><body>'
+        f'<header><nav><ul>{navigation}</ul></nav></header>'
+        f'<main><article><h1>Clásico paisa número {number}</h1>'
+        f'<span class="byline">Redacción Deportes</span>'
+        f'<time datetime="2025-10-{number % 28 + 1:02d}">{number % 28 + 1} de octubre de 2025</time>'
+        f'{body}</article><aside><ul>{related}</ul></aside></main>'
+        f'<footer><p>© El Colombiano. Todos los derechos reservados.</p></footer></body></html>'
+    ).encode()
+
+
+def legacy_extract(crawler, html):
+    """Extraction as it was before the shared tree (three full parses)"""
+    article_text = trafilatura.extract(
+        html,
+        config=crawler.trafilatura_config,
+        include_comments=False,
+        include_tables=True
+    )
+    if not article_text or len(article_text) < 200:
+        return None
+
+    metadata = trafilatura.extract_metadata(html)
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title = metadata.title if metadata and metadata.title else None
+    if not title and soup.find('title'):
+        title = soup.find('title').get_text().strip()
+
+    author = metadata.author if metadata and metadata.author else None
+    if not author:
+        for selector in ['.author', '.byline', '.writer', '.journalist',
+                         '[rel="author"]', '.post-author', '.article-author']:
+            author_element = soup.select_one(selector)
+            if author_element:
+                author = author_element.get_text().strip()
+                break
+
+    published_date = metadata.date if metadata and metadata.date else None
+    if not published_date:
+        date_result = htmldate.find_date(html, original_date=True)
+        if date_result:
+            published_date = datetime.strptime(date_result, '%Y-%m-%d')
+
+    return {'title': title, 'content': article_text, 'author': author or '', 'published_date': published_date}
+
+
+def load_pages(directory, store_directory=None):
+    """Saved pages from directory or store (falls back to generated samples)"""
+    pages = []
+    if directory:
+        for path in sorted(glob.glob(os.path.join(directory, '*.html'))):
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+    if store_directory:
+        store = ResponseStore(store_directory)
+        for url in store.urls():
+            record = store.load(url)
+            content_type = {name.lower(): value for name, value in record['headers'].items()}.get('content-type', '')
+            if 'html' in content_type:
+                pages.append(record['content'])
+    return pages or [sample_page(number) for number in range(50)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark three-parse vs single-parse article extraction')
+    parser.add_argument('--pages', help='Directory of saved article pages (*.html)')
+    parser.add_argument('--store', help='Crawl response store directory (HTML responses are used)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions')
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages, args.store)
+    crawler = ManualCrawlerService()
+    url = 'https://www.elcolombiano.com/deportes/clasico'
+
+    def single_parse(html):
+        return crawler._extract_article(url, 'deportes', html=html)
+
+    # Same fields from both paths
+    mismatches = 0
+    for html in pages:
+        old, new = legacy_extract(crawler, html), single_parse(html)
+        if old is None or new is None:
+            mismatches += (old is None) != (new is None)
+            continue
+        mismatches += any(old[field] != new[field] for field in ('title', 'content', 'author', 'published_date'))
+
+    print(f"\n=== Article extraction: {len(pages)} pages, best of {args.repeat} ===")
+
+    results = {}
+    for name, extract in [('three parses', lambda html: legacy_extract(crawler, html)),
+                          ('shared tree', single_parse)]:
+        timings = timeit.repeat(lambda: [extract(html) for html in pages], repeat=args.repeat, number=1)
+        results[name] = min(timings)
+        per_page_ms = results[name] / len(pages) * 1000
+        print(f"{name:>14}: {results[name] * 1000:8.1f} ms total, {per_page_ms:6.2f} ms/page")
+
+    print(f"Speedup: {results['three parses'] / results['shared tree']:.2f}x")
+    print(f"Pages with different results: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for the precompiled regex tables (PatternRegistry)
+
+Compares, per article, the old approach (re.search/re.findall with pattern
+strings, going through re's internal cache on every call) against the
+compiled tables used by FeatureExtractor and PreFilter, and the
+per-pattern ExtractionPattern loop against the single-pass PatternScanner.
+
+The compiled tables are expected to time the same as raw strings (about
+1.0x, within noise: re caches compiled patterns); that comparison only
+guards against regressions. The measurable gain is the PatternScanner's.
+
+Uses the latest articles in the database, or built-in samples if there
+are none.
+
+Run: python scripts/benchmark_regex_patterns.py [--articles 200] [--repeat 5]
+"""
+
+import os
+import re
+import sys
+import timeit
+import argparse
+import django
+
+# Setup Django
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'navigate.settings')
+django.setup()
+
+from news.models import NewsArticle
+from ml_engine.services.feature_extractor import FeatureExtractor
+from ml_engine.services.ml_pipeline import PreFilter
+from ml_engine.services.pattern_registry import PatternScanner
+from event_taxonomy.models import ExtractionPattern
+
+
+SAMPLE_TEXTS = [
+    "Concierto de rock en el Estadio Atanasio Girardot el sábado 15 de marzo a las 8 pm. "
+    "Se esperan más de 40.000 personas durante 3 horas de música en vivo.",
+    "Festival gastronómico del 20 al 22 de marzo en el Parque Explora: restaurantes, "
+    "cerveza artesanal, brunch y happy hour todo el día.",
+    "La Selección Colombia jugará contra Argentina en Brasil el próximo 10 de junio. "
+    "Miles de aficionados verán el partido en bares y pubs.",
+    "Accidente en la autopista deja un muerto y varios heridos; las autoridades investigan "
+    "un posible atraco. Suscríbete para leer el contenido exclusivo.",
+]
+
+
+def raw_scan(text):
+    """Pattern tables scanned with plain pattern strings (previous behaviour)"""
+    text_lower = text.lower()
+    for patterns in FeatureExtractor.EVENT_TYPE_PATTERNS.values():
+        for pattern in patterns:
+            re.findall(pattern, text_lower)
+    for pattern in FeatureExtractor.ATTENDANCE_PATTERNS:
+        re.search(pattern, text, re.IGNORECASE)
+    for pattern in FeatureExtractor.TIME_PATTERNS:
+        re.search(pattern, text_lower)
+    for pattern in FeatureExtractor.DATE_RANGE_PATTERNS + FeatureExtractor.DATE_PATTERNS:
+        re.search(pattern, text_lower, re.IGNORECASE)
+    for pattern_info in FeatureExtractor.DURATION_PATTERNS:
+        re.search(pattern_info[0], text_lower)
+    for pattern in FeatureExtractor.COLOMBIAN_INVOLVEMENT_PATTERNS:
+        re.search(pattern, text_lower)
+    for pattern in FeatureExtractor.COUNTRY_PATTERNS:
+        re.search(pattern, text_lower)
+    for patterns in (PreFilter.PAYWALL_PATTERNS, PreFilter.HOSPITALITY_KEYWORDS,
+                     PreFilter.NEGATIVE_KEYWORDS):
+        for pattern in patterns:
+            re.search(pattern, text_lower)
+
+
+def compiled_scan(text):
+    """Same scans through the precompiled tables"""
+    text_lower = text.lower()
+    for table in FeatureExtractor.EVENT_TYPE_TABLES.values():
+        table.count_all(text_lower)
+    for pattern in FeatureExtractor.ATTENDANCE_TABLE:
+        pattern.search(text)
+    for table in (FeatureExtractor.TIME_TABLE, FeatureExtractor.DATE_RANGE_TABLE,
+                  FeatureExtractor.DATE_TABLE, FeatureExtractor.DURATION_TABLE,
+                  FeatureExtractor.COLOMBIAN_INVOLVEMENT_TABLE, FeatureExtractor.COUNTRY_TABLE,
+                  PreFilter.PAYWALL_TABLE, PreFilter.HOSPITALITY_TABLE, PreFilter.NEGATIVE_TABLE):
+        for pattern in table:
+            pattern.search(text_lower)
+
+
+def load_extraction_patterns():
+    """Active ExtractionPattern regexes (falls back to the hardcoded tables)"""
+    try:
+        patterns = list(
+            ExtractionPattern.objects.filter(is_active=True).values_list('pattern', flat=True)
+        )
+    except Exception:
+        patterns = []
+    return patterns or [
+        pattern
+        for patterns in FeatureExtractor.EVENT_TYPE_PATTERNS.values()
+        for pattern in patterns
+    ]
+
+
+def time_scans(scans, texts, repeat):
+    """Print best-of timings for each (name, scan) and the speedup of the last one"""
+    results = {}
+    for name, scan in scans:
+        timings = timeit.repeat(
+            lambda: [scan(text) for text in texts],
+            repeat=repeat,
+            number=1
+        )
+        results[name] = min(timings)
+        per_article_us = results[name] / len(texts) * 1e6
+        print(f"{name:>16}: {results[name] * 1000:8.2f} ms total, {per_article_us:8.1f} µs/article")
+
+    (baseline, _), (optimized, _) = scans[0], scans[-1]
+    print(f"Speedup: {results[baseline] / results[optimized]:.2f}x")
+
+
+def load_texts(limit):
+    """Latest article texts from the database (falls back to samples)"""
+    texts = [
+        f"{title} {content}"
+        for title, content in NewsArticle.objects.order_by('-created_at')
+            .values_list('title', 'content')[:limit]
+    ]
+    return texts or SAMPLE_TEXTS
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark raw vs precompiled regex tables')
+    parser.add_argument('--articles', type=int, default=200, help='Articles to scan')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions')
+    args = parser.parse_args()
+
+    try:
+        texts = load_texts(args.articles)
+    except Exception as e:
+        print(f"Could not load articles ({e}), using samples")
+        texts = SAMPLE_TEXTS
+
+    print(f"\n=== Regex benchmark: {len(texts)} articles, best of {args.repeat} (expected ~1.0x) ===")
+
+    time_scans([('raw strings', raw_scan), ('compiled tables', compiled_scan)], texts, args.repeat)
+
+    patterns = load_extraction_patterns()
+    compiled = [re.compile(pattern) for pattern in patterns]
+    scanner = PatternScanner((pattern, pattern) for pattern in patterns)
+
+    def pattern_loop(text):
+        text_lower = text.lower()
+        return [len(pattern.findall(text_lower)) for pattern in compiled]
+
+    print(f"\n=== Event type patterns: {len(patterns)} patterns ===")
+    time_scans([
+        ('findall loop', pattern_loop),
+        ('scanner', lambda text: scanner.scan(text.lower())),
+    ], texts, args.repeat)
+
+
+if __name__ == '__main__':
+    main()